@@ -11,7 +11,7 @@ from observability import HybridMetrics, get_metrics, initialize_metrics
 
 from .auth import RateLimiter, create_auth_provider
 from .cache import CacheEntry, IntelligentCache
-from .clients import BMCAMIDevXClient
+from .clients import AssignmentCreateRequest, BMCAMIDevXClient, ReleaseCreateRequest
 from .errors import (
     BMCAPIAuthenticationError,
     BMCAPIError,
@@ -24,17 +24,21 @@ from .errors import (
     MCPValidationError,
 )
 from .health import HealthChecker
-from .settings import Settings
+from .settings import Settings, get_settings
 
 __version__ = "2.2.0"
 __all__ = [
     # Core components
     "Settings",
+    "get_settings",
     "BMCAMIDevXClient",
     "IntelligentCache",
     "CacheEntry",
     "HealthChecker",
     "RateLimiter",
+    # Request models
+    "AssignmentCreateRequest",
+    "ReleaseCreateRequest",
     # Error handling
     "BMCAPIError",
     "BMCAPITimeoutError",
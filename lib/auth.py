@@ -6,20 +6,28 @@ Provides authentication provider creation and rate limiting functionality
 for the BMC AMI DevX MCP Server.
 """
 
+import asyncio
+import logging
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
 
 from fastmcp.server.auth.providers.github import GitHubProvider
 from fastmcp.server.auth.providers.google import GoogleProvider
 from fastmcp.server.auth.providers.jwt import JWTVerifier
 from fastmcp.server.auth.providers.workos import WorkOSProvider
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimiter:
     """
     Token bucket rate limiter for API requests.
 
     Implements a token bucket algorithm with configurable rate and burst capacity.
+    Refill uses the monotonic clock and runs without a lock: the event loop is
+    single-threaded and refill/consume never await in between.
     """
 
     def __init__(self, requests_per_minute: int = 60, burst_size: int = 10):
@@ -33,7 +41,10 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
         self.tokens = float(burst_size)  # Start with full bucket
-        self.last_refill = datetime.now()
+        # Monotonic refill timestamp, anchored to wall-clock time for reporting
+        self._clock_anchor = time.monotonic()
+        self._wall_anchor = datetime.now()
+        self._last_refill_ts = self._clock_anchor
         self.total_requests = 0
         self.rejected_requests = 0
 
@@ -54,16 +65,43 @@ class RateLimiter:
             self.rejected_requests += 1
             return False
 
+    async def wait_for_token(self) -> None:
+        """Wait until a token is available and consume it."""
+        self.total_requests += 1
+        self._refill_tokens()
+
+        while self.tokens < 1:
+            # Sleep exactly long enough for the missing fraction of a token
+            rate = self.requests_per_minute / 60.0
+            await asyncio.sleep((1 - self.tokens) / rate)
+            self._refill_tokens()
+
+        self.tokens -= 1
+
+    @property
+    def last_refill(self) -> datetime:
+        """Wall-clock time of the last refill."""
+        return self._wall_anchor + timedelta(
+            seconds=self._last_refill_ts - self._clock_anchor
+        )
+
+    @last_refill.setter
+    def last_refill(self, value: datetime):
+        """Set the last refill time from a wall-clock datetime."""
+        self._last_refill_ts = (
+            self._clock_anchor + (value - self._wall_anchor).total_seconds()
+        )
+
     def _refill_tokens(self):
         """Refill tokens based on elapsed time since last refill."""
-        now = datetime.now()
-        time_elapsed = (now - self.last_refill).total_seconds()
+        now = time.monotonic()
+        time_elapsed = now - self._last_refill_ts
 
         if time_elapsed > 0:
             # Calculate tokens to add based on rate
             tokens_to_add = (self.requests_per_minute / 60.0) * time_elapsed
             self.tokens = min(self.burst_size, self.tokens + tokens_to_add)
-            self.last_refill = now
+            self._last_refill_ts = now
 
     def get_stats(self) -> dict:
         """Get rate limiter statistics."""
@@ -116,6 +154,65 @@ class RateLimiter:
         return 60.0 / self.requests_per_minute
 
 
+def _build_jwt_provider():
+    """Build a JWT verifier from environment configuration."""
+    jwks_uri = os.getenv("FASTMCP_AUTH_JWKS_URI")
+    issuer = os.getenv("FASTMCP_AUTH_ISSUER")
+    audience = os.getenv("FASTMCP_AUTH_AUDIENCE")
+
+    if not all([jwks_uri, issuer, audience]):
+        raise ValueError("JWT auth requires JWKS_URI, ISSUER, and AUDIENCE")
+
+    return JWTVerifier(jwks_uri=jwks_uri, issuer=issuer, audience=audience)
+
+
+def _build_github_provider():
+    """Build a GitHub OAuth provider from environment configuration."""
+    client_id = os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_ID")
+    client_secret = os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_SECRET")
+
+    if not all([client_id, client_secret]):
+        raise ValueError("GitHub auth requires CLIENT_ID and CLIENT_SECRET")
+
+    return GitHubProvider(client_id=client_id, client_secret=client_secret)
+
+
+def _build_google_provider():
+    """Build a Google OAuth provider from environment configuration."""
+    client_id = os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID")
+    client_secret = os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET")
+
+    if not all([client_id, client_secret]):
+        raise ValueError("Google auth requires CLIENT_ID and CLIENT_SECRET")
+
+    return GoogleProvider(client_id=client_id, client_secret=client_secret)
+
+
+def _build_workos_provider():
+    """Build a WorkOS AuthKit provider from environment configuration."""
+    client_id = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_CLIENT_ID")
+    client_secret = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_CLIENT_SECRET")
+    authkit_domain = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_DOMAIN")
+
+    if not all([client_id, client_secret, authkit_domain]):
+        raise ValueError(
+            "WorkOS auth requires CLIENT_ID, CLIENT_SECRET, and AUTHKIT_DOMAIN"
+        )
+
+    return WorkOSProvider(
+        client_id=client_id, client_secret=client_secret, domain=authkit_domain
+    )
+
+
+# Provider name (AUTH_PROVIDER, lower-cased) -> builder
+_AUTH_BUILDERS: Dict[str, Callable[[], Any]] = {
+    "jwt": _build_jwt_provider,
+    "github": _build_github_provider,
+    "google": _build_google_provider,
+    "workos": _build_workos_provider,
+}
+
+
 def create_auth_provider():
     """
     Create authentication provider based on environment configuration.
@@ -133,54 +230,15 @@ def create_auth_provider():
         return None
 
     try:
-        if auth_provider == "jwt":
-            jwks_uri = os.getenv("FASTMCP_AUTH_JWKS_URI")
-            issuer = os.getenv("FASTMCP_AUTH_ISSUER")
-            audience = os.getenv("FASTMCP_AUTH_AUDIENCE")
-
-            if not all([jwks_uri, issuer, audience]):
-                raise ValueError("JWT auth requires JWKS_URI, ISSUER, and AUDIENCE")
-
-            return JWTVerifier(jwks_uri=jwks_uri, issuer=issuer, audience=audience)
-
-        elif auth_provider == "github":
-            client_id = os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_ID")
-            client_secret = os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_SECRET")
-
-            if not all([client_id, client_secret]):
-                raise ValueError("GitHub auth requires CLIENT_ID and CLIENT_SECRET")
-
-            return GitHubProvider(client_id=client_id, client_secret=client_secret)
-
-        elif auth_provider == "google":
-            client_id = os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID")
-            client_secret = os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET")
-
-            if not all([client_id, client_secret]):
-                raise ValueError("Google auth requires CLIENT_ID and CLIENT_SECRET")
-
-            return GoogleProvider(client_id=client_id, client_secret=client_secret)
-
-        elif auth_provider == "workos":
-            client_id = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_CLIENT_ID")
-            client_secret = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_CLIENT_SECRET")
-            authkit_domain = os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_DOMAIN")
-
-            if not all([client_id, client_secret, authkit_domain]):
-                raise ValueError(
-                    "WorkOS auth requires CLIENT_ID, CLIENT_SECRET, and AUTHKIT_DOMAIN"
-                )
-
-            return WorkOSProvider(
-                client_id=client_id, client_secret=client_secret, domain=authkit_domain
-            )
-
-        else:
+        builder = _AUTH_BUILDERS.get(auth_provider)
+        if builder is None:
             raise ValueError(f"Unsupported auth provider: {auth_provider}")
 
+        return builder()
+
     except ImportError as e:
-        print(f"Warning: Auth provider {auth_provider} not available: {e}")
+        logger.warning(f"Auth provider {auth_provider} not available: {e}")
         return None
     except Exception as e:
-        print(f"Error creating auth provider {auth_provider}: {e}")
+        logger.error(f"Error creating auth provider {auth_provider}: {e}")
         return None
@@ -6,15 +6,24 @@ Provides advanced caching capabilities with LRU eviction, TTL expiration,
 statistics tracking, and async-safe operations.
 """
 
+from __future__ import annotations
+
 import asyncio
 import hashlib
+import heapq
+import sys
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CacheEntry:
     """Cache entry with value, expiration time, and metadata."""
 
@@ -23,12 +32,17 @@ class CacheEntry:
     created_at: datetime
     access_count: int = 0
     last_accessed: Optional[datetime] = None
+    stale_until: Optional[datetime] = None
 
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
         return datetime.now() > self.expires_at
 
-    def touch(self):
+    def is_stale_expired(self) -> bool:
+        """Check if the entry is past its stale-while-revalidate window."""
+        return datetime.now() > (self.stale_until or self.expires_at)
+
+    def touch(self) -> None:
         """Update access statistics."""
         self.access_count += 1
         self.last_accessed = datetime.now()
@@ -48,7 +62,7 @@ class IntelligentCache:
     - TTL (Time To Live) expiration
     - Access statistics and hit rate tracking
     - Async-safe operations with locking
-    - Automatic cleanup of expired entries
+    - Automatic cleanup of expired entries, scheduled from an expiry heap
     - Memory usage estimation
     """
 
@@ -62,8 +76,11 @@ class IntelligentCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: OrderedDict = OrderedDict()
+        # Single OrderedDict holds entries in LRU order (oldest first)
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Min-heap of (removal deadline, key); may hold outdated deadlines for
+        # keys that were overwritten or deleted, which expire_due() skips
+        self._expiry: List[Tuple[datetime, str]] = []
         self.lock = asyncio.Lock()
 
         # Statistics
@@ -73,7 +90,12 @@ class IntelligentCache:
         self.expirations = 0
         self.created_at = datetime.now()
 
-    def generate_key(self, operation: str, **kwargs) -> str:
+    @property
+    def access_order(self) -> "OrderedDict[str, CacheEntry]":
+        """LRU ordering of cache keys (backward compatible view of the cache)."""
+        return self.cache
+
+    def generate_key(self, operation: str, **kwargs: Any) -> str:
         """Generate a consistent cache key from operation and parameters."""
         # Sort kwargs for consistent key generation
         sorted_params = sorted(kwargs.items())
@@ -85,11 +107,13 @@ class IntelligentCache:
 
         return key_data
 
-    def _generate_key(self, operation: str, **kwargs) -> str:
+    def _generate_key(self, operation: str, **kwargs: Any) -> str:
         """Private method for generating cache keys (for backward compatibility)."""
         return self.generate_key(operation, **kwargs)
 
-    async def get(self, operation: str, direct_key: bool = False, **kwargs) -> Optional[Any]:
+    async def get(
+        self, operation: str, direct_key: bool = False, **kwargs: Any
+    ) -> Optional[Any]:
         """
         Retrieve a value from the cache.
 
@@ -111,24 +135,55 @@ class IntelligentCache:
                 return None
 
             if entry.is_expired():
-                # Remove expired entry
-                del self.cache[key]
-                if key in self.access_order:
-                    del self.access_order[key]
-                self.expirations += 1
+                # Keep entries still inside their stale window for get_stale()
+                if entry.is_stale_expired():
+                    del self.cache[key]
+                    self.expirations += 1
                 self.misses += 1
                 return None
 
             # Update access statistics and LRU order
             entry.touch()
-            self.access_order.move_to_end(key)
+            self.cache.move_to_end(key)
             self.hits += 1
 
             return entry.value
 
+    async def get_stale(
+        self, operation: str, direct_key: bool = False, **kwargs: Any
+    ) -> Optional[Any]:
+        """
+        Retrieve an expired value that is still inside its stale window.
+
+        Args:
+            operation: The operation name or direct key if direct_key=True
+            direct_key: If True, use operation as direct key instead of generating one
+            **kwargs: Parameters to generate cache key (ignored if direct_key=True)
+
+        Returns:
+            Stale cached value if available, None otherwise
+        """
+        key = operation if direct_key else self.generate_key(operation, **kwargs)
+
+        async with self.lock:
+            entry = self.cache.get(key)
+
+            if entry is None or entry.is_stale_expired():
+                return None
+
+            entry.touch()
+            self.cache.move_to_end(key)
+            return entry.value
+
     async def set(
-        self, operation: str, value: Any, ttl: Optional[int] = None, direct_key: bool = False, **kwargs
-    ):
+        self,
+        operation: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        direct_key: bool = False,
+        stale_ttl: int = 0,
+        **kwargs: Any,
+    ) -> None:
         """
         Store a value in the cache.
 
@@ -137,6 +192,7 @@ class IntelligentCache:
             value: The value to cache
             ttl: Time-to-live in seconds (uses default if None)
             direct_key: If True, use operation as direct key instead of generating one
+            stale_ttl: Seconds after expiry the value may still be served stale
             **kwargs: Parameters to generate cache key (ignored if direct_key=True)
         """
         key = operation if direct_key else self.generate_key(operation, **kwargs)
@@ -144,10 +200,7 @@ class IntelligentCache:
 
         async with self.lock:
             # Remove existing entry if present
-            if key in self.cache:
-                del self.cache[key]
-                if key in self.access_order:
-                    del self.access_order[key]
+            self.cache.pop(key, None)
 
             # Evict if at capacity
             if len(self.cache) >= self.max_size:
@@ -158,23 +211,28 @@ class IntelligentCache:
             entry = CacheEntry(
                 value=value, expires_at=expires_at, created_at=datetime.now()
             )
+            if stale_ttl > 0:
+                entry.stale_until = expires_at + timedelta(seconds=stale_ttl)
 
             self.cache[key] = entry
-            self.access_order[key] = True
+            heapq.heappush(self._expiry, (entry.stale_until or expires_at, key))
+            # Overwrites leave outdated records behind; compact them here too so
+            # the schedule stays bounded even when no expiry loop is running
+            if len(self._expiry) > 2 * len(self.cache) + 64:
+                self._rebuild_expiry()
 
-    async def _evict_lru(self):
+    async def _evict_lru(self) -> None:
         """Evict the least recently used entry."""
-        if not self.access_order:
+        if not self.cache:
             return
 
-        # Get the least recently used key (first in OrderedDict)
-        lru_key = next(iter(self.access_order))
-
-        del self.cache[lru_key]
-        del self.access_order[lru_key]
+        # Least recently used entry is first in the OrderedDict
+        self.cache.popitem(last=False)
         self.evictions += 1
 
-    async def delete(self, operation: str, direct_key: bool = False, **kwargs) -> bool:
+    async def delete(
+        self, operation: str, direct_key: bool = False, **kwargs: Any
+    ) -> bool:
         """
         Delete a specific cache entry.
 
@@ -189,40 +247,82 @@ class IntelligentCache:
         key = operation if direct_key else self.generate_key(operation, **kwargs)
 
         async with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                if key in self.access_order:
-                    del self.access_order[key]
-                return True
-            return False
+            return self.cache.pop(key, None) is not None
 
-    async def clear(self):
+    async def clear(self) -> None:
         """Clear all cache entries."""
         async with self.lock:
             self.cache.clear()
-            self.access_order.clear()
+            self._expiry.clear()
             # Reset statistics except creation time
             self.hits = 0
             self.misses = 0
             self.evictions = 0
             self.expirations = 0
 
-    def cleanup_expired(self):
+    def cleanup_expired(self) -> None:
         """Remove expired entries (synchronous for background tasks)."""
         current_time = datetime.now()
         expired_keys = []
 
         for key, entry in self.cache.items():
-            if current_time > entry.expires_at:
+            if current_time > (entry.stale_until or entry.expires_at):
                 expired_keys.append(key)
 
         for key in expired_keys:
             del self.cache[key]
-            if key in self.access_order:
-                del self.access_order[key]
             self.expirations += 1
 
-    async def exists(self, operation: str, direct_key: bool = False, **kwargs) -> bool:
+        # A full sweep leaves only live entries, so rebuild the schedule too
+        self._rebuild_expiry()
+
+    def _rebuild_expiry(self) -> None:
+        """Rebuild the expiry schedule from the live entries only."""
+        self._expiry = [
+            (entry.stale_until or entry.expires_at, key)
+            for key, entry in self.cache.items()
+        ]
+        heapq.heapify(self._expiry)
+
+    def expire_due(self) -> None:
+        """Remove entries whose scheduled deadline has passed, without a full scan."""
+        current_time = datetime.now()
+
+        while self._expiry and self._expiry[0][0] <= current_time:
+            _, key = heapq.heappop(self._expiry)
+            entry = self.cache.get(key)
+            # Skip keys that were removed or re-set with a later deadline
+            if entry is not None and entry.is_stale_expired():
+                del self.cache[key]
+                self.expirations += 1
+
+        # Drop outdated schedule records once they outnumber live entries
+        if len(self._expiry) > 2 * len(self.cache) + 64:
+            self.cleanup_expired()
+
+    def seconds_until_next_expiry(self) -> Optional[float]:
+        """Seconds until the earliest scheduled expiry, or None if none is pending."""
+        if not self._expiry:
+            return None
+        return max(0.0, (self._expiry[0][0] - datetime.now()).total_seconds())
+
+    async def run_expiry_loop(self, max_interval: float = 60.0) -> None:
+        """
+        Expire entries as their deadlines pass until cancelled.
+
+        Args:
+            max_interval: Longest sleep between checks when nothing is scheduled
+        """
+        while True:
+            delay = self.seconds_until_next_expiry()
+            if delay is None or delay > max_interval:
+                delay = max_interval
+            await asyncio.sleep(delay)
+            self.expire_due()
+
+    async def exists(
+        self, operation: str, direct_key: bool = False, **kwargs: Any
+    ) -> bool:
         """
         Check if a key exists in the cache (without affecting access stats).
         
@@ -242,11 +342,10 @@ class IntelligentCache:
             
             entry = self.cache[key]
             if entry.is_expired():
-                # Remove expired entry
-                del self.cache[key]
-                if key in self.access_order:
-                    del self.access_order[key]
-                self.expirations += 1
+                # Keep entries still inside their stale window for get_stale()
+                if entry.is_stale_expired():
+                    del self.cache[key]
+                    self.expirations += 1
                 return False
             
             return True
@@ -6,13 +6,16 @@ Provides multiple cache backend implementations including in-memory,
 Redis, and multi-tier caching strategies.
 """
 
+from __future__ import annotations
+
 import asyncio
-import json
 import pickle
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Optional
+
+import orjson
 
 try:
     import redis.asyncio as redis
@@ -122,7 +125,8 @@ class RedisBackend(CacheBackend):
     def _serialize(self, value: Any) -> bytes:
         """Serialize value for storage."""
         if self.serializer == "json":
-            return json.dumps(value).encode('utf-8')
+            # Non-string keys are stringified, as json.dumps did
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
         elif self.serializer == "pickle":
             return pickle.dumps(value)
         else:
@@ -131,7 +135,7 @@ class RedisBackend(CacheBackend):
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize value from storage."""
         if self.serializer == "json":
-            return json.loads(data.decode('utf-8'))
+            return orjson.loads(data)
         elif self.serializer == "pickle":
             return pickle.loads(data)
         else:
@@ -6,10 +6,25 @@ Provides comprehensive BMC AMI DevX API client with caching, metrics,
 error handling, and retry logic for all ISPW operations.
 """
 
+import asyncio
 import time
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 from .cache import IntelligentCache
 from .errors import (
@@ -20,6 +35,74 @@ from .errors import (
     retry_on_failure,
 )
 
+# ISPW endpoint templates, keyed by resource kind; filled with (srid[, item_id])
+_URLS: Dict[str, str] = {
+    "assignments": "/ispw/%s/assignments",
+    "assignment": "/ispw/%s/assignments/%s",
+    "assignment_tasks": "/ispw/%s/assignments/%s/tasks",
+    "assignment_generate": "/ispw/%s/assignments/%s/tasks/generate",
+    "assignment_promote": "/ispw/%s/assignments/%s/tasks/promote",
+    "releases": "/ispw/%s/releases",
+    "release": "/ispw/%s/releases/%s",
+    "release_deploy": "/ispw/%s/releases/%s/tasks/deploy",
+    "sets": "/ispw/%s/sets",
+    "set": "/ispw/%s/sets/%s",
+    "set_deploy": "/ispw/%s/sets/%s/tasks/deploy",
+    "packages": "/ispw/%s/packages",
+    "package": "/ispw/%s/packages/%s",
+}
+
+
+@lru_cache(maxsize=1024)
+def _url(kind: str, srid: str, item_id: Optional[str] = None) -> str:
+    """Build an ISPW endpoint path; repeated lookups are memoized."""
+    if item_id is None:
+        return _URLS[kind] % (srid,)
+    return _URLS[kind] % (srid, item_id)
+
+
+class AssignmentCreateRequest(BaseModel):
+    """Validated body of a create-assignment request."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    assignment_id: str = Field(alias="assignmentId", min_length=1)
+    stream: str = Field(min_length=1)
+    application: str = Field(min_length=1)
+    description: Optional[str] = None
+    default_path: Optional[str] = Field(default=None, alias="defaultPath")
+
+
+class ReleaseCreateRequest(BaseModel):
+    """Validated body of a create-release request."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    release_id: str = Field(alias="releaseId", min_length=1)
+    stream: str = Field(min_length=1)
+    application: str = Field(min_length=1)
+    description: Optional[str] = None
+
+
+def _with_query(endpoint: str, filters: Dict[str, Any]) -> str:
+    """Append filters as an encoded query string; unfiltered calls skip the work."""
+    if not filters:
+        return endpoint
+    return f"{endpoint}?{urlencode(filters)}"
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body straight from its bytes with orjson."""
+    return orjson.loads(response.content)
+
+
+def _read_json(response: httpx.Response) -> Any:
+    """Raise for error statuses, then decode the JSON body."""
+    # Only error statuses need httpx's exception construction
+    if response.status_code >= 400:
+        response.raise_for_status()
+    return _decode_json(response)
+
 
 class BMCAMIDevXClient:
     """
@@ -36,6 +119,8 @@ class BMCAMIDevXClient:
         cache: Optional[IntelligentCache] = None,
         metrics: Optional[Any] = None,
         error_handler: Optional[ErrorHandler] = None,
+        max_concurrency: int = 20,
+        hedge_after: Optional[float] = None,
     ):
         """
         Initialize the BMC API client.
@@ -45,11 +130,33 @@ class BMCAMIDevXClient:
             cache: Optional cache instance for response caching
             metrics: Optional metrics collector
             error_handler: Optional error handler for retry logic
+            max_concurrency: Maximum concurrent requests issued by bulk operations
+            hedge_after: Seconds before a slow GET gets a backup request, or None
+                to disable hedging
         """
         self.http_client = http_client
         self.cache = cache
         self.metrics = metrics
         self.error_handler = error_handler
+        self.max_concurrency = max(1, max_concurrency)
+        self.hedge_after = hedge_after
+        # Background stale-while-revalidate refreshes, keyed by cache params
+        self._revalidations: Dict[Tuple, asyncio.Task] = {}
+        # Cache misses currently being fetched, shared by identical callers
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Cached reads per SRID, so writes can drop the entries they make stale
+        self._cached_by_srid: Dict[str, Set[Tuple[str, Tuple]]] = {}
+        self._indexed_reads = 0
+        # Past this many indexed reads, entries the cache has since expired or
+        # evicted are pruned from the index
+        self._index_limit = 2 * getattr(cache, "max_size", 1000)
+        # Fetches started before a write to their SRID; their results are
+        # returned to waiting callers but never cached
+        self._superseded: Set[asyncio.Future] = set()
+
+        # Without a cache, bind the passthrough so reads skip the cache checks
+        if cache is None:
+            self.get_cached_or_fetch = self._fetch_uncached
 
     async def make_request(
         self,
@@ -86,20 +193,8 @@ class BMCAMIDevXClient:
                         self.metrics.record_cache_operation("get", True, cache_key)
                     return cached_response
 
-            # Make the HTTP request
-            if method == "GET":
-                response = await self.http_client.get(endpoint)
-            elif method == "POST":
-                response = await self.http_client.post(endpoint, json=data)
-            elif method == "PUT":
-                response = await self.http_client.put(endpoint, json=data)
-            elif method == "DELETE":
-                response = await self.http_client.delete(endpoint)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            result = response.json()
+            response = await self._send(method, endpoint, data)
+            result = _read_json(response)
 
             # Cache successful GET responses
             if method == "GET" and cache_key and self.cache:
@@ -187,23 +282,57 @@ class BMCAMIDevXClient:
 
             raise error
 
-    async def _make_raw_request(
+    async def _send(
         self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
-    ):
-        """Raw HTTP request without caching or metrics (for error handler)."""
+    ) -> httpx.Response:
+        """Dispatch a request to the HTTP client method for its verb."""
         if method == "GET":
-            response = await self.http_client.get(endpoint)
+            if self.hedge_after is not None:
+                return await self._hedged_get(endpoint)
+            return await self.http_client.get(endpoint)
         elif method == "POST":
-            response = await self.http_client.post(endpoint, json=data)
+            return await self.http_client.post(endpoint, json=data)
         elif method == "PUT":
-            response = await self.http_client.put(endpoint, json=data)
+            return await self.http_client.put(endpoint, json=data)
         elif method == "DELETE":
-            response = await self.http_client.delete(endpoint)
+            return await self.http_client.delete(endpoint)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
-        response.raise_for_status()
-        return response.json()
+    async def _hedged_get(self, endpoint: str) -> httpx.Response:
+        """
+        GET an endpoint, sending a second request if the first is slow.
+
+        Whichever request succeeds first wins and the other is cancelled, which
+        trims tail latency at the cost of up to twice the load on slow reads.
+        """
+        first = asyncio.ensure_future(self.http_client.get(endpoint))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_after)
+            if not done:
+                pending.add(asyncio.ensure_future(self.http_client.get(endpoint)))
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+            # A failed winner should not hide a request that may still succeed
+            while pending and all(task.exception() for task in done):
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+            winner = next((task for task in done if not task.exception()), None)
+            return (winner or done.pop()).result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _make_raw_request(
+        self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ):
+        """Raw HTTP request without caching or metrics (for error handler)."""
+        return _read_json(await self._send(method, endpoint, data))
 
     async def get_cached_or_fetch(
         self,
@@ -211,6 +340,7 @@ class BMCAMIDevXClient:
         endpoint: str,
         cache_params: Optional[Dict[str, Any]] = None,
         ttl: int = 300,
+        stale_ttl: int = 0,
     ) -> Dict[str, Any]:
         """
         Get data from cache or fetch from API.
@@ -220,13 +350,12 @@ class BMCAMIDevXClient:
             endpoint: API endpoint
             cache_params: Parameters for cache key generation
             ttl: Cache TTL in seconds
+            stale_ttl: Seconds after expiry a cached value is served while it
+                is refreshed in the background (0 disables stale-while-revalidate)
 
         Returns:
             Response data from cache or API
         """
-        if self.cache is None:
-            return await self.make_request("GET", endpoint)
-
         cache_params = cache_params or {}
         cached_data = await self.cache.get(operation, **cache_params)
 
@@ -235,7 +364,53 @@ class BMCAMIDevXClient:
                 self.metrics.record_cache_operation("get", True, operation)
             return cached_data
 
-        # Cache miss - fetch from API
+        if stale_ttl > 0:
+            stale_data = await self.cache.get_stale(operation, **cache_params)
+            if stale_data is not None:
+                self._schedule_revalidation(
+                    operation, endpoint, cache_params, ttl, stale_ttl
+                )
+                if self.metrics and hasattr(self.metrics, "record_cache_operation"):
+                    self.metrics.record_cache_operation(
+                        "get", True, f"{operation}_stale"
+                    )
+                return stale_data
+
+        # Cache miss - coalesce identical concurrent fetches into one request
+        key = (operation, *sorted(cache_params.items()))
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_and_store(operation, endpoint, cache_params, ttl, stale_ttl)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(
+                lambda done: self._forget(self._inflight, key, done)
+            )
+
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(inflight)
+
+    async def _fetch_uncached(
+        self,
+        operation: str,
+        endpoint: str,
+        cache_params: Optional[Dict[str, Any]] = None,
+        ttl: int = 300,
+        stale_ttl: int = 0,
+    ) -> Dict[str, Any]:
+        """get_cached_or_fetch replacement used when no cache is configured."""
+        return await self.make_request("GET", endpoint)
+
+    async def _fetch_and_store(
+        self,
+        operation: str,
+        endpoint: str,
+        cache_params: Dict[str, Any],
+        ttl: int,
+        stale_ttl: int,
+    ) -> Dict[str, Any]:
+        """Fetch a cache miss from the API and cache successful responses."""
         data = await self.make_request("GET", endpoint)
 
         # Check if the response is an error response (from error handler)
@@ -252,13 +427,166 @@ class BMCAMIDevXClient:
             return data
 
         # Success - cache the response
-        await self.cache.set(operation, data, ttl=ttl, **cache_params)
+        await self._store(operation, data, ttl, stale_ttl, cache_params)
 
         if self.metrics and hasattr(self.metrics, "record_cache_operation"):
             self.metrics.record_cache_operation("get", False, operation)
 
         return data
 
+    async def _store(
+        self,
+        operation: str,
+        data: Dict[str, Any],
+        ttl: int,
+        stale_ttl: int,
+        cache_params: Dict[str, Any],
+    ):
+        """Cache a response, keeping it servable stale when stale_ttl is set."""
+        if asyncio.current_task() in self._superseded:
+            # A write invalidated this SRID while the fetch was running
+            return
+
+        srid = cache_params.get("srid")
+        if srid is not None:
+            reads = self._cached_by_srid.setdefault(srid, set())
+            entry = (operation, tuple(sorted(cache_params.items())))
+            if entry not in reads:
+                reads.add(entry)
+                self._indexed_reads += 1
+                if self._indexed_reads > self._index_limit:
+                    self._prune_srid_index()
+
+        if stale_ttl > 0:
+            await self.cache.set(
+                operation, data, ttl=ttl, stale_ttl=stale_ttl, **cache_params
+            )
+        else:
+            await self.cache.set(operation, data, ttl=ttl, **cache_params)
+
+    async def invalidate(self, srid: str) -> int:
+        """
+        Drop cached reads for an SRID after a write changes its data.
+
+        Args:
+            srid: System Reference ID whose cached responses are now stale
+
+        Returns:
+            Number of cache entries removed
+        """
+        # Fetches already running for this SRID would store pre-write data
+        for pending in (self._inflight, self._revalidations):
+            for key, task in list(pending.items()):
+                if ("srid", srid) in key[1:]:
+                    del pending[key]
+                    self._superseded.add(task)
+                    task.add_done_callback(self._superseded.discard)
+
+        reads = self._cached_by_srid.pop(srid, ())
+        self._indexed_reads -= len(reads)
+        removed = 0
+        for operation, params in reads:
+            if await self.cache.delete(operation, **dict(params)):
+                removed += 1
+        return removed
+
+    def _prune_srid_index(self):
+        """Drop indexed reads whose cache entries have expired or been evicted."""
+        for srid, reads in list(self._cached_by_srid.items()):
+            live = {
+                (operation, params)
+                for operation, params in reads
+                if self.cache.generate_key(operation, **dict(params)) in self.cache
+            }
+            if live:
+                self._cached_by_srid[srid] = live
+            else:
+                del self._cached_by_srid[srid]
+        self._indexed_reads = sum(map(len, self._cached_by_srid.values()))
+
+    @staticmethod
+    def _forget(pending: Dict[Tuple, asyncio.Future], key: Tuple, task):
+        """Remove a finished task from pending unless a newer one replaced it."""
+        if pending.get(key) is task:
+            del pending[key]
+
+    async def _post_and_invalidate(
+        self, srid: str, endpoint: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """POST a write for an SRID, then invalidate its cached reads."""
+        result = await self.make_request("POST", endpoint, data)
+        if self.cache:
+            await self.invalidate(srid)
+        return result
+
+    def _schedule_revalidation(
+        self,
+        operation: str,
+        endpoint: str,
+        cache_params: Dict[str, Any],
+        ttl: int,
+        stale_ttl: int,
+    ):
+        """Refresh a stale entry in the background, at most once per key."""
+        key = (operation, *sorted(cache_params.items()))
+        if key in self._revalidations:
+            return
+
+        async def revalidate():
+            try:
+                data = await self.make_request("GET", endpoint)
+                if not (isinstance(data, dict) and data.get("error") is True):
+                    await self._store(operation, data, ttl, stale_ttl, cache_params)
+            except Exception:
+                # Keep serving the stale value; the next read retries
+                pass
+            finally:
+                self._forget(self._revalidations, key, asyncio.current_task())
+
+        self._revalidations[key] = asyncio.create_task(revalidate())
+
+    async def _fetch_bulk(
+        self,
+        operation: str,
+        fetch: Callable[..., Awaitable[Dict[str, Any]]],
+        items: Sequence[Tuple[str, str]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Run fetch concurrently for each item, bounded by max_concurrency.
+
+        Args:
+            operation: Operation name used in error responses
+            fetch: Coroutine function called as fetch(*item)
+            items: Argument tuples, one per request
+
+        Returns:
+            Results in the same order as items; failed fetches are replaced
+            with structured error responses
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(item: Tuple[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch(*item)
+
+        results = await asyncio.gather(
+            *(fetch_one(item) for item in items), return_exceptions=True
+        )
+
+        responses = []
+        for result in results:
+            if isinstance(result, Exception):
+                if self.error_handler:
+                    result = self.error_handler.create_error_response(result, operation)
+                else:
+                    result = {
+                        "error": True,
+                        "message": str(result),
+                        "operation": operation,
+                    }
+            responses.append(result)
+        return responses
+
     # Assignment Operations
     @retry_on_failure(max_retries=3, base_delay=1.0)
     async def create_assignment(
@@ -271,31 +599,28 @@ class BMCAMIDevXClient:
         default_path: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create a new assignment."""
-        data = {
-            "assignmentId": assignment_id,
-            "stream": stream,
-            "application": application,
-        }
-        if description:
-            data["description"] = description
-        if default_path:
-            data["defaultPath"] = default_path
-
-        return await self.make_request("POST", f"/ispw/{srid}/assignments", data)
+        data = AssignmentCreateRequest(
+            assignment_id=assignment_id,
+            stream=stream,
+            application=application,
+            description=description or None,
+            default_path=default_path or None,
+        ).model_dump(by_alias=True, exclude_none=True)
+
+        return await self._post_and_invalidate(srid, _url("assignments", srid), data)
 
     @retry_on_failure(max_retries=2, base_delay=0.5)
     async def get_assignments(self, srid: str, **filters) -> Dict[str, Any]:
         """Get assignments with optional filtering."""
-        query_params = "&".join(f"{k}={v}" for k, v in filters.items() if v is not None)
-        endpoint = f"/ispw/{srid}/assignments"
-        if query_params:
-            endpoint += f"?{query_params}"
+        filters = {k: v for k, v in filters.items() if v is not None}
+        endpoint = _with_query(_url("assignments", srid), filters)
 
         return await self.get_cached_or_fetch(
             "get_assignments",
             endpoint,
             cache_params={"srid": srid, **filters},
             ttl=180,  # 3 minutes cache
+            stale_ttl=180,
         )
 
     @retry_on_failure(max_retries=2, base_delay=0.5)
@@ -305,11 +630,51 @@ class BMCAMIDevXClient:
         """Get detailed assignment information."""
         return await self.get_cached_or_fetch(
             "get_assignment_details",
-            f"/ispw/{srid}/assignments/{assignment_id}",
+            _url("assignment", srid, assignment_id),
             cache_params={"srid": srid, "assignment_id": assignment_id},
             ttl=300,  # 5 minutes cache
         )
 
+    @retry_on_failure(max_retries=2, base_delay=0.5)
+    async def get_assignment_tasks(
+        self, srid: str, assignment_id: str
+    ) -> Dict[str, Any]:
+        """Get the tasks of an assignment."""
+        return await self.get_cached_or_fetch(
+            "get_assignment_tasks",
+            _url("assignment_tasks", srid, assignment_id),
+            cache_params={"srid": srid, "assignment_id": assignment_id},
+            ttl=180,
+            stale_ttl=180,
+        )
+
+    async def get_assignment_overview(
+        self, srid: str, assignment_id: str
+    ) -> Dict[str, Any]:
+        """Get an assignment's details and tasks, fetched concurrently."""
+        pending = [
+            asyncio.ensure_future(self.get_assignment_details(srid, assignment_id)),
+            asyncio.ensure_future(self.get_assignment_tasks(srid, assignment_id)),
+        ]
+        try:
+            details, tasks = await asyncio.gather(*pending)
+        except BaseException:
+            # Stop the sibling request and retrieve its outcome so it neither
+            # keeps running nor logs an unretrieved exception
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        return {"assignment": details, "tasks": tasks}
+
+    async def get_assignment_details_bulk(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """Get details for multiple (srid, assignment_id) pairs concurrently."""
+        return await self._fetch_bulk(
+            "get_assignment_details", self.get_assignment_details, items
+        )
+
     @retry_on_failure(max_retries=3, base_delay=1.0)
     async def generate_assignment(
         self,
@@ -318,10 +683,10 @@ class BMCAMIDevXClient:
         generate_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Generate code for an assignment."""
-        return await self.make_request(
-            "POST",
-            f"/ispw/{srid}/assignments/{assignment_id}/tasks/generate",
-            data=generate_data or {},
+        return await self._post_and_invalidate(
+            srid,
+            _url("assignment_generate", srid, assignment_id),
+            generate_data or {},
         )
 
     @retry_on_failure(max_retries=3, base_delay=1.0)
@@ -332,10 +697,10 @@ class BMCAMIDevXClient:
         promote_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Promote an assignment."""
-        return await self.make_request(
-            "POST",
-            f"/ispw/{srid}/assignments/{assignment_id}/tasks/promote",
-            data=promote_data or {},
+        return await self._post_and_invalidate(
+            srid,
+            _url("assignment_promote", srid, assignment_id),
+            promote_data or {},
         )
 
     # Release Operations
@@ -349,22 +714,27 @@ class BMCAMIDevXClient:
         description: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create a new release."""
-        data = {"releaseId": release_id, "stream": stream, "application": application}
-        if description:
-            data["description"] = description
+        data = ReleaseCreateRequest(
+            release_id=release_id,
+            stream=stream,
+            application=application,
+            description=description or None,
+        ).model_dump(by_alias=True, exclude_none=True)
 
-        return await self.make_request("POST", f"/ispw/{srid}/releases", data)
+        return await self._post_and_invalidate(srid, _url("releases", srid), data)
 
     @retry_on_failure(max_retries=2, base_delay=0.5)
     async def get_releases(self, srid: str, **filters) -> Dict[str, Any]:
         """Get releases with optional filtering."""
-        query_params = "&".join(f"{k}={v}" for k, v in filters.items() if v is not None)
-        endpoint = f"/ispw/{srid}/releases"
-        if query_params:
-            endpoint += f"?{query_params}"
+        filters = {k: v for k, v in filters.items() if v is not None}
+        endpoint = _with_query(_url("releases", srid), filters)
 
         return await self.get_cached_or_fetch(
-            "get_releases", endpoint, cache_params={"srid": srid, **filters}, ttl=300
+            "get_releases",
+            endpoint,
+            cache_params={"srid": srid, **filters},
+            ttl=300,
+            stale_ttl=300,
         )
 
     @retry_on_failure(max_retries=2, base_delay=0.5)
@@ -372,20 +742,26 @@ class BMCAMIDevXClient:
         """Get detailed release information."""
         return await self.get_cached_or_fetch(
             "get_release_details",
-            f"/ispw/{srid}/releases/{release_id}",
+            _url("release", srid, release_id),
             cache_params={"srid": srid, "release_id": release_id},
             ttl=300,
         )
 
+    async def get_release_details_bulk(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """Get details for multiple (srid, release_id) pairs concurrently."""
+        return await self._fetch_bulk(
+            "get_release_details", self.get_release_details, items
+        )
+
     @retry_on_failure(max_retries=3, base_delay=1.0)
     async def deploy_release(
         self, srid: str, release_id: str, deploy_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Deploy a release."""
-        return await self.make_request(
-            "POST",
-            f"/ispw/{srid}/releases/{release_id}/tasks/deploy",
-            data=deploy_data or {},
+        return await self._post_and_invalidate(
+            srid, _url("release_deploy", srid, release_id), deploy_data or {}
         )
 
     # Set Operations
@@ -395,7 +771,7 @@ class BMCAMIDevXClient:
     ) -> Dict[str, Any]:
         """Get sets with optional filtering."""
         if set_id:
-            endpoint = f"/ispw/{srid}/sets/{set_id}"
+            endpoint = _url("set", srid, set_id)
             return await self.get_cached_or_fetch(
                 "get_set_details",
                 endpoint,
@@ -403,13 +779,15 @@ class BMCAMIDevXClient:
                 ttl=300,
             )
 
-        query_params = "&".join(f"{k}={v}" for k, v in filters.items() if v is not None)
-        endpoint = f"/ispw/{srid}/sets"
-        if query_params:
-            endpoint += f"?{query_params}"
+        filters = {k: v for k, v in filters.items() if v is not None}
+        endpoint = _with_query(_url("sets", srid), filters)
 
         return await self.get_cached_or_fetch(
-            "get_sets", endpoint, cache_params={"srid": srid, **filters}, ttl=180
+            "get_sets",
+            endpoint,
+            cache_params={"srid": srid, **filters},
+            ttl=180,
+            stale_ttl=180,
         )
 
     @retry_on_failure(max_retries=3, base_delay=1.0)
@@ -417,8 +795,8 @@ class BMCAMIDevXClient:
         self, srid: str, set_id: str, deploy_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Deploy a set."""
-        return await self.make_request(
-            "POST", f"/ispw/{srid}/sets/{set_id}/tasks/deploy", data=deploy_data or {}
+        return await self._post_and_invalidate(
+            srid, _url("set_deploy", srid, set_id), deploy_data or {}
         )
 
     # Package Operations
@@ -430,13 +808,15 @@ class BMCAMIDevXClient:
         if package_id:
             return await self.get_package_details(srid, package_id)
 
-        query_params = "&".join(f"{k}={v}" for k, v in filters.items() if v is not None)
-        endpoint = f"/ispw/{srid}/packages"
-        if query_params:
-            endpoint += f"?{query_params}"
+        filters = {k: v for k, v in filters.items() if v is not None}
+        endpoint = _with_query(_url("packages", srid), filters)
 
         return await self.get_cached_or_fetch(
-            "get_packages", endpoint, cache_params={"srid": srid, **filters}, ttl=180
+            "get_packages",
+            endpoint,
+            cache_params={"srid": srid, **filters},
+            ttl=180,
+            stale_ttl=180,
         )
 
     @retry_on_failure(max_retries=2, base_delay=0.5)
@@ -444,7 +824,7 @@ class BMCAMIDevXClient:
         """Get detailed package information."""
         return await self.get_cached_or_fetch(
             "get_package_details",
-            f"/ispw/{srid}/packages/{package_id}",
+            _url("package", srid, package_id),
             cache_params={"srid": srid, "package_id": package_id},
             ttl=300,
         )
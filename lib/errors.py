@@ -7,6 +7,7 @@ custom exceptions, error categorization, and retry logic.
 """
 
 import asyncio
+import functools
 import random
 import time
 from enum import Enum
@@ -480,38 +481,52 @@ class ErrorHandler:
         return self.create_error_response(last_error, operation, attempt + 1)
 
 
-def retry_on_failure(max_retries: int = 3, base_delay: float = 1.0):
-    """Decorator for adding retry logic to functions."""
+# Transport failures worth retrying: timeouts, dropped or refused connections,
+# and servers closing a pooled keep-alive connection mid-request
+_RETRYABLE_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+_RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Return True if a failed call is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUSES
+    if isinstance(error, _RETRYABLE_EXCEPTIONS):
+        return True
+    if isinstance(error, BMCAPIError):
+        return isinstance(error, BMCAPITimeoutError) or (
+            error.status_code is not None and error.status_code >= 500
+        )
+    return False
+
+
+def retry_on_failure(
+    max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0
+):
+    """
+    Decorator for adding retry logic to functions.
+
+    Retries transient failures (timeouts, connection errors, 5xx) with capped
+    exponential backoff and full-range jitter, so concurrent callers that fail
+    together do not retry in lockstep. 4xx responses are never retried.
+    """
 
     def decorator(func: Callable):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            last_error = None
-
             for attempt in range(max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as error:
-                    last_error = error
-
-                    # Simple retry logic for decorator
-                    retryable_exceptions = (httpx.TimeoutException, httpx.ConnectError)
-                    retryable_statuses = {500, 502, 503, 504}
-
-                    should_retry = False
-                    if isinstance(error, httpx.HTTPStatusError):
-                        should_retry = error.response.status_code in retryable_statuses
-                    elif isinstance(error, retryable_exceptions):
-                        should_retry = True
-
-                    if attempt < max_retries and should_retry:
-                        delay = base_delay * (2**attempt)
-                        await asyncio.sleep(delay)
-                        continue
-                    else:
-                        break
-
-            # All retries exhausted, raise the last error
-            raise last_error
+                    if attempt >= max_retries or not _is_retryable(error):
+                        raise
+
+                    delay = min(max_delay, base_delay * (2**attempt))
+                    await asyncio.sleep(delay * (0.5 + random.random()))
 
         return wrapper
 
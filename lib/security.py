@@ -13,12 +13,48 @@ import re
 import time
 from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
 import httpx
 from pydantic import BaseModel, Field, validator
 
+# Dangerous input patterns checked by InputValidator
+_SQL_INJECTION_PATTERNS = [
+    r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)",
+    r"(--|#|/\*|\*/)",
+    r"(\b(OR|AND)\s+\d+\s*=\s*\d+)",
+    r"(\b(OR|AND)\s+['\"]?\w+['\"]?\s*=\s*['\"]?\w+['\"]?)"
+]
+
+_XSS_PATTERNS = [
+    r"<script[^>]*>.*?</script>",
+    r"javascript:",
+    r"on\w+\s*=",
+    r"<iframe[^>]*>",
+    r"<object[^>]*>",
+    r"<embed[^>]*>"
+]
+
+_PATH_TRAVERSAL_PATTERNS = [
+    r"\.\./",
+    r"\.\.\\",
+    r"%2e%2e%2f",
+    r"%2e%2e%5c"
+]
+
+# One alternation per category so each string is scanned once per category
+_SQL_INJECTION_RE = re.compile("|".join(_SQL_INJECTION_PATTERNS), re.IGNORECASE)
+_XSS_RE = re.compile("|".join(_XSS_PATTERNS), re.IGNORECASE)
+_PATH_TRAVERSAL_RE = re.compile("|".join(_PATH_TRAVERSAL_PATTERNS), re.IGNORECASE)
+
+# Every XSS pattern needs one of these characters and every path traversal
+# pattern needs ".." or "%", so most strings can skip those scans entirely
+_XSS_TRIGGER_CHARS = frozenset("<:=")
+
+_SENSITIVE_PARAM_RE = re.compile(r'(password|token|key|secret)=[^&\s]*', re.IGNORECASE)
+_SENSITIVE_KEYS = ("password", "token", "key", "secret")
+
 
 class SecurityConfig(BaseModel):
     """Security configuration settings."""
@@ -185,6 +221,9 @@ class AdvancedRateLimiter:
 class TokenBucket:
     """Token bucket implementation for rate limiting."""
     
+    # One bucket exists per client identifier, so skip the per-instance __dict__
+    __slots__ = ("rate_per_second", "burst_size", "tokens", "last_refill")
+    
     def __init__(self, rate_per_minute: int, burst_size: int):
         self.rate_per_second = rate_per_minute / 60.0
         self.burst_size = burst_size
@@ -227,33 +266,19 @@ class InputValidator:
         self.config = config
         
         # Dangerous patterns to detect
-        self.sql_injection_patterns = [
-            r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)",
-            r"(--|#|/\*|\*/)",
-            r"(\b(OR|AND)\s+\d+\s*=\s*\d+)",
-            r"(\b(OR|AND)\s+['\"]?\w+['\"]?\s*=\s*['\"]?\w+['\"]?)"
-        ]
+        self.sql_injection_patterns = _SQL_INJECTION_PATTERNS
+        self.xss_patterns = _XSS_PATTERNS
+        self.path_traversal_patterns = _PATH_TRAVERSAL_PATTERNS
         
-        self.xss_patterns = [
-            r"<script[^>]*>.*?</script>",
-            r"javascript:",
-            r"on\w+\s*=",
-            r"<iframe[^>]*>",
-            r"<object[^>]*>",
-            r"<embed[^>]*>"
-        ]
-        
-        self.path_traversal_patterns = [
-            r"\.\./",
-            r"\.\.\\",
-            r"%2e%2e%2f",
-            r"%2e%2e%5c"
-        ]
-        
-        # Compile patterns for performance
+        # Compiled per-pattern lists, kept public for callers that inspect them
         self.sql_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.sql_injection_patterns]
         self.xss_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.xss_patterns]
         self.path_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.path_traversal_patterns]
+        
+        # Validation scans with one import-time alternation per category
+        self._sql_combined = _SQL_INJECTION_RE
+        self._xss_combined = _XSS_RE
+        self._path_combined = _PATH_TRAVERSAL_RE
     
     def validate_input(self, data: Any, field_name: str = "input") -> Any:
         """
@@ -292,31 +317,28 @@ class InputValidator:
             )
         
         # Check for SQL injection
-        for pattern in self.sql_regex:
-            if pattern.search(value):
-                raise ValidationError(
-                    f"Potential SQL injection detected in {field_name}",
-                    field=field_name,
-                    value=value[:100] + "..." if len(value) > 100 else value
-                )
+        if self._sql_combined.search(value):
+            raise ValidationError(
+                f"Potential SQL injection detected in {field_name}",
+                field=field_name,
+                value=value[:100] + "..." if len(value) > 100 else value
+            )
         
         # Check for XSS
-        for pattern in self.xss_regex:
-            if pattern.search(value):
-                raise ValidationError(
-                    f"Potential XSS attack detected in {field_name}",
-                    field=field_name,
-                    value=value[:100] + "..." if len(value) > 100 else value
-                )
+        if not _XSS_TRIGGER_CHARS.isdisjoint(value) and self._xss_combined.search(value):
+            raise ValidationError(
+                f"Potential XSS attack detected in {field_name}",
+                field=field_name,
+                value=value[:100] + "..." if len(value) > 100 else value
+            )
         
         # Check for path traversal
-        for pattern in self.path_regex:
-            if pattern.search(value):
-                raise ValidationError(
-                    f"Potential path traversal detected in {field_name}",
-                    field=field_name,
-                    value=value[:100] + "..." if len(value) > 100 else value
-                )
+        if (".." in value or "%" in value) and self._path_combined.search(value):
+            raise ValidationError(
+                f"Potential path traversal detected in {field_name}",
+                field=field_name,
+                value=value[:100] + "..." if len(value) > 100 else value
+            )
         
         return value
     
@@ -348,11 +370,11 @@ class InputValidator:
         """Sanitize data for safe logging."""
         if isinstance(data, str):
             # Remove potential sensitive patterns
-            sanitized = re.sub(r'(password|token|key|secret)=[^&\s]*', r'\1=***', data, flags=re.IGNORECASE)
+            sanitized = _SENSITIVE_PARAM_RE.sub(r'\1=***', data)
             return sanitized[:200] + "..." if len(sanitized) > 200 else sanitized
         elif isinstance(data, dict):
             return {
-                key: "***" if any(sensitive in key.lower() for sensitive in ["password", "token", "key", "secret"])
+                key: "***" if any(sensitive in key.lower() for sensitive in _SENSITIVE_KEYS)
                 else self.sanitize_for_logging(value)
                 for key, value in data.items()
             }
@@ -364,9 +386,15 @@ class SecurityHeaders:
     
     def __init__(self, config: SecurityConfig):
         self.config = config
+        # The headers depend only on config, so build them (and the CORS joins) once
+        self._headers = self._build_security_headers()
     
     def get_security_headers(self) -> Dict[str, str]:
         """Get security headers to add to responses."""
+        return dict(self._headers)
+    
+    def _build_security_headers(self) -> Dict[str, str]:
+        """Build the response security headers from the configuration."""
         if not self.config.security_headers_enabled:
             return {}
         
@@ -7,10 +7,10 @@ with the FastMCP server and HTTP requests.
 """
 
 import asyncio
-import json
 import time
 from typing import Any, Callable, Dict, Optional
 
+import orjson
 from fastmcp import Context
 
 from .security import SecurityConfig, SecurityManager, RateLimitExceeded, ValidationError
@@ -236,7 +236,7 @@ def create_security_decorator(security_middleware: SecurityMiddleware):
                         if "field" in security_result:
                             error_response["field"] = security_result["field"]
                         
-                        return json.dumps(error_response)
+                        return orjson.dumps(error_response).decode()
                     
                     # Security checks passed, proceed with original function
                     return await func(*args, **kwargs)
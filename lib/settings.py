@@ -7,17 +7,20 @@ with environment variable integration and validation.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import ConfigDict, Field
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable integration."""
 
-    model_config = ConfigDict(
+    model_config = SettingsConfigDict(
         env_prefix="FASTMCP_",
+        env_file=".env",
+        env_file_encoding="utf-8",
         case_sensitive=False,
         validate_assignment=True,
         extra="ignore",
@@ -84,6 +87,12 @@ class Settings(BaseSettings):
     retry_base_delay: float = Field(
         default=1.0, description="Base retry delay in seconds"
     )
+    hedge_enabled: bool = Field(
+        default=False, description="Send a backup GET when the first one is slow"
+    )
+    hedge_after_seconds: float = Field(
+        default=0.2, description="Delay before sending a hedged GET in seconds"
+    )
 
     # Circuit breaker configuration
     circuit_breaker_failure_threshold: int = Field(
@@ -295,5 +304,11 @@ class Settings(BaseSettings):
         return True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once."""
+    return Settings.from_env()
+
+
 # Global settings instance
-settings = Settings.from_env()
+settings = get_settings()
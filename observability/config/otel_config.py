@@ -21,6 +21,15 @@ _meter = None
 class OTELConfig:
     """Simplified OpenTelemetry configuration for FastMCP server."""
 
+    __slots__ = (
+        "service_name",
+        "service_version",
+        "environment",
+        "otel_enabled",
+        "tracing_enabled",
+        "metrics_enabled",
+    )
+
     def __init__(self):
         """Initialize OTEL configuration with environment variables."""
         # Service identification
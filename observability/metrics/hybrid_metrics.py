@@ -6,22 +6,163 @@ This module provides OTEL-compatible metrics while maintaining backward compatib
 with the existing metrics system.
 """
 
+import functools
 import json
 import logging
+import math
+import os
+import sys
+import threading
 import time
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from opentelemetry import metrics
 
 from ..config.otel_config import get_meter, is_metrics_enabled
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+def _parse_buckets(env_var: str, default: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Read comma-separated histogram bucket boundaries from the environment."""
+    raw = os.getenv(env_var)
+    if not raw:
+        return default
+    try:
+        buckets = tuple(sorted(float(value) for value in raw.split(",") if value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid histogram buckets in {env_var}: {raw!r}")
+        return default
+    return buckets or default
+
+
+# Histogram bucket boundaries in seconds; operators can retune them via env
+REQUEST_DURATION_BUCKETS = _parse_buckets(
+    "FASTMCP_REQUEST_DURATION_BUCKETS",
+    (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0),
+)
+BMC_API_DURATION_BUCKETS = _parse_buckets(
+    "FASTMCP_BMC_API_DURATION_BUCKETS",
+    (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+TOOL_DURATION_BUCKETS = _parse_buckets(
+    "FASTMCP_TOOL_DURATION_BUCKETS",
+    (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+def _percentiles(samples, *quantiles: float) -> List[float]:
+    """Nearest-rank percentiles of a sample window (zeros when it is empty)."""
+    if not samples:
+        return [0.0 for _ in quantiles]
+    ordered = sorted(samples)
+    return [ordered[max(0, math.ceil(q * len(ordered)) - 1)] for q in quantiles]
+
+
+_STATUS_CLASSES = tuple(f"{i}xx" for i in range(10))
+_BOOL_LABELS = ("false", "true")
+# Shared attributes for instruments recorded without labels; never mutated
+_NO_LABELS: Dict[str, str] = {}
+
+_MANAGEMENT_TOOLS = frozenset(
+    ["get_metrics", "get_health_status", "get_cache_stats", "clear_cache"]
+)
+
+
+def _status_class(status_code: int) -> str:
+    """Map an HTTP status code to its class label, e.g. 404 -> "4xx"."""
+    if 0 <= status_code < 1000:
+        return _STATUS_CLASSES[status_code // 100]
+    return f"{status_code // 100}xx"
+
+
+@functools.lru_cache(maxsize=512)
+def _tool_type(tool_name: str) -> str:
+    """Determine tool type from name."""
+    if tool_name in _MANAGEMENT_TOOLS:
+        return "management"
+    elif tool_name.startswith("ispw_"):
+        return "openapi"
+    elif tool_name.endswith("_interactive"):
+        return "elicitation"
+    else:
+        return "custom"
+
+
+@functools.lru_cache(maxsize=4096)
+def _request_labels(
+    method: str, endpoint: str, status_code: int, user_id: Optional[str]
+) -> Dict[str, str]:
+    """HTTP request labels; the cached dict is shared, so treat it as read-only."""
+    labels = {
+        "method": method,
+        "endpoint": endpoint,
+        "status_code": str(status_code),
+        "status_class": _status_class(status_code),
+    }
+    if user_id:
+        labels["user_id"] = user_id
+    return labels
+
+
+@functools.lru_cache(maxsize=1024)
+def _bmc_api_labels(
+    operation: str, success: bool, status_code: Optional[int]
+) -> Dict[str, str]:
+    """BMC API call labels (shared, read-only)."""
+    return {
+        "operation": operation,
+        "success": _BOOL_LABELS[bool(success)],
+        "status_class": _status_class(status_code) if status_code else "none",
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _cache_operation_labels(
+    operation: str, hit: bool, key_type: Optional[str]
+) -> Dict[str, str]:
+    """Cache operation labels (shared, read-only)."""
+    labels = {"operation": operation, "result": "hit" if hit else "miss"}
+    if key_type:
+        labels["key_type"] = key_type
+    return labels
+
+
+@functools.lru_cache(maxsize=1024)
+def _tool_labels(
+    tool_name: str, success: bool, error_type: Optional[str]
+) -> Dict[str, str]:
+    """MCP tool execution labels (shared, read-only)."""
+    labels = {
+        "tool_name": tool_name,
+        "success": _BOOL_LABELS[bool(success)],
+        "tool_type": _tool_type(tool_name),
+    }
+    if error_type:
+        labels["error_type"] = error_type
+    return labels
+
+
+@functools.lru_cache(maxsize=256)
+def _auth_labels(provider: str, success: bool, method: Optional[str]) -> Dict[str, str]:
+    """Authentication attempt labels (shared, read-only)."""
+    labels = {"provider": provider, "success": _BOOL_LABELS[bool(success)]}
+    if method:
+        labels["method"] = method
+    return labels
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LegacyMetrics:
     """Legacy metrics structure for backward compatibility."""
 
@@ -33,13 +174,12 @@ class LegacyMetrics:
 
     # Response time metrics
     response_times: deque = field(default_factory=lambda: deque(maxlen=1000))
-    avg_response_time: float = 0.0
     min_response_time: float = float("inf")
     max_response_time: float = 0.0
 
     # API endpoint metrics
-    endpoint_counts: Dict[str, int] = field(default_factory=dict)
-    endpoint_errors: Dict[str, int] = field(default_factory=dict)
+    endpoint_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    endpoint_errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
     # BMC API metrics
     bmc_api_calls: int = 0
@@ -54,14 +194,23 @@ class LegacyMetrics:
     # System metrics
     start_time: datetime = field(default_factory=datetime.now)
     uptime_seconds: float = 0.0
+    # Monotonic clock reading and ISO text derived from the start_time last seen
+    _start_anchor: Optional[datetime] = field(default=None, repr=False)
+    _start_monotonic: float = field(default=0.0, repr=False)
+    _start_iso: str = field(default="", repr=False)
+
+    @property
+    def avg_response_time(self) -> float:
+        """Average of the recent response-time window."""
+        # Summed on read so the average can never drift from the window itself
+        times = self.response_times
+        return sum(times) / len(times) if times else 0.0
 
     def update_response_time(self, response_time: float):
         """Update response time metrics."""
         self.response_times.append(response_time)
-        if self.response_times:
-            self.avg_response_time = sum(self.response_times) / len(self.response_times)
-            self.min_response_time = min(self.min_response_time, response_time)
-            self.max_response_time = max(self.max_response_time, response_time)
+        self.min_response_time = min(self.min_response_time, response_time)
+        self.max_response_time = max(self.max_response_time, response_time)
 
     def update_bmc_response_time(self, response_time: float):
         """Update BMC API response time metrics."""
@@ -79,7 +228,9 @@ class LegacyMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary for JSON serialization."""
-        self.uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+        # Sorting the bounded windows is only paid when a snapshot is rebuilt
+        p95, p99 = _percentiles(self.response_times, 0.95, 0.99)
+        bmc_p95, bmc_p99 = _percentiles(self.bmc_api_response_times, 0.95, 0.99)
 
         return {
             "requests": {
@@ -97,11 +248,13 @@ class LegacyMetrics:
                     else 0
                 ),
                 "maximum": round(self.max_response_time, 3),
+                "p95": round(p95, 3),
+                "p99": round(p99, 3),
                 "recent_count": len(self.response_times),
             },
             "endpoints": {
-                "counts": self.endpoint_counts,
-                "errors": self.endpoint_errors,
+                "counts": dict(self.endpoint_counts),
+                "errors": dict(self.endpoint_errors),
             },
             "bmc_api": {
                 "calls": self.bmc_api_calls,
@@ -111,6 +264,8 @@ class LegacyMetrics:
                     if self.bmc_api_response_times
                     else 0
                 ),
+                "p95_response_time": round(bmc_p95, 3),
+                "p99_response_time": round(bmc_p99, 3),
             },
             "cache": {
                 "hits": self.cache_hits,
@@ -118,26 +273,77 @@ class LegacyMetrics:
                 "size": self.cache_size,
                 "hit_rate": self.get_cache_hit_rate(),
             },
-            "system": {
-                "uptime_seconds": round(self.uptime_seconds, 1),
-                "start_time": self.start_time.isoformat(),
-            },
+            "system": self.system_section(),
         }
 
+    def system_section(self) -> Dict[str, Any]:
+        """Build the time-dependent system section of the metrics dictionary."""
+        if self.start_time is not self._start_anchor:
+            # start_time was set or replaced; re-anchor it to the monotonic clock
+            elapsed = (datetime.now() - self.start_time).total_seconds()
+            self._start_monotonic = time.monotonic() - elapsed
+            self._start_iso = self.start_time.isoformat()
+            self._start_anchor = self.start_time
+
+        self.uptime_seconds = time.monotonic() - self._start_monotonic
+        return {
+            "uptime_seconds": round(self.uptime_seconds, 1),
+            "start_time": self._start_iso,
+        }
+
+
+# Recorders that are replaced by _noop on instances with OTEL metrics disabled
+_RECORDING_METHODS = (
+    "record_request",
+    "record_bmc_api_call",
+    "record_cache_operation",
+    "record_tool_execution",
+    "record_auth_attempt",
+    "record_rate_limit_event",
+    "record_elicitation_workflow",
+    "update_cache_size",
+    "increment_active_requests",
+    "decrement_active_requests",
+)
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in recorder for disabled OTEL metrics."""
+
 
 class OTELMetrics:
     """OpenTelemetry-enhanced metrics for FastMCP server."""
 
-    def __init__(self, meter: Optional[metrics.Meter] = None):
-        """Initialize OTEL metrics."""
+    def __init__(
+        self,
+        meter: Optional[metrics.Meter] = None,
+        histogram_bucket_overrides: Optional[Dict[str, List[float]]] = None,
+    ):
+        """
+        Initialize OTEL metrics.
+
+        Args:
+            meter: Meter to create instruments on (defaults to the global meter)
+            histogram_bucket_overrides: Bucket boundaries keyed by histogram name,
+                replacing the module defaults for those histograms
+        """
         self.meter = meter or get_meter()
         self.enabled = is_metrics_enabled() and self.meter is not None
         self.start_time = time.time()
+        self._current_cache_size = 0
 
         if not self.enabled:
             logger.info("OTEL metrics disabled or meter not available")
+            # Shadow the recorders so disabled deployments skip their bodies
+            for name in _RECORDING_METHODS:
+                setattr(self, name, _noop)
             return
 
+        overrides = histogram_bucket_overrides or {}
+
+        def buckets(name: str, default: Tuple[float, ...]) -> Tuple[float, ...]:
+            return tuple(overrides[name]) if name in overrides else default
+
         # Request metrics
         self.request_counter = self.meter.create_counter(
             name="fastmcp_requests_total",
@@ -149,22 +355,9 @@ class OTELMetrics:
             name="fastmcp_request_duration_seconds",
             description="Request duration in seconds",
             unit="s",
-            boundaries=[
-                0.005,
-                0.01,
-                0.025,
-                0.05,
-                0.075,
-                0.1,
-                0.25,
-                0.5,
-                0.75,
-                1.0,
-                2.5,
-                5.0,
-                7.5,
-                10.0,
-            ],
+            explicit_bucket_boundaries_advisory=buckets(
+                "fastmcp_request_duration_seconds", REQUEST_DURATION_BUCKETS
+            ),
         )
 
         self.active_requests = self.meter.create_up_down_counter(
@@ -173,18 +366,14 @@ class OTELMetrics:
             unit="1",
         )
 
-        # BMC API metrics
-        self.bmc_api_calls = self.meter.create_counter(
-            name="fastmcp_bmc_api_calls_total",
-            description="Total BMC API calls",
-            unit="1",
-        )
-
+        # BMC API metrics; call counts come from the histogram's count series
         self.bmc_api_duration = self.meter.create_histogram(
             name="fastmcp_bmc_api_duration_seconds",
             description="BMC API call duration",
             unit="s",
-            boundaries=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+            explicit_bucket_boundaries_advisory=buckets(
+                "fastmcp_bmc_api_duration_seconds", BMC_API_DURATION_BUCKETS
+            ),
         )
 
         # Cache metrics
@@ -194,8 +383,11 @@ class OTELMetrics:
             unit="1",
         )
 
-        self.cache_size = self.meter.create_up_down_counter(
-            name="fastmcp_cache_size", description="Current cache size", unit="1"
+        self.cache_size = self.meter.create_observable_gauge(
+            name="fastmcp_cache_size",
+            description="Current cache size",
+            unit="1",
+            callbacks=[self._get_cache_size],
         )
 
         # Rate limiting metrics
@@ -216,7 +408,9 @@ class OTELMetrics:
             name="fastmcp_tool_duration_seconds",
             description="Tool execution duration",
             unit="s",
-            boundaries=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            explicit_bucket_boundaries_advisory=buckets(
+                "fastmcp_tool_duration_seconds", TOOL_DURATION_BUCKETS
+            ),
         )
 
         # Authentication metrics
@@ -254,6 +448,10 @@ class OTELMetrics:
         uptime = time.time() - self.start_time
         return [metrics.Observation(uptime)]
 
+    def _get_cache_size(self, options) -> List[metrics.Observation]:
+        """Callback for cache size gauge."""
+        return [metrics.Observation(self._current_cache_size)]
+
     def record_request(
         self,
         method: str,
@@ -266,16 +464,7 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        labels = {
-            "method": method,
-            "endpoint": endpoint,
-            "status_code": str(status_code),
-            "status_class": f"{status_code // 100}xx",
-        }
-
-        if user_id:
-            labels["user_id"] = user_id
-
+        labels = _request_labels(method, endpoint, status_code, user_id)
         self.request_counter.add(1, labels)
         self.request_duration.record(duration, labels)
 
@@ -290,13 +479,9 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        labels = {"operation": operation, "success": str(success).lower()}
-
-        if status_code:
-            labels["status_code"] = str(status_code)
-
-        self.bmc_api_calls.add(1, labels)
-        self.bmc_api_duration.record(duration, labels)
+        self.bmc_api_duration.record(
+            duration, _bmc_api_labels(operation, success, status_code)
+        )
 
     def record_cache_operation(
         self, operation: str, hit: bool, key_type: Optional[str] = None
@@ -305,12 +490,7 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        labels = {"operation": operation, "result": "hit" if hit else "miss"}
-
-        if key_type:
-            labels["key_type"] = key_type
-
-        self.cache_operations.add(1, labels)
+        self.cache_operations.add(1, _cache_operation_labels(operation, hit, key_type))
 
     def record_tool_execution(
         self,
@@ -323,15 +503,7 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        labels = {
-            "tool_name": tool_name,
-            "success": str(success).lower(),
-            "tool_type": self._get_tool_type(tool_name),
-        }
-
-        if error_type:
-            labels["error_type"] = error_type
-
+        labels = _tool_labels(tool_name, success, error_type)
         self.tool_executions.add(1, labels)
         self.tool_duration.record(duration, labels)
 
@@ -342,12 +514,7 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        labels = {"provider": provider, "success": str(success).lower()}
-
-        if method:
-            labels["method"] = method
-
-        self.auth_attempts.add(1, labels)
+        self.auth_attempts.add(1, _auth_labels(provider, success, method))
 
     def record_rate_limit_event(self, event_type: str, client_id: Optional[str] = None):
         """Record rate limiting event."""
@@ -373,8 +540,8 @@ class OTELMetrics:
 
         labels = {
             "workflow_name": workflow_name,
-            "success": str(success).lower(),
-            "user_cancelled": str(user_cancelled).lower(),
+            "success": _BOOL_LABELS[bool(success)],
+            "user_cancelled": _BOOL_LABELS[bool(user_cancelled)],
         }
 
         self.elicitation_workflows.add(1, labels)
@@ -385,99 +552,140 @@ class OTELMetrics:
         if not self.enabled:
             return
 
-        # This is a bit tricky with UpDownCounter - we need to track the delta
-        # For now, we'll use a simple approach
-        self.cache_size.add(size, {"operation": "update"})
+        # Reported by the observable gauge on the next collection
+        self._current_cache_size = size
 
     def increment_active_requests(self):
         """Increment active request counter."""
         if not self.enabled:
             return
-        self.active_requests.add(1)
+        self.active_requests.add(1, _NO_LABELS)
 
     def decrement_active_requests(self):
         """Decrement active request counter."""
         if not self.enabled:
             return
-        self.active_requests.add(-1)
+        self.active_requests.add(-1, _NO_LABELS)
 
     def _get_tool_type(self, tool_name: str) -> str:
         """Determine tool type from name."""
-        if tool_name.startswith("ispw_"):
-            return "openapi"
-        elif tool_name.endswith("_interactive"):
-            return "elicitation"
-        elif tool_name in [
-            "get_metrics",
-            "get_health_status",
-            "get_cache_stats",
-            "clear_cache",
-        ]:
-            return "management"
-        else:
-            return "custom"
+        return _tool_type(tool_name)
+
+
+# LegacyMetrics fields that HybridMetrics exposes as its own attributes
+_LEGACY_ATTRS = frozenset(
+    [
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "cache_hits",
+        "cache_misses",
+        "cache_size",
+        "bmc_api_calls",
+        "bmc_api_errors",
+        "endpoint_errors",
+        "response_times",
+        "min_response_time",
+        "max_response_time",
+        "avg_response_time",
+        "bmc_api_response_times",
+        "start_time",
+    ]
+)
+
+
+class _WindowView(Sequence):
+    """Read-only view of a bounded response-time window."""
+
+    __slots__ = ("_window",)
+
+    def __init__(self, window: deque):
+        self._window = window
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._window.maxlen
 
+    def __getitem__(self, index):
+        return self._window[index]
 
-class HybridMetrics:
-    """Hybrid metrics supporting both legacy and OTEL formats."""
+    def __iter__(self):
+        return iter(self._window)
 
-    def __init__(self, otel_metrics: Optional[OTELMetrics] = None):
-        """Initialize hybrid metrics."""
-        self.otel = otel_metrics or OTELMetrics()
-        self.legacy = LegacyMetrics()
+    def __len__(self) -> int:
+        return len(self._window)
 
-        logger.info("Hybrid metrics initialized with OTEL and legacy support")
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._window)!r})"
 
-    # Backward compatibility properties
-    @property
-    def failed_requests(self) -> int:
-        """Get failed requests count."""
-        return self.legacy.failed_requests
 
-    @failed_requests.setter
-    def failed_requests(self, value: int):
-        """Set failed requests count."""
-        self.legacy.failed_requests = value
+class _CountsView(Mapping):
+    """Read-only view of a per-endpoint counter."""
 
-    @property
-    def cache_misses(self) -> int:
-        """Get cache misses count."""
-        return self.legacy.cache_misses
+    __slots__ = ("_counts",)
 
-    @cache_misses.setter
-    def cache_misses(self, value: int):
-        """Set cache misses count."""
-        self.legacy.cache_misses = value
+    def __init__(self, counts: Dict[str, int]):
+        self._counts = counts
 
-    @property
-    def cache_size(self) -> int:
-        """Get cache size."""
-        return self.legacy.cache_size
+    def __getitem__(self, key: str) -> int:
+        # Looking a key up must not let a defaultdict insert it
+        if key not in self._counts:
+            raise KeyError(key)
+        return self._counts[key]
 
-    @cache_size.setter
-    def cache_size(self, value: int):
-        """Set cache size."""
-        self.legacy.cache_size = value
+    def __iter__(self):
+        return iter(self._counts)
 
-    @property
-    def total_requests(self) -> int:
-        """Get total requests count."""
-        return self.legacy.total_requests
+    def __len__(self) -> int:
+        return len(self._counts)
 
-    @total_requests.setter
-    def total_requests(self, value: int):
-        """Set total requests count."""
-        self.legacy.total_requests = value
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._counts)!r})"
 
-    @property
-    def successful_requests(self) -> int:
-        """Get successful requests count."""
-        return self.legacy.successful_requests
 
-    @successful_requests.setter
-    def successful_requests(self, value: int):
-        """Set successful requests count."""
-        self.legacy.successful_requests = value
+# Containers are only handed out as views so every write bumps the version
+_LEGACY_CONTAINERS = {
+    "endpoint_errors": _CountsView,
+    "response_times": _WindowView,
+    "bmc_api_response_times": _WindowView,
+}
+
+
+class HybridMetrics:
+    """Hybrid metrics supporting both legacy and OTEL formats."""
+
+    def __init__(self, otel_metrics: Optional[OTELMetrics] = None):
+        """Initialize hybrid metrics."""
+        self.otel = otel_metrics or OTELMetrics()
+        # Raw backing store; writes made here directly bypass the to_dict() snapshot
+        self.legacy = LegacyMetrics()
+
+        # Bumped on every legacy mutation so to_dict() can reuse its last snapshot
+        self._version = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_version = -1
+
+        logger.info("Hybrid metrics initialized with OTEL and legacy support")
+
+    # Backward compatibility: legacy counters are readable and assignable here
+    def __getattr__(self, name: str) -> Any:
+        """Forward legacy metric attributes to the legacy store."""
+        if name in _LEGACY_ATTRS:
+            value = getattr(self.legacy, name)
+            view = _LEGACY_CONTAINERS.get(name)
+            return view(value) if view else value
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, value: Any):
+        """Route legacy metric attributes and invalidate the to_dict() snapshot."""
+        if name in _LEGACY_ATTRS:
+            setattr(self.legacy, name, value)
+        else:
+            super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_version", getattr(self, "_version", 0) + 1)
 
     def record_request(
         self,
@@ -491,24 +699,21 @@ class HybridMetrics:
         # OTEL metrics
         self.otel.record_request(method, endpoint, status_code, duration, user_id)
 
-        # Legacy metrics
-        self.legacy.total_requests += 1
+        # Legacy metrics; counters are only touched from the event loop thread
+        self._version += 1
+        legacy = self.legacy
+        legacy.total_requests += 1
         if 200 <= status_code < 300:
-            self.legacy.successful_requests += 1
+            legacy.successful_requests += 1
         else:
-            self.legacy.failed_requests += 1
+            legacy.failed_requests += 1
 
-        self.legacy.update_response_time(duration)
+        legacy.update_response_time(duration)
 
         # Update endpoint counts
-        if endpoint not in self.legacy.endpoint_counts:
-            self.legacy.endpoint_counts[endpoint] = 0
-        self.legacy.endpoint_counts[endpoint] += 1
-
+        legacy.endpoint_counts[endpoint] += 1
         if status_code >= 400:
-            if endpoint not in self.legacy.endpoint_errors:
-                self.legacy.endpoint_errors[endpoint] = 0
-            self.legacy.endpoint_errors[endpoint] += 1
+            legacy.endpoint_errors[endpoint] += 1
 
     def record_bmc_api_call(
         self,
@@ -522,6 +727,7 @@ class HybridMetrics:
         self.otel.record_bmc_api_call(operation, success, duration, status_code)
 
         # Legacy metrics
+        self._version += 1
         self.legacy.bmc_api_calls += 1
         if not success:
             self.legacy.bmc_api_errors += 1
@@ -535,6 +741,7 @@ class HybridMetrics:
         self.otel.record_cache_operation(operation, hit, key_type)
 
         # Legacy metrics
+        self._version += 1
         if hit:
             self.legacy.cache_hits += 1
         else:
@@ -565,6 +772,7 @@ class HybridMetrics:
 
         # Legacy metrics
         if event_type == "limited":
+            self._version += 1
             self.legacy.rate_limited_requests += 1
 
     def record_elicitation_workflow(
@@ -586,89 +794,11 @@ class HybridMetrics:
         self.otel.update_cache_size(size)
 
         # Legacy metrics
+        self._version += 1
         self.legacy.cache_size = size
 
-    @property
-    def cache_hits(self) -> int:
-        return self.legacy.cache_hits
-
-    @cache_hits.setter
-    def cache_hits(self, value: int):
-        self.legacy.cache_hits = value
-
-    @property
-    def bmc_api_calls(self) -> int:
-        return self.legacy.bmc_api_calls
-
-    @bmc_api_calls.setter
-    def bmc_api_calls(self, value: int):
-        self.legacy.bmc_api_calls = value
-
-    @property
-    def bmc_api_errors(self) -> int:
-        return self.legacy.bmc_api_errors
-
-    @bmc_api_errors.setter
-    def bmc_api_errors(self, value: int):
-        self.legacy.bmc_api_errors = value
-
-    @property
-    def endpoint_errors(self) -> dict:
-        return self.legacy.endpoint_errors
-
-    @endpoint_errors.setter
-    def endpoint_errors(self, value: dict):
-        self.legacy.endpoint_errors = value
-
-    @property
-    def response_times(self):
-        return self.legacy.response_times
-
-    @response_times.setter
-    def response_times(self, value):
-        self.legacy.response_times = value
-
-    @property
-    def min_response_time(self) -> float:
-        return self.legacy.min_response_time
-
-    @min_response_time.setter
-    def min_response_time(self, value: float):
-        self.legacy.min_response_time = value
-
-    @property
-    def max_response_time(self) -> float:
-        return self.legacy.max_response_time
-
-    @max_response_time.setter
-    def max_response_time(self, value: float):
-        self.legacy.max_response_time = value
-
-    @property
-    def avg_response_time(self) -> float:
-        return self.legacy.avg_response_time
-
-    @avg_response_time.setter
-    def avg_response_time(self, value: float):
-        self.legacy.avg_response_time = value
-
-    @property
-    def bmc_api_response_times(self):
-        return self.legacy.bmc_api_response_times
-
-    @bmc_api_response_times.setter
-    def bmc_api_response_times(self, value):
-        self.legacy.bmc_api_response_times = value
-
-    @property
-    def start_time(self):
-        return self.legacy.start_time
-
-    @start_time.setter
-    def start_time(self, value):
-        self.legacy.start_time = value
-
     def update_response_time(self, response_time: float):
+        self._version += 1
         self.legacy.update_response_time(response_time)
 
     def get_cache_hit_rate(self) -> float:
@@ -679,6 +809,7 @@ class HybridMetrics:
 
     def update_bmc_response_time(self, response_time: float):
         """Update BMC API response time."""
+        self._version += 1
         self.legacy.update_bmc_response_time(response_time)
 
     def increment_active_requests(self):
@@ -691,21 +822,24 @@ class HybridMetrics:
 
     def reset(self):
         """Reset all metrics to initial state."""
+        self._version += 1
         # Reset legacy metrics
         self.legacy.total_requests = 0
         self.legacy.successful_requests = 0
         self.legacy.failed_requests = 0
+        self.legacy.rate_limited_requests = 0
         self.legacy.cache_hits = 0
         self.legacy.cache_misses = 0
         self.legacy.cache_size = 0
         self.legacy.bmc_api_calls = 0
         self.legacy.bmc_api_errors = 0
-        self.legacy.endpoint_errors = {}
-        self.legacy.response_times = []
+        # Clear containers in place so the bounded windows keep their maxlen
+        self.legacy.endpoint_counts.clear()
+        self.legacy.endpoint_errors.clear()
+        self.legacy.response_times.clear()
         self.legacy.min_response_time = float("inf")
         self.legacy.max_response_time = 0.0
-        self.legacy.avg_response_time = 0.0
-        self.legacy.bmc_api_response_times = []
+        self.legacy.bmc_api_response_times.clear()
         self.legacy.start_time = datetime.now()
 
         # Reset OTEL metrics (if available)
@@ -717,28 +851,50 @@ class HybridMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Get legacy metrics as dictionary for JSON serialization."""
-        return self.legacy.to_dict()
+        if self._snapshot_version != self._version:
+            self._snapshot = self.legacy.to_dict()
+            self._snapshot_version = self._version
+        else:
+            # Uptime moves on even when no metric has changed
+            self._snapshot["system"] = self.legacy.system_section()
+        data = {name: dict(section) for name, section in self._snapshot.items()}
+        # Callers own the result, so the nested endpoint maps are copied as well
+        data["endpoints"] = {
+            name: dict(counts) for name, counts in data["endpoints"].items()
+        }
+        return data
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """Get legacy metrics as JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        if indent not in (None, 0, 2):
+            # orjson only knows two-space indentation
+            return json.dumps(self.to_dict(), indent=indent)
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(self.to_dict(), option=option).decode()
 
 
 # Global metrics instance
 _metrics_instance: Optional[HybridMetrics] = None
+_metrics_lock = threading.Lock()
 
 
 def get_metrics() -> HybridMetrics:
     """Get global metrics instance."""
     global _metrics_instance
-    if _metrics_instance is None:
-        _metrics_instance = HybridMetrics()
-    return _metrics_instance
+    instance = _metrics_instance
+    if instance is not None:
+        return instance
+    # Only one thread may create the instance and register its instruments
+    with _metrics_lock:
+        if _metrics_instance is None:
+            _metrics_instance = HybridMetrics()
+        return _metrics_instance
 
 
 def initialize_metrics() -> HybridMetrics:
     """Initialize global metrics."""
     global _metrics_instance
-    _metrics_instance = HybridMetrics()
+    with _metrics_lock:
+        _metrics_instance = instance = HybridMetrics()
     logger.info("Global metrics initialized")
-    return _metrics_instance
+    return instance
@@ -8,24 +8,92 @@ in the FastMCP server.
 
 import asyncio
 import json
+import re
 import sys
 import time
+from typing import FrozenSet, Optional, Tuple
 
 import httpx
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Imported once up front so module setup never runs on the event loop mid-test
+try:
+    from ..config.otel_config import (
+        initialize_otel,
+        is_metrics_enabled,
+        is_tracing_enabled,
+    )
+    from ..metrics.hybrid_metrics import get_metrics
+    from ..tracing.fastmcp_tracer import get_elicitation_tracer, get_fastmcp_tracer
+
+    OTEL_AVAILABLE = True
+    OTEL_IMPORT_ERROR = ""
+except ImportError as e:
+    OTEL_AVAILABLE = False
+    OTEL_IMPORT_ERROR = str(e)
+
 # Test configuration
 TEST_CONFIG = {
     "server_url": "http://localhost:8080",
     "prometheus_url": "http://localhost:9464",
     "test_timeout": 30,
     "test_requests": 10,
+    "load_concurrency": 8,
 }
 
+# Endpoint URLs and headers, built once from TEST_CONFIG
+SERVER_URL = TEST_CONFIG["server_url"]
+HEALTH_URL = f"{SERVER_URL}/health"
+TOOLS_URL = f"{SERVER_URL}/mcp/tools/call"
+METRICS_URL = f"{TEST_CONFIG['prometheus_url']}/metrics"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Metric names the Prometheus exposition is expected to contain
+EXPECTED_PROM_METRICS = frozenset(
+    {
+        "fastmcp_requests_total",
+        "fastmcp_request_duration_seconds",
+        "fastmcp_uptime_seconds",
+    }
+)
+# One alternation so the exposition body is scanned once for all names; longest
+# first so a name that prefixes another cannot shadow it
+EXPECTED_PROM_METRICS_RE = re.compile(
+    "|".join(map(re.escape, sorted(EXPECTED_PROM_METRICS, key=len, reverse=True)))
+)
+# Text carried between streamed chunks so names split across them still match
+PROM_CHUNK_OVERLAP = max(map(len, EXPECTED_PROM_METRICS)) - 1
+
+
+def tool_call_body(name: str) -> bytes:
+    """Serialize an argument-less MCP tool call once for reuse as a request body."""
+    return json.dumps({"name": name, "arguments": {}}).encode()
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the keep-alive client shared by every HTTP check."""
+    # The connection pool stays open-ended: plain http:// origins still speak
+    # HTTP/1.1, where capping connections would serialize the load burst
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
+
 
 class OTELIntegrationTester:
     """Test suite for OTEL integration validation."""
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Shared so every check reuses the same pooled connections
+        self.client = client
         self.results = {
             "tests_run": 0,
             "tests_passed": 0,
@@ -46,13 +114,11 @@ class OTELIntegrationTester:
 
     async def test_otel_initialization(self):
         """Test OTEL components initialize correctly."""
-        try:
-            from ..config.otel_config import (
-                initialize_otel,
-                is_metrics_enabled,
-                is_tracing_enabled,
-            )
+        if not OTEL_AVAILABLE:
+            self.log_test("OTEL Initialization", False, OTEL_IMPORT_ERROR)
+            return
 
+        try:
             # Test initialization
             tracer, meter = initialize_otel()
 
@@ -77,9 +143,11 @@ class OTELIntegrationTester:
 
     async def test_hybrid_metrics(self):
         """Test hybrid metrics system."""
-        try:
-            from ..metrics.hybrid_metrics import get_metrics
+        if not OTEL_AVAILABLE:
+            self.log_test("Hybrid Metrics", False, OTEL_IMPORT_ERROR)
+            return
 
+        try:
             # Test metrics initialization
             metrics = get_metrics()
             self.log_test(
@@ -108,12 +176,11 @@ class OTELIntegrationTester:
 
     async def test_tracing_utilities(self):
         """Test tracing utilities."""
-        try:
-            from ..tracing.fastmcp_tracer import (
-                get_elicitation_tracer,
-                get_fastmcp_tracer,
-            )
+        if not OTEL_AVAILABLE:
+            self.log_test("Tracing Utilities", False, OTEL_IMPORT_ERROR)
+            return
 
+        try:
             # Test tracer initialization
             fastmcp_tracer = get_fastmcp_tracer()
             elicitation_tracer = get_elicitation_tracer()
@@ -144,145 +211,157 @@ class OTELIntegrationTester:
     async def test_server_health(self):
         """Test server health and availability."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Test server health
-                response = await client.get(f"{TEST_CONFIG['server_url']}/health")
+            # Test server health
+            response = await self.client.get(HEALTH_URL)
+
+            self.log_test(
+                "Server Health",
+                response.status_code == 200,
+                f"Status: {response.status_code}",
+            )
 
+            if response.status_code == 200:
+                health_data = response.json()
                 self.log_test(
-                    "Server Health",
-                    response.status_code == 200,
-                    f"Status: {response.status_code}",
+                    "Health Data Structure",
+                    "status" in health_data,
+                    f"Keys: {list(health_data.keys())}",
                 )
 
-                if response.status_code == 200:
-                    health_data = response.json()
-                    self.log_test(
-                        "Health Data Structure",
-                        "status" in health_data,
-                        f"Keys: {list(health_data.keys())}",
-                    )
-
         except Exception as e:
             self.log_test("Server Health", False, str(e))
 
     async def test_mcp_tools(self):
         """Test MCP tool execution with tracing."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Test get_metrics tool
-                payload = {"name": "get_metrics", "arguments": {}}
-
-                response = await client.post(
-                    f"{TEST_CONFIG['server_url']}/mcp/tools/call",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
+            # Test get_metrics tool
+            response = await self.client.post(
+                TOOLS_URL,
+                content=tool_call_body("get_metrics"),
+                headers=JSON_HEADERS,
+            )
+
+            self.log_test(
+                "MCP Tool Execution",
+                response.status_code == 200,
+                f"get_metrics status: {response.status_code}",
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                if isinstance(result, str):
+                    metrics_data = json.loads(result)
+                else:
+                    metrics_data = result
 
                 self.log_test(
-                    "MCP Tool Execution",
-                    response.status_code == 200,
-                    f"get_metrics status: {response.status_code}",
+                    "Metrics Tool Response",
+                    "requests" in metrics_data,
+                    f"Response keys: {list(metrics_data.keys()) if isinstance(metrics_data, dict) else 'Not dict'}",
                 )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    if isinstance(result, str):
-                        metrics_data = json.loads(result)
-                    else:
-                        metrics_data = result
-
-                    self.log_test(
-                        "Metrics Tool Response",
-                        "requests" in metrics_data,
-                        f"Response keys: {list(metrics_data.keys()) if isinstance(metrics_data, dict) else 'Not dict'}",
-                    )
-
         except Exception as e:
             self.log_test("MCP Tools", False, str(e))
 
+    async def _scrape_prom(self) -> Tuple[int, FrozenSet[str]]:
+        """
+        Scrape the Prometheus exporter for the expected metric names.
+
+        The body is streamed and scanning stops once every name has been seen.
+        Every call scrapes afresh, so checks after the load see its metrics.
+
+        Returns:
+            Response status code and the expected metric names found
+        """
+        found = set()
+        async with self.client.stream("GET", METRICS_URL) as response:
+            if response.status_code == 200:
+                tail = ""
+                async for chunk in response.aiter_text():
+                    window = tail + chunk
+                    found.update(EXPECTED_PROM_METRICS_RE.findall(window))
+                    if found == EXPECTED_PROM_METRICS:
+                        break
+                    tail = window[-PROM_CHUNK_OVERLAP:]
+
+        return response.status_code, frozenset(found)
+
     async def test_prometheus_metrics(self):
         """Test Prometheus metrics endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{TEST_CONFIG['prometheus_url']}/metrics")
+            status_code, found_metrics = await self._scrape_prom()
+
+            self.log_test(
+                "Prometheus Endpoint",
+                status_code == 200,
+                f"Status: {status_code}",
+            )
 
+            if status_code == 200:
+                # Check for key metrics
                 self.log_test(
-                    "Prometheus Endpoint",
-                    response.status_code == 200,
-                    f"Status: {response.status_code}",
+                    "Prometheus Metrics Content",
+                    len(found_metrics) > 0,
+                    f"Found {len(found_metrics)}/{len(EXPECTED_PROM_METRICS)} expected metrics",
                 )
 
-                if response.status_code == 200:
-                    metrics_text = response.text
-
-                    # Check for key metrics
-                    expected_metrics = [
-                        "fastmcp_requests_total",
-                        "fastmcp_request_duration_seconds",
-                        "fastmcp_uptime_seconds",
-                    ]
-
-                    found_metrics = [m for m in expected_metrics if m in metrics_text]
-
-                    self.log_test(
-                        "Prometheus Metrics Content",
-                        len(found_metrics) > 0,
-                        f"Found {len(found_metrics)}/{len(expected_metrics)} expected metrics",
-                    )
-
         except Exception as e:
             self.log_test("Prometheus Metrics", False, str(e))
 
     async def test_load_generation(self):
         """Generate load to test metrics collection."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Generate multiple requests
-                tasks = []
-                for i in range(TEST_CONFIG["test_requests"]):
-                    payload = {"name": "get_health_status", "arguments": {}}
-
-                    task = client.post(
-                        f"{TEST_CONFIG['server_url']}/mcp/tools/call",
-                        json=payload,
-                        headers={"Content-Type": "application/json"},
+            client = self.client
+
+            # Every request sends the same body, so serialize it once
+            body = tool_call_body("get_health_status")
+            # Bound in-flight requests so each slot reuses a pooled connection
+            semaphore = asyncio.Semaphore(TEST_CONFIG["load_concurrency"])
+
+            async def send_request():
+                async with semaphore:
+                    return await client.post(
+                        TOOLS_URL,
+                        content=body,
+                        headers=JSON_HEADERS,
+                        timeout=30.0,
                     )
-                    tasks.append(task)
-
-                # Execute requests concurrently
-                start_time = time.time()
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-                duration = time.time() - start_time
-
-                # Count successful responses
-                successful = sum(
-                    1
-                    for r in responses
-                    if hasattr(r, "status_code") and r.status_code == 200
-                )
 
-                self.log_test(
-                    "Load Generation",
-                    successful > 0,
-                    f"{successful}/{len(responses)} successful requests in {duration:.2f}s",
-                )
+            # Execute requests concurrently
+            start_time = time.perf_counter()
+            responses = await asyncio.gather(
+                *(send_request() for _ in range(TEST_CONFIG["test_requests"])),
+                return_exceptions=True,
+            )
+            duration = time.perf_counter() - start_time
 
-                # Wait a moment for metrics to be collected
-                await asyncio.sleep(2)
+            # Count successful responses
+            successful = sum(
+                1
+                for r in responses
+                if not isinstance(r, BaseException) and r.status_code == 200
+            )
+
+            self.log_test(
+                "Load Generation",
+                successful > 0,
+                f"{successful}/{len(responses)} successful requests in {duration:.2f}s",
+            )
 
-                # Check if metrics reflect the load
-                response = await client.get(f"{TEST_CONFIG['prometheus_url']}/metrics")
-                if response.status_code == 200:
-                    metrics_text = response.text
+            # Wait a moment for metrics to be collected
+            await asyncio.sleep(2)
 
-                    # Look for request count metrics
-                    has_request_metrics = "fastmcp_requests_total" in metrics_text
+            # Check if metrics reflect the load
+            status_code, found_metrics = await self._scrape_prom()
+            if status_code == 200:
+                # Look for request count metrics
+                has_request_metrics = "fastmcp_requests_total" in found_metrics
 
-                    self.log_test(
-                        "Metrics Collection Under Load",
-                        has_request_metrics,
-                        "Request metrics found after load generation",
-                    )
+                self.log_test(
+                    "Metrics Collection Under Load",
+                    has_request_metrics,
+                    "Request metrics found after load generation",
+                )
 
         except Exception as e:
             self.log_test("Load Generation", False, str(e))
@@ -292,14 +371,27 @@ class OTELIntegrationTester:
         print("🚀 Starting OTEL Integration Tests")
         print("=" * 50)
 
-        # Run tests in order
-        await self.test_otel_initialization()
-        await self.test_hybrid_metrics()
-        await self.test_tracing_utilities()
-        await self.test_server_health()
-        await self.test_mcp_tools()
-        await self.test_prometheus_metrics()
-        await self.test_load_generation()
+        owns_client = self.client is None
+        if owns_client:
+            self.client = create_http_client()
+
+        # Independent checks run concurrently; log_test never awaits, so
+        # result counts cannot interleave
+        try:
+            # Metrics and tracers pick up the providers set up here
+            await self.test_otel_initialization()
+            await asyncio.gather(
+                self.test_hybrid_metrics(),
+                self.test_tracing_utilities(),
+                self.test_server_health(),
+            )
+            await asyncio.gather(self.test_mcp_tools(), self.test_prometheus_metrics())
+            # Last, since it checks metrics accumulated by everything before it
+            await self.test_load_generation()
+        finally:
+            if owns_client:
+                await self.client.aclose()
+                self.client = None
 
         # Print summary
         print("\n" + "=" * 50)
@@ -335,25 +427,25 @@ async def main():
     print("BMC AMI DevX Code Pipeline FastMCP Server")
     print()
 
-    # Check if server is running
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{TEST_CONFIG['server_url']}/health")
+    async with create_http_client() as client:
+        # Check if server is running
+        try:
+            response = await client.get(HEALTH_URL, timeout=5.0)
             if response.status_code != 200:
                 print(
                     "❌ FastMCP server is not responding. Please start the server first:"
                 )
                 print("   python main.py")
                 return 1
-    except Exception as e:
-        print(f"❌ Cannot connect to FastMCP server at {TEST_CONFIG['server_url']}")
-        print("   Please ensure the server is running: python main.py")
-        print(f"   Error: {e}")
-        return 1
-
-    # Run tests
-    tester = OTELIntegrationTester()
-    return await tester.run_all_tests()
+        except Exception as e:
+            print(f"❌ Cannot connect to FastMCP server at {SERVER_URL}")
+            print("   Please ensure the server is running: python main.py")
+            print(f"   Error: {e}")
+            return 1
+
+        # Run tests on the connection the preflight check already opened
+        tester = OTELIntegrationTester(client)
+        return await tester.run_all_tests()
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ import time
 from contextlib import asynccontextmanager
 from typing import Any, Callable, Dict, Optional, Union
 
+import httpx
 from fastmcp import Context
 from fastmcp.server.elicitation import (
     AcceptedElicitation,
@@ -26,6 +27,9 @@ from ..config.otel_config import get_tracer, is_tracing_enabled
 
 logger = logging.getLogger(__name__)
 
+# Tool argument names whose values are never copied onto spans
+_SENSITIVE_ARGUMENT_NAMES = frozenset({"password", "token", "secret", "key", "auth"})
+
 
 class FastMCPTracer:
     """FastMCP-specific tracing utilities."""
@@ -69,12 +73,9 @@ class FastMCPTracer:
 
             # Add argument details (sanitized for privacy)
             for key, value in arguments.items():
-                if key.lower() not in ["password", "token", "secret", "key", "auth"]:
+                if key.lower() not in _SENSITIVE_ARGUMENT_NAMES:
                     # Truncate long values
-                    str_value = (
-                        str(value)[:100] if len(str(value)) > 100 else str(value)
-                    )
-                    span.set_attribute(f"mcp.arg.{key}", str_value)
+                    span.set_attribute(f"mcp.arg.{key}", str(value)[:100])
 
             yield span
             span.set_status(Status(StatusCode.OK))
@@ -423,19 +424,27 @@ async def trace_tool_execution(
             # Record success metrics
             duration = time.time() - start_time
             if span:
-                span.set_attribute("mcp.execution.duration", duration)
-                span.set_attribute("mcp.execution.success", True)
-                span.set_attribute("mcp.result.type", type(result).__name__)
+                span.set_attributes(
+                    {
+                        "mcp.execution.duration": duration,
+                        "mcp.execution.success": True,
+                        "mcp.result.type": type(result).__name__,
+                    }
+                )
 
             return result
 
         except Exception as e:
             duration = time.time() - start_time
             if span:
-                span.set_attribute("mcp.execution.duration", duration)
-                span.set_attribute("mcp.execution.success", False)
-                span.set_attribute("mcp.execution.error", str(e))
-                span.set_attribute("mcp.execution.error_type", type(e).__name__)
+                span.set_attributes(
+                    {
+                        "mcp.execution.duration": duration,
+                        "mcp.execution.success": False,
+                        "mcp.execution.error": str(e),
+                        "mcp.execution.error_type": type(e).__name__,
+                    }
+                )
             raise
 
 
@@ -457,21 +466,27 @@ def trace_bmc_operation(operation: str):
 
                     # Add success attributes
                     if span:
-                        span.set_attribute("bmc.operation.success", True)
+                        attributes = {"bmc.operation.success": True}
                         if hasattr(result, "status_code"):
-                            span.set_attribute("http.status_code", result.status_code)
+                            attributes["http.status_code"] = result.status_code
+                        # Content-Length is known without reading the body, so
+                        # streamed responses are sized too
+                        if isinstance(result, httpx.Response):
+                            size = result.headers.get("content-length", "")
+                            if size.isdigit():
+                                attributes["http.response_size"] = int(size)
+                        span.set_attributes(attributes)
 
                     return result
 
                 except Exception as e:
                     if span:
-                        span.set_attribute("bmc.operation.success", False)
+                        attributes = {"bmc.operation.success": False}
                         if hasattr(e, "response") and hasattr(
                             e.response, "status_code"
                         ):
-                            span.set_attribute(
-                                "http.status_code", e.response.status_code
-                            )
+                            attributes["http.status_code"] = e.response.status_code
+                        span.set_attributes(attributes)
                     raise
 
         return wrapper
@@ -5,15 +5,22 @@ Combining FastMCP Best Practices with Enterprise Features
 """
 
 import asyncio
-import json
+import functools
+import logging
 import os
+import queue
+import time
 from collections import deque
+from contextlib import suppress
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import anyio
 import httpx
+import orjson
 from fastmcp import Context, FastMCP
 from fastmcp.server.auth.providers.github import GitHubProvider
 from fastmcp.server.auth.providers.google import GoogleProvider
@@ -21,7 +28,9 @@ from fastmcp.server.auth.providers.jwt import JWTVerifier
 from fastmcp.server.auth.providers.workos import WorkOSProvider
 from fastmcp.server.elicitation import DeclinedElicitation
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+logger = logging.getLogger(__name__)
 
 # Import advanced components from lib package and observability
 try:
@@ -31,16 +40,51 @@ try:
         HealthChecker,
         IntelligentCache,
         RateLimiter,
-        Settings,
         create_auth_provider,
+        get_settings,
         initialize_metrics,
     )
+    from lib.clients import _decode_json
     from observability import initialize_otel
 
     ADVANCED_FEATURES_AVAILABLE = True
 except ImportError as e:
-    print(f"Advanced features not available: {e}")
+    logger.warning(f"Advanced features not available: {e}")
     ADVANCED_FEATURES_AVAILABLE = False
+    # Without lib, response bodies are parsed by httpx itself
+    _decode_json = httpx.Response.json
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep idle pooled connections long enough to stay warm between tool bursts
+KEEPALIVE_EXPIRY_SECONDS = 120.0
+# Fail fast when the API host is unreachable; the read timeout stays configurable
+CONNECT_TIMEOUT_SECONDS = 5.0
+# Retry policy for the resource fetches and recovery status, read once at import
+MAX_RETRY_ATTEMPTS = int(os.getenv("MAX_RETRY_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "1.0"))
+
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as compact JSON."""
+    # default=str keeps odd API values (Decimal, custom types) from failing a tool
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in a single C-level pass."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
 
 
 class SimpleRateLimiter:
@@ -50,32 +94,49 @@ class SimpleRateLimiter:
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
         self.tokens = burst_size
-        self.last_refill = datetime.now()
-        self.lock = asyncio.Lock()
+        # Monotonic refill timestamp, anchored to wall-clock time for reporting
+        self._clock_anchor = time.monotonic()
+        self._wall_anchor = datetime.now()
+        self._last_refill_ts = self._clock_anchor
+
+    @property
+    def last_refill(self) -> datetime:
+        """Wall-clock time of the last refill."""
+        return self._wall_anchor + timedelta(
+            seconds=self._last_refill_ts - self._clock_anchor
+        )
+
+    @last_refill.setter
+    def last_refill(self, value: datetime):
+        """Set the last refill time from a wall-clock datetime."""
+        self._last_refill_ts = (
+            self._clock_anchor + (value - self._wall_anchor).total_seconds()
+        )
 
     async def acquire(self) -> bool:
         """Acquire a token for making a request."""
-        async with self.lock:
-            now = datetime.now()
-            time_passed = (now - self.last_refill).total_seconds()
-
-            # Refill tokens based on time passed
-            tokens_to_add = (time_passed / 60.0) * self.requests_per_minute
-            self.tokens = min(self.burst_size, self.tokens + tokens_to_add)
-            self.last_refill = now
-
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
-                # Round to avoid floating-point precision issues
-                if abs(self.tokens - round(self.tokens)) < 1e-10:
-                    self.tokens = round(self.tokens)
-                return True
-            return False
+        # No lock needed: refill and consume run without yielding to the loop
+        now = time.monotonic()
+        time_passed = now - self._last_refill_ts
+
+        # Refill tokens based on time passed
+        tokens_to_add = (time_passed / 60.0) * self.requests_per_minute
+        self.tokens = min(self.burst_size, self.tokens + tokens_to_add)
+        self._last_refill_ts = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            # Round to avoid floating-point precision issues
+            if abs(self.tokens - round(self.tokens)) < 1e-10:
+                self.tokens = round(self.tokens)
+            return True
+        return False
 
     async def wait_for_token(self) -> None:
         """Wait until a token is available."""
         while not await self.acquire():
-            wait_time = 60.0 / self.requests_per_minute
+            # Sleep exactly long enough for the missing fraction of a token
+            wait_time = (1.0 - self.tokens) * 60.0 / self.requests_per_minute
             await asyncio.sleep(wait_time)
 
 
@@ -290,6 +351,10 @@ class SimpleCache:
         return (datetime.now() - oldest_timestamp).total_seconds()
 
 
+# Timeouts, rate limiting and transient server errors are worth retrying
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
 class SimpleErrorHandler:
     """Simplified error handling and recovery system following FastMCP patterns."""
 
@@ -320,7 +385,7 @@ class SimpleErrorHandler:
                 {
                     "error_type": "http_error",
                     "status_code": status_code,
-                    "retryable": status_code in [408, 429, 500, 502, 503, 504],
+                    "retryable": status_code in _RETRYABLE_STATUS_CODES,
                     "message": f"HTTP {status_code} error during {operation}",
                 }
             )
@@ -354,7 +419,7 @@ class SimpleErrorHandler:
             return True
         elif isinstance(error, httpx.HTTPStatusError):
             # Retry on server errors and rate limiting
-            return error.response.status_code in [408, 429, 500, 502, 503, 504]
+            return error.response.status_code in _RETRYABLE_STATUS_CODES
         elif isinstance(error, httpx.ConnectError):
             return True
         return False
@@ -440,6 +505,29 @@ def with_retry_and_error_handling(max_retries: int = 3, base_delay: float = 1.0)
     return decorator
 
 
+# Fallback provider name (AUTH_PROVIDER, lower-cased) -> builder
+_SIMPLE_AUTH_BUILDERS: Dict[str, Callable[[], Any]] = {
+    "jwt": lambda: JWTVerifier(
+        jwks_uri=os.getenv("FASTMCP_AUTH_JWKS_URI"),
+        issuer=os.getenv("FASTMCP_AUTH_ISSUER"),
+        audience=os.getenv("FASTMCP_AUTH_AUDIENCE"),
+    ),
+    "github": lambda: GitHubProvider(
+        client_id=os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_ID"),
+        client_secret=os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_SECRET"),
+    ),
+    "google": lambda: GoogleProvider(
+        client_id=os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID"),
+        client_secret=os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET"),
+    ),
+    "workos": lambda: WorkOSProvider(
+        client_id=os.getenv("FASTMCP_SERVER_AUTH_WORKOS_CLIENT_ID"),
+        client_secret=os.getenv("FASTMCP_SERVER_AUTH_WORKOS_CLIENT_SECRET"),
+        authkit_domain=os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_DOMAIN"),
+    ),
+}
+
+
 def create_auth_provider_hybrid():
     """Create authentication provider with hybrid support for advanced features."""
     if ADVANCED_FEATURES_AVAILABLE:
@@ -449,41 +537,20 @@ def create_auth_provider_hybrid():
     if not os.getenv("AUTH_ENABLED", "false").lower() == "true":
         return None
 
-    auth_provider = os.getenv("AUTH_PROVIDER", "").lower()
-
-    if auth_provider == "jwt":
-        return JWTVerifier(
-            jwks_uri=os.getenv("FASTMCP_AUTH_JWKS_URI"),
-            issuer=os.getenv("FASTMCP_AUTH_ISSUER"),
-            audience=os.getenv("FASTMCP_AUTH_AUDIENCE"),
-        )
-    elif auth_provider == "github":
-        return GitHubProvider(
-            client_id=os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_ID"),
-            client_secret=os.getenv("FASTMCP_SERVER_AUTH_GITHUB_CLIENT_SECRET"),
-        )
-    elif auth_provider == "google":
-        return GoogleProvider(
-            client_id=os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID"),
-            client_secret=os.getenv("FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET"),
-        )
-    elif auth_provider == "workos":
-        return WorkOSProvider(
-            client_id=os.getenv("FASTMCP_SERVER_AUTH_WORKOS_CLIENT_ID"),
-            client_secret=os.getenv("FASTMCP_SERVER_AUTH_WORKOS_CLIENT_SECRET"),
-            authkit_domain=os.getenv("FASTMCP_SERVER_AUTH_AUTHKIT_DOMAIN"),
-        )
-
-    return None
+    builder = _SIMPLE_AUTH_BUILDERS.get(os.getenv("AUTH_PROVIDER", "").lower())
+    return builder() if builder else None
 
 
 # Load OpenAPI specification
 openapi_spec_path = Path("config/openapi.json")
-if not openapi_spec_path.exists():
-    raise FileNotFoundError(f"OpenAPI specification not found at {openapi_spec_path}")
-
-with open(openapi_spec_path, "r") as f:
-    openapi_spec = json.load(f)
+try:
+    # Keep the file bytes so /openapi.json can serve them without re-encoding
+    openapi_spec_bytes = openapi_spec_path.read_bytes()
+except FileNotFoundError:
+    raise FileNotFoundError(
+        f"OpenAPI specification not found at {openapi_spec_path}"
+    ) from None
+openapi_spec = orjson.loads(openapi_spec_bytes)
 
 # Track server start time for uptime calculations
 start_time = datetime.now()
@@ -494,7 +561,7 @@ if ADVANCED_FEATURES_AVAILABLE:
     tracer, meter = initialize_otel()
 
     # Use advanced components from lib package
-    settings = Settings.from_env()
+    settings = get_settings()
 
     # Global hybrid metrics instance (OTEL + legacy)
     metrics = initialize_metrics()
@@ -512,8 +579,6 @@ if ADVANCED_FEATURES_AVAILABLE:
 
     # Global error handler
     error_handler = ErrorHandler(settings, metrics)
-
-    print("✅ Advanced enterprise features enabled")
 else:
     # Fallback to simple components
     settings = None
@@ -534,29 +599,55 @@ else:
     )
 
     error_handler = None
-    print("⚠️  Using simple components - advanced features not available")
 
-# Create HTTP client with connection pooling
-if ADVANCED_FEATURES_AVAILABLE and settings:
-    http_client = httpx.AsyncClient(
-        base_url=settings.api_base_url,
-        timeout=httpx.Timeout(settings.api_timeout),
+# Default request headers, built once and shared by whichever client is created
+_api_token = (settings.api_token if settings else None) or os.getenv("API_TOKEN", "")
+API_HEADERS = httpx.Headers(
+    {
+        "Authorization": f"Bearer {_api_token}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "User-Agent": "BMC-AMI-DevX-MCP-Server/2.2.0",
+    }
+)
+
+
+def _create_http_client(
+    base_url: str, timeout: float, pool_size: int
+) -> httpx.AsyncClient:
+    """Create the pooled API client; retries are left to retry_on_failure."""
+    # httpx builds its pool lazily, so the client binds to whichever loop uses it
+    transport = httpx.AsyncHTTPTransport(
+        retries=0,
+        http2=HTTP2_AVAILABLE,
         limits=httpx.Limits(
-            max_keepalive_connections=settings.connection_pool_size,
-            max_connections=settings.connection_pool_size * 2,
+            max_keepalive_connections=pool_size,
+            max_connections=pool_size * 2,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
         ),
-        headers={
-            "Authorization": (
-                f"Bearer {settings.api_token or os.getenv('API_TOKEN', '')}"
-            ),
-            "Content-Type": "application/json",
-            "User-Agent": "BMC-AMI-DevX-MCP-Server/2.2.0",
-        },
+    )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT_SECONDS),
+        transport=transport,
+        headers=API_HEADERS,
+    )
+
+
+# Create HTTP client with connection pooling
+if ADVANCED_FEATURES_AVAILABLE and settings:
+    http_client = _create_http_client(
+        settings.api_base_url, settings.api_timeout, settings.connection_pool_size
     )
 
     # Initialize advanced BMC client with monitoring, caching, and error handling
     bmc_client = BMCAMIDevXClient(
-        http_client, cache=cache, metrics=metrics, error_handler=error_handler
+        http_client,
+        cache=cache if settings.cache_enabled else None,
+        metrics=metrics,
+        error_handler=error_handler,
+        max_concurrency=settings.connection_pool_size,
+        hedge_after=settings.hedge_after_seconds if settings.hedge_enabled else None,
     )
 
     # Initialize health checker
@@ -564,25 +655,16 @@ if ADVANCED_FEATURES_AVAILABLE and settings:
 
 else:
     # Fallback HTTP client
-    http_client = httpx.AsyncClient(
-        base_url=os.getenv("API_BASE_URL", "https://devx.bmc.com/code-pipeline/api/v1"),
-        timeout=httpx.Timeout(int(os.getenv("API_TIMEOUT", "30"))),
-        limits=httpx.Limits(
-            max_keepalive_connections=int(os.getenv("CONNECTION_POOL_SIZE", "20")),
-            max_connections=int(os.getenv("CONNECTION_POOL_SIZE", "20")) * 2,
-        ),
-        headers={
-            "Authorization": (
-                f"Bearer {settings.api_token or os.getenv('API_TOKEN', '')}"
-            ),
-            "Content-Type": "application/json",
-            "User-Agent": "BMC-AMI-DevX-MCP-Server/2.2.0",
-        },
+    http_client = _create_http_client(
+        os.getenv("API_BASE_URL", "https://devx.bmc.com/code-pipeline/api/v1"),
+        int(os.getenv("API_TIMEOUT", "30")),
+        int(os.getenv("CONNECTION_POOL_SIZE", "20")),
     )
 
     bmc_client = None
     health_checker = None
 
+
 # Create main FastMCP server following best practices
 mcp = FastMCP(
     name="BMC AMI DevX Code Pipeline MCP Server",
@@ -614,13 +696,87 @@ openapi_server = FastMCP.from_openapi(
 mcp.mount(openapi_server, prefix="ispw")
 
 
+def json_tool_errors(operation: str):
+    """Return unhandled tool exceptions as a JSON error payload."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if error_handler:
+                    return _dumps(error_handler.create_error_response(e, operation))
+                return _dumps(
+                    {"error": True, "message": str(e), "operation": operation}
+                )
+
+        return wrapper
+
+    return decorator
+
+
+async def _emit(ctx: Context, event: str, **fields: Any) -> None:
+    """Send one structured log event to the client for a completed tool call."""
+    await ctx.info(_dumps({"event": event, **fields}))
+
+
+async def _acquire_tokens(count: int) -> bool:
+    """
+    Take one rate-limiter token per upstream call a tool is about to make.
+
+    Like the single-call tools, the call is refused when the bucket is already
+    empty; the rest of a multi-call batch is then paced at the configured rate.
+    """
+    if count <= 0:
+        return True
+    if not await rate_limiter.acquire():
+        if hasattr(metrics, "record_rate_limit_event"):
+            # HybridMetrics interface
+            metrics.record_rate_limit_event("limit_exceeded")
+        else:
+            # SimpleMetrics interface
+            metrics.record_rate_limit()
+        return False
+
+    for _ in range(count - 1):
+        await rate_limiter.wait_for_token()
+    return True
+
+
+def _rate_limited_response() -> str:
+    """JSON error returned when a tool call is refused by the rate limiter."""
+    return _dumps(
+        {
+            "error": True,
+            "message": "Rate limit exceeded. Please try again later.",
+            "rate_limit_info": {
+                "requests_per_minute": rate_limiter.requests_per_minute,
+                "retry_after_seconds": 60.0 / rate_limiter.requests_per_minute,
+            },
+        }
+    )
+
+
+def _oversized_batch_response(count: int) -> Optional[str]:
+    """JSON error for a bulk call larger than the connection pool, else None."""
+    if count <= settings.connection_pool_size:
+        return None
+    return _dumps(
+        {
+            "error": True,
+            "message": (
+                f"Too many items: {count} "
+                f"(maximum {settings.connection_pool_size} per call)"
+            ),
+        }
+    )
+
+
 # Add custom monitoring tools following FastMCP patterns
 @mcp.tool(tags={"monitoring", "public"})
 async def get_server_health(ctx: Context = None) -> str:
     """Get comprehensive server health status."""
-    if ctx:
-        ctx.info("Checking server health status")
-
     start_time = datetime.now()
 
     try:
@@ -676,7 +832,7 @@ async def get_server_health(ctx: Context = None) -> str:
         "version": "2.2.0",
         "bmc_api_status": bmc_status,
         "response_time_seconds": round(response_time, 3),
-        "tools_count": len(await mcp.get_tools()),
+        "tools_count": await _get_tools_count(),
         "rate_limiter": {
             "requests_per_minute": rate_limiter.requests_per_minute,
             "burst_size": rate_limiter.burst_size,
@@ -692,24 +848,34 @@ async def get_server_health(ctx: Context = None) -> str:
         },
     }
 
-    return json.dumps(health_data, indent=2)
+    if ctx:
+        await _emit(ctx, "get_server_health.done", bmc_api_status=bmc_status)
+    return _dumps(health_data)
+
+
+# Tools are all registered at import time, so the count is computed once
+_TOOLS_COUNT: Optional[int] = None
+
+
+async def _get_tools_count() -> int:
+    """Return the number of registered tools, computing it on first use."""
+    global _TOOLS_COUNT
+    if _TOOLS_COUNT is None:
+        _TOOLS_COUNT = len(await mcp.get_tools())
+    return _TOOLS_COUNT
 
 
 @mcp.tool(tags={"monitoring", "admin"})
 async def get_server_metrics(ctx: Context = None) -> str:
     """Get server performance metrics."""
     if ctx:
-        ctx.info("Retrieving server metrics")
-
-    return json.dumps(metrics.to_dict(), indent=2)
+        await _emit(ctx, "get_server_metrics.done")
+    return _dumps(metrics.to_dict())
 
 
 @mcp.tool(tags={"monitoring", "admin"})
 async def get_rate_limiter_status(ctx: Context = None) -> str:
     """Get current rate limiter status and configuration."""
-    if ctx:
-        ctx.info("Checking rate limiter status")
-
     status = {
         "configuration": {
             "requests_per_minute": rate_limiter.requests_per_minute,
@@ -737,15 +903,14 @@ async def get_rate_limiter_status(ctx: Context = None) -> str:
         },
     }
 
-    return json.dumps(status, indent=2)
+    if ctx:
+        await _emit(ctx, "get_rate_limiter_status.done")
+    return _dumps(status)
 
 
 @mcp.tool(tags={"monitoring", "admin"})
 async def get_cache_info(ctx: Context = None) -> str:
     """Get comprehensive cache information and statistics."""
-    if ctx:
-        ctx.info("Retrieving cache information")
-
     # Handle different cache types
     if hasattr(cache, "get_stats"):
         # IntelligentCache
@@ -797,24 +962,24 @@ async def get_cache_info(ctx: Context = None) -> str:
             },
         }
 
-    return json.dumps(cache_info, indent=2)
+    if ctx:
+        await _emit(ctx, "get_cache_info.done", size=cache_info.get("size"))
+    return _dumps(cache_info)
 
 
 @mcp.tool(tags={"management", "admin"})
 async def clear_cache(ctx: Context = None) -> str:
     """Clear all cache entries."""
-    if ctx:
-        ctx.info("Clearing cache")
-
     start_time = datetime.now()
 
     # Handle different cache types
     if hasattr(cache, "lock") and hasattr(cache, "access_order"):
-        # IntelligentCache
         async with cache.lock:
             cleared_count = len(cache.cache)
             cache.cache.clear()
-            cache.access_order.clear()
+            if cache.access_order is not cache.cache:
+                # SimpleCache tracks LRU order in a separate deque
+                cache.access_order.clear()
     else:
         # SimpleCache
         cleared_count = len(cache.cache)
@@ -830,15 +995,14 @@ async def clear_cache(ctx: Context = None) -> str:
         "message": f"Successfully cleared {cleared_count} cache entries",
     }
 
-    return json.dumps(result, indent=2)
+    if ctx:
+        await _emit(ctx, "clear_cache.done", cleared=cleared_count)
+    return _dumps(result)
 
 
 @mcp.tool(tags={"management", "admin"})
 async def cleanup_expired_cache(ctx: Context = None) -> str:
     """Remove expired cache entries."""
-    if ctx:
-        ctx.info("Cleaning up expired cache entries")
-
     start_time = datetime.now()
 
     # Handle both IntelligentCache and SimpleCache
@@ -861,21 +1025,20 @@ async def cleanup_expired_cache(ctx: Context = None) -> str:
         "message": f"Cleaned up {removed_count} expired cache entries",
     }
 
-    return json.dumps(result, indent=2)
+    if ctx:
+        await _emit(ctx, "cleanup_expired_cache.done", removed=removed_count)
+    return _dumps(result)
 
 
 @mcp.tool(tags={"monitoring", "admin"})
 async def get_error_recovery_status(ctx: Context = None) -> str:
     """Get error recovery and retry configuration status."""
-    if ctx:
-        ctx.info("Retrieving error recovery status")
-
     SimpleErrorHandler(metrics)
 
     status = {
         "configuration": {
-            "max_retries": int(os.getenv("MAX_RETRY_ATTEMPTS", "3")),
-            "base_delay_seconds": float(os.getenv("RETRY_BASE_DELAY", "1.0")),
+            "max_retries": MAX_RETRY_ATTEMPTS,
+            "base_delay_seconds": RETRY_BASE_DELAY,
             "retry_enabled": True,
         },
         "error_statistics": {
@@ -902,7 +1065,87 @@ async def get_error_recovery_status(ctx: Context = None) -> str:
         ],
     }
 
-    return json.dumps(status, indent=2)
+    if ctx:
+        await _emit(ctx, "get_error_recovery_status.done")
+    return _dumps(status)
+
+
+@mcp.tool(tags={"api", "public"})
+@json_tool_errors("get_assignment_details_bulk")
+async def get_assignment_details_bulk(
+    items: List[Dict[str, str]], ctx: Context = None
+) -> str:
+    """Get details for multiple assignments concurrently.
+
+    Each item must provide "srid" and "assignment_id".
+    """
+    if bmc_client is None:
+        return _dumps(
+            {"error": True, "message": "Bulk operations require advanced features"}
+        )
+
+    oversized = _oversized_batch_response(len(items))
+    if oversized:
+        return oversized
+
+    pairs = [(item["srid"], item["assignment_id"]) for item in items]
+    if not await _acquire_tokens(len(pairs)):
+        return _rate_limited_response()
+    results = await bmc_client.get_assignment_details_bulk(pairs)
+
+    if ctx:
+        await _emit(ctx, "get_assignment_details_bulk.done", count=len(results))
+    return _dumps({"count": len(results), "results": results})
+
+
+@mcp.tool(tags={"api", "public"})
+@json_tool_errors("get_assignment_overview")
+async def get_assignment_overview(
+    srid: str, assignment_id: str, ctx: Context = None
+) -> str:
+    """Get an assignment's details together with its tasks."""
+    if bmc_client is None:
+        return _dumps(
+            {"error": True, "message": "Assignment overview requires advanced features"}
+        )
+
+    # Details and tasks are two upstream calls
+    if not await _acquire_tokens(2):
+        return _rate_limited_response()
+    overview = await bmc_client.get_assignment_overview(srid, assignment_id)
+    if ctx:
+        await _emit(
+            ctx, "get_assignment_overview.done", srid=srid, assignment_id=assignment_id
+        )
+    return _dumps(overview)
+
+
+@mcp.tool(tags={"api", "public"})
+@json_tool_errors("get_release_details_bulk")
+async def get_release_details_bulk(
+    items: List[Dict[str, str]], ctx: Context = None
+) -> str:
+    """Get details for multiple releases concurrently.
+
+    Each item must provide "srid" and "release_id".
+    """
+    if bmc_client is None:
+        return _dumps(
+            {"error": True, "message": "Bulk operations require advanced features"}
+        )
+
+    oversized = _oversized_batch_response(len(items))
+    if oversized:
+        return oversized
+
+    pairs = [(item["srid"], item["release_id"]) for item in items]
+    if not await _acquire_tokens(len(pairs)):
+        return _rate_limited_response()
+    results = await bmc_client.get_release_details_bulk(pairs)
+
+    if ctx:
+        await _emit(ctx, "get_release_details_bulk.done", count=len(results))
+    return _dumps({"count": len(results), "results": results})
 
 
 # Add elicitation tool following FastMCP patterns
@@ -939,7 +1182,7 @@ async def create_assignment_interactive(ctx: Context) -> str:
             else:
                 # SimpleMetrics interface
                 metrics.record_rate_limit()
-            return json.dumps(
+            return _dumps(
                 {
                     "error": True,
                     "message": "Rate limit exceeded. Please try again later.",
@@ -947,8 +1190,7 @@ async def create_assignment_interactive(ctx: Context) -> str:
                         "requests_per_minute": rate_limiter.requests_per_minute,
                         "retry_after_seconds": 60.0 / rate_limiter.requests_per_minute,
                     },
-                },
-                indent=2,
+                }
             )
 
         # Create assignment via BMC API
@@ -958,7 +1200,7 @@ async def create_assignment_interactive(ctx: Context) -> str:
         response_time = (datetime.now() - start_time).total_seconds()
         response.raise_for_status()
 
-        result = response.json()
+        result = _decode_json(response)
         if hasattr(metrics, "record_request") and hasattr(metrics, "total_requests"):
             # HybridMetrics interface
             metrics.record_request(
@@ -971,14 +1213,13 @@ async def create_assignment_interactive(ctx: Context) -> str:
             # SimpleMetrics interface
             metrics.record_request(success=True, response_time=response_time)
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "assignment": result,
                 "message": f"Assignment '{title}' created successfully",
                 "response_time_seconds": round(response_time, 3),
-            },
-            indent=2,
+            }
         )
 
     except Exception as e:
@@ -995,13 +1236,12 @@ async def create_assignment_interactive(ctx: Context) -> str:
             # SimpleMetrics interface
             metrics.record_request(success=False, response_time=response_time)
 
-        return json.dumps(
+        return _dumps(
             {
                 "error": True,
                 "message": f"Failed to create assignment: {str(e)}",
                 "response_time_seconds": round(response_time, 3),
-            },
-            indent=2,
+            }
         )
 
 
@@ -1075,141 +1315,167 @@ async def _simple_health_check():
         }
 
 
+def json_route_errors(status_code: int = 500, **error_fields):
+    """Return unhandled route exceptions as a JSON error response."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request: Request) -> ORJSONResponse:
+            try:
+                return await func(request)
+            except Exception as e:
+                return ORJSONResponse(
+                    {**error_fields, "error": str(e)}, status_code=status_code
+                )
+
+        return wrapper
+
+    return decorator
+
+
 # Add custom health check route following FastMCP patterns
 @mcp.custom_route("/health", methods=["GET"])
-async def health_check_route(request: Request) -> JSONResponse:
+@json_route_errors(503, status="unhealthy")
+async def health_check_route(request: Request) -> ORJSONResponse:
     """Health check endpoint for load balancers."""
-    try:
-        if ADVANCED_FEATURES_AVAILABLE and health_checker:
-            # Use advanced health checker
-            health_data = await health_checker.get_health()
-            status_code = 200 if health_data.get("status") == "healthy" else 503
-        else:
-            # Use simple health check
-            health_data = await _simple_health_check()
-            status_code = 200 if health_data.get("status") == "healthy" else 503
+    if ADVANCED_FEATURES_AVAILABLE and health_checker:
+        # Use advanced health checker
+        health_data = await health_checker.get_health()
+        status_code = 200 if health_data.get("status") == "healthy" else 503
+    else:
+        # Use simple health check
+        health_data = await _simple_health_check()
+        status_code = 200 if health_data.get("status") == "healthy" else 503
 
-        return JSONResponse(health_data, status_code=status_code)
-    except Exception as e:
-        return JSONResponse({"status": "unhealthy", "error": str(e)}, status_code=503)
+    return ORJSONResponse(health_data, status_code=status_code)
+
+
+@functools.lru_cache(maxsize=1)
+def _static_status() -> Dict[str, Any]:
+    """Build the /status sections that cannot change while the process runs."""
+    return {
+        "server": {
+            "name": mcp.name,
+            "version": mcp.version,
+            "start_time": start_time.isoformat(),
+        },
+        "features": {
+            "advanced_features": ADVANCED_FEATURES_AVAILABLE,
+            "rate_limiting": True,
+            "caching": True,
+            "metrics": True,
+            "observability": ADVANCED_FEATURES_AVAILABLE,
+            "error_handling": ADVANCED_FEATURES_AVAILABLE,
+        },
+        "configuration": {
+            "api_base_url": (
+                settings.api_base_url
+                if ADVANCED_FEATURES_AVAILABLE and settings
+                else os.getenv("API_BASE_URL")
+            ),
+            "rate_limit_rpm": (
+                settings.rate_limit_requests_per_minute
+                if ADVANCED_FEATURES_AVAILABLE and settings
+                else int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
+            ),
+            "cache_max_size": (
+                settings.cache_max_size
+                if ADVANCED_FEATURES_AVAILABLE and settings
+                else int(os.getenv("CACHE_MAX_SIZE", "1000"))
+            ),
+            "cache_ttl": (
+                settings.cache_ttl_seconds
+                if ADVANCED_FEATURES_AVAILABLE and settings
+                else int(os.getenv("CACHE_TTL_SECONDS", "300"))
+            ),
+        },
+    }
 
 
 @mcp.custom_route("/status", methods=["GET"])
-async def status_route(request: Request) -> JSONResponse:
+@json_route_errors()
+async def status_route(request: Request) -> ORJSONResponse:
     """Detailed server status endpoint."""
-    try:
-        uptime = (datetime.now() - start_time).total_seconds()
-
-        status_data = {
-            "server": {
-                "name": mcp.name,
-                "version": mcp.version,
-                "uptime_seconds": round(uptime, 1),
-                "start_time": start_time.isoformat(),
-            },
-            "features": {
-                "advanced_features": ADVANCED_FEATURES_AVAILABLE,
-                "rate_limiting": True,
-                "caching": True,
-                "metrics": True,
-                "observability": ADVANCED_FEATURES_AVAILABLE,
-                "error_handling": ADVANCED_FEATURES_AVAILABLE,
-            },
-            "configuration": {
-                "api_base_url": (
-                    settings.api_base_url
-                    if ADVANCED_FEATURES_AVAILABLE and settings
-                    else os.getenv("API_BASE_URL")
-                ),
-                "rate_limit_rpm": (
-                    settings.rate_limit_requests_per_minute
-                    if ADVANCED_FEATURES_AVAILABLE and settings
-                    else int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
-                ),
-                "cache_max_size": (
-                    settings.cache_max_size
-                    if ADVANCED_FEATURES_AVAILABLE and settings
-                    else int(os.getenv("CACHE_MAX_SIZE", "1000"))
-                ),
-                "cache_ttl": (
-                    settings.cache_ttl_seconds
-                    if ADVANCED_FEATURES_AVAILABLE and settings
-                    else int(os.getenv("CACHE_TTL_SECONDS", "300"))
-                ),
-            },
-        }
+    uptime = (datetime.now() - start_time).total_seconds()
+    static_status = _static_status()
 
-        return JSONResponse(status_data)
-    except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+    status_data = {
+        **static_status,
+        "server": {**static_status["server"], "uptime_seconds": round(uptime, 1)},
+    }
+
+    return ORJSONResponse(status_data)
 
 
 @mcp.custom_route("/ready", methods=["GET"])
-async def readiness_route(request: Request) -> JSONResponse:
+@json_route_errors(503, status="not_ready")
+async def readiness_route(request: Request) -> ORJSONResponse:
     """Readiness probe endpoint for load balancers."""
-    try:
-        # Check if server is ready to accept traffic
-        ready = True
+    # Check if server is ready to accept traffic
+    ready = True
 
-        # Check rate limiter
-        if not hasattr(rate_limiter, "tokens"):
-            ready = False
+    # Check rate limiter
+    if not hasattr(rate_limiter, "tokens"):
+        ready = False
 
-        # Check if OpenAPI spec is loaded
-        if not openapi_spec:
-            ready = False
+    # Check if OpenAPI spec is loaded
+    if not openapi_spec:
+        ready = False
 
-        if ready:
-            return JSONResponse(
-                {"status": "ready", "timestamp": datetime.now().isoformat()},
-                status_code=200,
-            )
-        else:
-            return JSONResponse(
-                {"status": "not_ready", "timestamp": datetime.now().isoformat()},
-                status_code=503,
-            )
-    except Exception as e:
-        return JSONResponse({"status": "not_ready", "error": str(e)}, status_code=503)
+    if ready:
+        return ORJSONResponse(
+            {"status": "ready", "timestamp": datetime.now().isoformat()},
+            status_code=200,
+        )
+    else:
+        return ORJSONResponse(
+            {"status": "not_ready", "timestamp": datetime.now().isoformat()},
+            status_code=503,
+        )
 
 
 @mcp.custom_route("/openapi.json", methods=["GET"])
-async def openapi_spec_route(request: Request) -> JSONResponse:
+@json_route_errors()
+async def openapi_spec_route(request: Request) -> Response:
     """OpenAPI specification endpoint."""
-    try:
-        return JSONResponse(openapi_spec)
-    except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+    return Response(openapi_spec_bytes, media_type="application/json")
 
 
 @mcp.custom_route("/metrics", methods=["GET"])
-async def metrics_route(request: Request) -> JSONResponse:
+@json_route_errors()
+async def metrics_route(request: Request) -> ORJSONResponse:
     """Metrics endpoint for monitoring."""
-    try:
-        if ADVANCED_FEATURES_AVAILABLE and hasattr(metrics, "to_dict"):
-            # Use advanced metrics
-            metrics_data = metrics.to_dict()
-        else:
-            # Use simple metrics directly
-            metrics_data = (
-                metrics.to_dict()
-                if hasattr(metrics, "to_dict")
-                else {
-                    "total_requests": getattr(metrics, "total_requests", 0),
-                    "successful_requests": getattr(metrics, "successful_requests", 0),
-                    "failed_requests": getattr(metrics, "failed_requests", 0),
-                    "rate_limited_requests": getattr(
-                        metrics, "rate_limited_requests", 0
-                    ),
-                    "avg_response_time": getattr(metrics, "avg_response_time", 0.0),
-                    "cache_hits": getattr(metrics, "cache_hits", 0),
-                    "cache_misses": getattr(metrics, "cache_misses", 0),
-                }
-            )
+    if ADVANCED_FEATURES_AVAILABLE and hasattr(metrics, "to_dict"):
+        # Use advanced metrics
+        metrics_data = metrics.to_dict()
+    else:
+        # Use simple metrics directly
+        metrics_data = (
+            metrics.to_dict()
+            if hasattr(metrics, "to_dict")
+            else {
+                "total_requests": getattr(metrics, "total_requests", 0),
+                "successful_requests": getattr(metrics, "successful_requests", 0),
+                "failed_requests": getattr(metrics, "failed_requests", 0),
+                "rate_limited_requests": getattr(metrics, "rate_limited_requests", 0),
+                "avg_response_time": getattr(metrics, "avg_response_time", 0.0),
+                "cache_hits": getattr(metrics, "cache_hits", 0),
+                "cache_misses": getattr(metrics, "cache_misses", 0),
+            }
+        )
 
-        return JSONResponse(metrics_data)
-    except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+    return ORJSONResponse(metrics_data)
+
+
+@with_retry_and_error_handling(
+    max_retries=MAX_RETRY_ATTEMPTS,
+    base_delay=RETRY_BASE_DELAY,
+)
+async def _fetch_assignment(srid: str):
+    """Fetch one assignment from the API, retrying transient failures."""
+    response = await http_client.get(f"/assignments/{srid}")
+    response.raise_for_status()
+    return _decode_json(response)
 
 
 # Add resource template following FastMCP patterns with retry logic
@@ -1225,18 +1491,8 @@ async def get_assignment_resource(srid: str) -> dict:
     if not await rate_limiter.acquire():
         return {"error": f"Rate limit exceeded for assignment {srid}"}
 
-    # Define the API call function for retry logic
-    @with_retry_and_error_handling(
-        max_retries=int(os.getenv("MAX_RETRY_ATTEMPTS", "3")),
-        base_delay=float(os.getenv("RETRY_BASE_DELAY", "1.0")),
-    )
-    async def fetch_assignment():
-        response = await http_client.get(f"/assignments/{srid}")
-        response.raise_for_status()
-        return response.json()
-
     # Execute with retry logic
-    result = await fetch_assignment()
+    result = await _fetch_assignment(srid)
 
     # Handle successful response
     if isinstance(result, dict) and not result.get("error"):
@@ -1272,15 +1528,79 @@ def analyze_assignment_status(assignment_data: dict) -> str:
     """
 
 
+def _uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's loop factory when it is installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+def _configure_logging() -> QueueListener:
+    """Send log records through a queue so stream writes happen off the event loop."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(
+        (settings.log_level if settings else os.getenv("LOG_LEVEL", "INFO")).upper()
+    )
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+async def _serve():
+    """Run the HTTP server, closing the API client's pooled connections on exit."""
+    # Count the registered tools up front so health checks never have to
+    await _get_tools_count()
+
+    # FastMCP lifespans run once per MCP session, so the process-wide cache
+    # expiry loop is owned here instead
+    expiry_task = None
+    if hasattr(cache, "run_expiry_loop"):
+        interval = settings.cache_cleanup_interval if settings else 60
+        expiry_task = asyncio.create_task(cache.run_expiry_loop(interval))
+    try:
+        await mcp.run_async(
+            transport="http",
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", "8080")),
+            # FastMCP automatically uses FASTMCP_LOG_LEVEL environment variable
+            # uvicorn already prefers httptools when installed; access logging
+            # costs a log record per request, so it follows log_requests
+            uvicorn_config={"access_log": settings.log_requests if settings else True},
+        )
+    finally:
+        if expiry_task is not None:
+            expiry_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await expiry_task
+        await http_client.aclose()
+
+
 def main():
     """Main entry point for the FastMCP server."""
-    # Follow FastMCP standard server running pattern
-    mcp.run(
-        transport="http",
-        host=os.getenv("HOST", "0.0.0.0"),
-        port=int(os.getenv("PORT", "8080")),
-        # FastMCP automatically uses FASTMCP_LOG_LEVEL environment variable
-    )
+    listener = _configure_logging()
+
+    if ADVANCED_FEATURES_AVAILABLE:
+        logger.info("Advanced enterprise features enabled")
+    else:
+        logger.warning("Using simple components - advanced features not available")
+
+    try:
+        # Same as mcp.run(), but hands anyio an explicit loop factory so the
+        # server runs on uvloop without relying on the deprecated policy API
+        anyio.run(_serve, backend_options={"loop_factory": _uvloop_factory()})
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
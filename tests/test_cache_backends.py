@@ -146,6 +146,9 @@ class TestRedisBackend:
             deserialized = backend._deserialize(serialized)
             assert deserialized == test_data
 
+            # Integer keys come back as strings, matching the json module
+            assert backend._deserialize(backend._serialize({1: "one"})) == {"1": "one"}
+
     def test_redis_backend_serialization_pickle(self):
         """Test pickle serialization methods."""
         with (
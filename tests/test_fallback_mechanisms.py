@@ -10,6 +10,7 @@ import os
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import orjson
 import pytest
 
 from lib.auth import RateLimiter, create_auth_provider
@@ -118,6 +119,7 @@ class TestAdvancedFeaturesFallback:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "no_cache_test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         # Client without cache should still work
@@ -136,6 +138,7 @@ class TestAdvancedFeaturesFallback:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "no_metrics_test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         # Client without metrics should still work
@@ -153,6 +156,7 @@ class TestAdvancedFeaturesFallback:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "no_error_handler_test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         client = BMCAMIDevXClient(http_client=mock_http_client, error_handler=None)
@@ -231,6 +235,7 @@ class TestNetworkFailureFallbacks:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"cached": "data", "timestamp": "2023-01-01"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         # Make initial request to populate cache
@@ -574,6 +579,7 @@ class TestIntegrationFallbacks:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"degraded": "response"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         result = await client.make_request("GET", "/test")
@@ -599,6 +605,7 @@ class TestIntegrationFallbacks:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"cached": "response"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         # First call should hit API and cache
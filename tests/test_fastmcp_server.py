@@ -10,6 +10,7 @@ import tempfile
 import unittest.mock
 
 import httpx
+import orjson
 import pytest
 from fastmcp import Context, FastMCP
 
@@ -162,6 +163,7 @@ class TestBMCClient:
         # Mock response
         mock_response = unittest.mock.MagicMock()
         mock_response.json.return_value = {"assignments": [{"id": "ASSIGN-001"}]}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
 
@@ -177,7 +179,8 @@ class TestBMCClient:
         result = await client.get_assignments("TEST123")
 
         assert result == {"assignments": [{"id": "ASSIGN-001"}]}
-        mock_response.raise_for_status.assert_called_once()
+        # 2xx responses skip raise_for_status entirely
+        mock_response.raise_for_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_assignments_http_error(self, mock_httpx_client):
@@ -208,6 +211,7 @@ class TestBMCClient:
             "assignmentId": "ASSIGN-002",
             "status": "created",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
 
@@ -288,6 +292,7 @@ class TestBMCClient:
             "generationId": "GEN-001",
             "status": "started",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
 
@@ -319,6 +324,7 @@ class TestBMCClient:
             "promotionId": "PROM-001",
             "status": "started",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
 
@@ -472,8 +478,9 @@ class TestRateLimiting:
         result2 = await rate_limiter.acquire()
         assert result2 is False
 
-        # Skip wait_for_token test - method not implemented in current RateLimiter
-        pytest.skip("wait_for_token method not implemented in current RateLimiter")
+        # wait_for_token should block until the bucket refills, then consume
+        await rate_limiter.wait_for_token()
+        assert rate_limiter.tokens < 1
 
     @pytest.mark.asyncio
     async def test_bmc_client_rate_limiting(self):
@@ -1153,6 +1160,7 @@ class TestBMCClientComprehensive:
             "assignmentId": "ASSIGN-002",
             "status": "created",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
         mock_client_instance = unittest.mock.AsyncMock()
@@ -1326,7 +1334,7 @@ class TestMetricsComprehensive:
 
     def test_metrics_initialization(self):
         """Test Metrics class initialization."""
-        from collections import deque
+        from collections.abc import Mapping, Sequence
 
         from lib import initialize_metrics
 
@@ -1339,8 +1347,8 @@ class TestMetricsComprehensive:
         assert metrics.cache_hits == 0
         assert metrics.cache_misses == 0
         assert metrics.start_time is not None
-        assert isinstance(metrics.response_times, deque)
-        assert isinstance(metrics.endpoint_errors, dict)
+        assert isinstance(metrics.response_times, Sequence)
+        assert isinstance(metrics.endpoint_errors, Mapping)
 
     def test_metrics_update_response_time(self):
         """Test Metrics response time updates."""
@@ -1519,6 +1527,7 @@ class TestBMCClientMethodsComprehensive:
             "assignmentId": "ASSIGN-002",
             "status": "created",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
         mock_client_instance = unittest.mock.AsyncMock()
@@ -1581,6 +1590,7 @@ class TestBMCClientMethodsComprehensive:
 
         mock_response = unittest.mock.MagicMock()
         mock_response.json.return_value = {"assignments": [{"id": "ASSIGN-001"}]}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = unittest.mock.MagicMock()
         mock_response.status_code = 200
         mock_response.status_code = 200
@@ -3321,7 +3331,7 @@ class TestAuthentication:
         }
 
         with unittest.mock.patch.dict(os.environ, test_env):
-            with unittest.mock.patch("builtins.print") as mock_print:
+            with unittest.mock.patch("lib.auth.logger") as mock_logger:
                 # Create test settings instance manually
                 pass
 
@@ -3331,7 +3341,7 @@ class TestAuthentication:
                 provider = create_auth_provider()
 
                 assert provider is None
-                mock_print.assert_called()
+                mock_logger.error.assert_called()
 
     def test_google_auth_provider(self):
         """Test Google authentication provider creation."""
@@ -3620,7 +3630,7 @@ class TestConfiguration:
 
         try:
             # Test loading from the temp file
-            with unittest.mock.patch("openapi_server.Settings") as mock_settings:
+            with unittest.mock.patch("lib.settings.Settings") as mock_settings:
                 mock_settings.return_value.model_config = {"env_file": temp_env_file}
 
                 # This would normally load from the .env file
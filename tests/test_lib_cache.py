@@ -4,7 +4,10 @@ Tests for lib/cache.py to improve coverage to 80%+.
 """
 
 import asyncio
+import pickle
+import sys
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -27,6 +30,17 @@ class TestCacheEntry:
         assert entry.expires_at == now + timedelta(seconds=300)
         assert entry.created_at == now
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10"
+    )
+    def test_cache_entry_has_no_instance_dict(self):
+        """Test CacheEntry stores its fields in slots and still pickles."""
+        now = datetime.now()
+        entry = CacheEntry(value=[1, 2], expires_at=now, created_at=now)
+
+        assert not hasattr(entry, "__dict__")
+        assert pickle.loads(pickle.dumps(entry)) == entry
+
     def test_cache_entry_is_expired_false(self):
         """Test CacheEntry.is_expired when not expired."""
         now = datetime.now()
@@ -205,7 +219,6 @@ class TestIntelligentCache:
             created_at=datetime.now() - timedelta(seconds=310),
         )
         cache.cache[expired_key] = expired_entry
-        cache.access_order[expired_key] = True
 
         # Add valid entry
         valid_key = "valid_key"
@@ -215,7 +228,6 @@ class TestIntelligentCache:
             created_at=datetime.now(),
         )
         cache.cache[valid_key] = valid_entry
-        cache.access_order[valid_key] = True
 
         initial_size = len(cache.cache)
         cache.cleanup_expired()
@@ -242,6 +254,67 @@ class TestIntelligentCache:
         assert len(cache.cache) == 0
         assert len(cache.access_order) == 0
 
+    @pytest.mark.asyncio
+    async def test_access_order_tracks_cache_entries(self):
+        """Test LRU order is kept by the cache mapping itself."""
+        cache = IntelligentCache()
+
+        await cache.set("op1", "data1", direct_key=True)
+        await cache.set("op2", "data2", direct_key=True)
+        await cache.get("op1", direct_key=True)
+
+        assert cache.access_order is cache.cache
+        assert list(cache.access_order) == ["op2", "op1"]
+
+    @pytest.mark.asyncio
+    async def test_get_stale_within_window(self):
+        """Test expired entries stay readable via get_stale inside the window."""
+        cache = IntelligentCache()
+        await cache.set("op", "data", ttl=300, stale_ttl=60, key="1")
+        entry = next(iter(cache.cache.values()))
+        entry.expires_at = datetime.now() - timedelta(seconds=10)
+        entry.stale_until = datetime.now() + timedelta(seconds=50)
+
+        assert await cache.get("op", key="1") is None
+        assert await cache.get_stale("op", key="1") == "data"
+
+        cache.cleanup_expired()
+        assert len(cache.cache) == 1
+
+        entry.stale_until = datetime.now() - timedelta(seconds=1)
+        assert await cache.get_stale("op", key="1") is None
+        cache.cleanup_expired()
+        assert len(cache.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_expire_due_uses_schedule(self):
+        """Test expire_due removes due entries and skips re-set keys."""
+        cache = IntelligentCache()
+        await cache.set("short", "data", ttl=10, direct_key=True)
+        await cache.set("reset", "old", ttl=10, direct_key=True)
+        await cache.set("reset", "new", ttl=300, direct_key=True)
+
+        assert 0 < cache.seconds_until_next_expiry() <= 10
+
+        with patch("lib.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() + timedelta(seconds=20)
+            cache.expire_due()
+
+        assert "short" not in cache.cache
+        assert cache.cache["reset"].value == "new"
+        assert cache.expirations == 1
+        assert len(cache._expiry) == 1
+
+    @pytest.mark.asyncio
+    async def test_set_compacts_expiry_schedule(self):
+        """Test repeated overwrites do not grow the expiry schedule unbounded."""
+        cache = IntelligentCache()
+        for i in range(500):
+            await cache.set("key", i, direct_key=True)
+
+        assert len(cache._expiry) <= 2 * len(cache.cache) + 65
+        assert cache.seconds_until_next_expiry() is not None
+
     def test_get_stats(self):
         """Test cache statistics."""
         cache = IntelligentCache(max_size=100, default_ttl=300)
@@ -6,13 +6,22 @@ Tests BMC API client functionality including caching, metrics,
 error handling, and all ISPW operations.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import orjson
 import pytest
+from pydantic import ValidationError
 
 from lib.cache import IntelligentCache
-from lib.clients import BMCAMIDevXClient
+from lib.clients import (
+    BMCAMIDevXClient,
+    _decode_json,
+    _read_json,
+    _url,
+    _with_query,
+)
 from lib.errors import ErrorHandler
 
 
@@ -55,13 +64,14 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         result = await self.client.make_request("GET", "/test/endpoint")
 
         assert result == {"data": "test"}
         self.mock_http_client.get.assert_called_once_with("/test/endpoint")
-        mock_response.raise_for_status.assert_called_once()
+        mock_response.raise_for_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_make_request_post_success(self):
@@ -69,6 +79,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 201
         mock_response.json.return_value = {"id": "123"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         data = {"name": "test"}
@@ -83,6 +94,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"updated": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.put.return_value = mock_response
 
         data = {"name": "updated"}
@@ -97,6 +109,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 204
         mock_response.json.return_value = {}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.delete.return_value = mock_response
 
         result = await self.client.make_request("DELETE", "/test/endpoint")
@@ -136,6 +149,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         result = await self.client.make_request(
@@ -158,6 +172,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
         self.mock_metrics.record_request = Mock()
 
@@ -177,6 +192,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
         # Remove record_request to simulate legacy metrics
         delattr(self.mock_metrics, "record_request")
@@ -237,6 +253,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         result = await self.client.get_cached_or_fetch(
@@ -253,9 +270,11 @@ class TestBMCAMIDevXClient:
     async def test_get_cached_or_fetch_no_cache(self):
         """Test get_cached_or_fetch with no cache configured."""
         client = BMCAMIDevXClient(self.mock_http_client)  # No cache
+        assert client.get_cached_or_fetch == client._fetch_uncached
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         result = await client.get_cached_or_fetch("test_operation", "/test/endpoint")
@@ -272,6 +291,7 @@ class TestBMCAMIDevXClient:
             "assignmentId": "ASSIGN001",
             "status": "created",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         result = await self.client.create_assignment(
@@ -302,6 +322,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 201
         mock_response.json.return_value = {"assignmentId": "ASSIGN001"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         result = await self.client.create_assignment(
@@ -317,6 +338,16 @@ class TestBMCAMIDevXClient:
         }
         assert call_args[1]["json"] == expected_data
 
+    @pytest.mark.asyncio
+    async def test_create_assignment_rejects_empty_fields(self):
+        """Test create_assignment validates the body before calling the API."""
+        with pytest.raises(ValidationError):
+            await self.client.create_assignment(
+                srid="TEST001", assignment_id="ASSIGN001", stream="", application="APP"
+            )
+
+        self.mock_http_client.post.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_assignments_success(self):
         """Test get_assignments with successful retrieval."""
@@ -339,6 +370,7 @@ class TestBMCAMIDevXClient:
         """Test get_assignments constructs query parameters correctly."""
         # Mock cache miss to trigger actual HTTP request
         self.mock_cache.get.return_value = None
+        self.mock_cache.get_stale.return_value = None
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"assignments": []}
@@ -350,6 +382,22 @@ class TestBMCAMIDevXClient:
         # The endpoint should include query parameters (checked through cache call)
         self.mock_cache.get.assert_called_once()
 
+    def test_with_query_encodes_filters(self):
+        """Test unfiltered endpoints are returned untouched and values are encoded."""
+        assert _with_query("/x", {}) == "/x"
+        assert _with_query("/x", {"q": "a b", "level": "DEV"}) == "/x?q=a+b&level=DEV"
+
+    @pytest.mark.asyncio
+    async def test_get_assignments_drops_none_filters(self):
+        """Test None filters are left out of the cache key."""
+        self.mock_cache.get.return_value = {"assignments": []}
+
+        await self.client.get_assignments("TEST001", level=None, stream="DEV")
+
+        self.mock_cache.get.assert_called_once_with(
+            "get_assignments", srid="TEST001", stream="DEV"
+        )
+
     @pytest.mark.asyncio
     async def test_get_assignment_details_success(self):
         """Test get_assignment_details with successful retrieval."""
@@ -369,6 +417,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"taskId": "TASK001", "status": "generated"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         generate_data = {"level": "DEV", "components": ["COMP001"]}
@@ -387,6 +436,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"taskId": "TASK001"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         result = await self.client.generate_assignment("TEST001", "ASSIGN001")
@@ -402,6 +452,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"taskId": "TASK002", "status": "promoted"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         promote_data = {"level": "QA"}
@@ -420,6 +471,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 201
         mock_response.json.return_value = {"releaseId": "REL001", "status": "created"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         result = await self.client.create_release(
@@ -467,6 +519,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"taskId": "TASK003", "status": "deploying"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         deploy_data = {"environment": "PROD"}
@@ -506,6 +559,7 @@ class TestBMCAMIDevXClient:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"taskId": "TASK004", "status": "deploying"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.post.return_value = mock_response
 
         deploy_data = {"environment": "PROD"}
@@ -553,3 +607,281 @@ class TestBMCAMIDevXClient:
         self.mock_cache.get.assert_called_once_with(
             "get_package_details", srid="TEST001", package_id="PKG001"
         )
+
+    @pytest.mark.asyncio
+    async def test_get_assignment_details_bulk(self):
+        """Test get_assignment_details_bulk preserves input order."""
+        self.mock_cache.get.side_effect = [
+            {"assignmentId": "ASSIGN001"},
+            {"assignmentId": "ASSIGN002"},
+        ]
+
+        result = await self.client.get_assignment_details_bulk(
+            [("TEST001", "ASSIGN001"), ("TEST002", "ASSIGN002")]
+        )
+
+        assert result == [{"assignmentId": "ASSIGN001"}, {"assignmentId": "ASSIGN002"}]
+        assert self.mock_cache.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_assignment_overview_fetches_concurrently(self):
+        """Test assignment details and tasks are requested at the same time."""
+        client = BMCAMIDevXClient(self.mock_http_client)
+        in_flight = []
+        peak = 0
+
+        async def slow_get(endpoint):
+            nonlocal peak
+            in_flight.append(endpoint)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(endpoint)
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"endpoint": endpoint}
+            response.content = orjson.dumps(response.json.return_value)
+            return response
+
+        self.mock_http_client.get.side_effect = slow_get
+
+        result = await client.get_assignment_overview("TEST001", "ASSIGN001")
+
+        assert result == {
+            "assignment": {"endpoint": "/ispw/TEST001/assignments/ASSIGN001"},
+            "tasks": {"endpoint": "/ispw/TEST001/assignments/ASSIGN001/tasks"},
+        }
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_get_assignment_overview_cancels_sibling_on_failure(self):
+        """Test a failed details call cancels the in-flight tasks call."""
+        client = BMCAMIDevXClient(self.mock_http_client)
+        cancelled = asyncio.Event()
+
+        async def hanging_tasks(srid, assignment_id):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch.object(
+                client,
+                "get_assignment_details",
+                AsyncMock(side_effect=RuntimeError("details failed")),
+            ),
+            patch.object(client, "get_assignment_tasks", side_effect=hanging_tasks),
+        ):
+            with pytest.raises(RuntimeError, match="details failed"):
+                await client.get_assignment_overview("TEST001", "ASSIGN001")
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_get_release_details_bulk_with_failure(self):
+        """Test get_release_details_bulk converts failures to error responses."""
+        client = BMCAMIDevXClient(self.mock_http_client, max_concurrency=1)
+        ok_response = Mock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = {"releaseId": "REL001"}
+        ok_response.content = orjson.dumps(ok_response.json.return_value)
+        self.mock_http_client.get.side_effect = [ok_response, ValueError("boom")]
+
+        result = await client.get_release_details_bulk(
+            [("TEST001", "REL001"), ("TEST001", "REL002")]
+        )
+
+        assert result[0] == {"releaseId": "REL001"}
+        assert result[1]["error"] is True
+        assert result[1]["message"] == "boom"
+        assert result[1]["operation"] == "get_release_details"
+
+    @pytest.mark.asyncio
+    async def test_get_cached_or_fetch_serves_stale_and_revalidates(self):
+        """Test stale-while-revalidate returns stale data and refreshes once."""
+        self.mock_cache.get.return_value = None
+        self.mock_cache.get_stale.return_value = {"data": "stale"}
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": "fresh"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
+        self.mock_http_client.get.return_value = mock_response
+
+        first = await self.client.get_cached_or_fetch(
+            "test_operation", "/test/endpoint", {"param": "value"}, stale_ttl=60
+        )
+        second = await self.client.get_cached_or_fetch(
+            "test_operation", "/test/endpoint", {"param": "value"}, stale_ttl=60
+        )
+
+        assert first == second == {"data": "stale"}
+        assert len(self.client._revalidations) == 1
+        await asyncio.gather(*self.client._revalidations.values())
+
+        self.mock_http_client.get.assert_called_once_with("/test/endpoint")
+        self.mock_cache.set.assert_called_once_with(
+            "test_operation", {"data": "fresh"}, ttl=300, stale_ttl=60, param="value"
+        )
+        assert self.client._revalidations == {}
+
+    @pytest.mark.asyncio
+    async def test_get_cached_or_fetch_coalesces_concurrent_misses(self):
+        """Test identical concurrent cache misses share a single API request."""
+        self.mock_cache.get.return_value = None
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": "fresh"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
+
+        async def slow_get(endpoint):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        self.mock_http_client.get.side_effect = slow_get
+
+        results = await asyncio.gather(
+            *(
+                self.client.get_cached_or_fetch(
+                    "test_operation", "/test/endpoint", {"param": "value"}
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert results == [{"data": "fresh"}] * 5
+        self.mock_http_client.get.assert_called_once_with("/test/endpoint")
+        self.mock_cache.set.assert_called_once()
+        assert self.client._inflight == {}
+
+    async def test_write_invalidates_cached_reads_for_srid(self):
+        """Test a write drops cached reads for its SRID and keeps others."""
+        cache = IntelligentCache()
+        client = BMCAMIDevXClient(http_client=self.mock_http_client, cache=cache)
+        await client._store("get_releases", {"releases": []}, 300, 0, {"srid": "A"})
+        await client._store(
+            "get_release_details",
+            {"id": "R1"},
+            300,
+            0,
+            {"srid": "A", "release_id": "R1"},
+        )
+        await client._store("get_releases", {"releases": []}, 300, 0, {"srid": "B"})
+
+        with patch.object(
+            client, "make_request", new_callable=AsyncMock, return_value={"ok": True}
+        ) as mock_request:
+            result = await client.deploy_release("A", "R1")
+
+        assert result == {"ok": True}
+        mock_request.assert_awaited_once_with(
+            "POST", "/ispw/A/releases/R1/tasks/deploy", {}
+        )
+        assert await cache.get("get_releases", srid="A") is None
+        assert await cache.get("get_release_details", srid="A", release_id="R1") is None
+        assert await cache.get("get_releases", srid="B") == {"releases": []}
+        assert "A" not in client._cached_by_srid
+
+    async def test_invalidate_discards_inflight_fetch_result(self):
+        """Test a fetch running when its SRID is written to is not cached."""
+        cache = IntelligentCache()
+        client = BMCAMIDevXClient(http_client=self.mock_http_client, cache=cache)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        responses = iter([{"version": "before"}, {"version": "after"}])
+
+        async def slow_request(method, endpoint, data=None):
+            response = next(responses)
+            started.set()
+            await release.wait()
+            return response
+
+        with patch.object(client, "make_request", side_effect=slow_request):
+            stale_read = asyncio.ensure_future(
+                client.get_cached_or_fetch("get_releases", "/r", {"srid": "A"})
+            )
+            await started.wait()
+            await client.invalidate("A")
+            fresh_read = asyncio.ensure_future(
+                client.get_cached_or_fetch("get_releases", "/r", {"srid": "A"})
+            )
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await stale_read == {"version": "before"}
+            assert await fresh_read == {"version": "after"}
+
+        assert await cache.get("get_releases", srid="A") == {"version": "after"}
+        assert client._inflight == {}
+        assert client._superseded == set()
+
+    async def test_srid_index_prunes_expired_reads(self):
+        """Test the SRID index drops reads the cache no longer holds."""
+        cache = IntelligentCache(max_size=2)
+        client = BMCAMIDevXClient(http_client=self.mock_http_client, cache=cache)
+
+        for i in range(10):
+            await client._store("get_releases", {}, 300, 0, {"srid": f"S{i}"})
+
+        assert len(client._cached_by_srid) <= 2 * cache.max_size
+        assert client._indexed_reads == sum(map(len, client._cached_by_srid.values()))
+        assert "S9" in client._cached_by_srid
+
+    def test_url_templates(self):
+        """Test endpoint templates expand to the expected ISPW paths."""
+        assert _url("assignments", "SRID") == "/ispw/SRID/assignments"
+        assert (
+            _url("assignment_promote", "SRID", "A1")
+            == "/ispw/SRID/assignments/A1/tasks/promote"
+        )
+        assert _url("set_deploy", "SRID", "S1") == "/ispw/SRID/sets/S1/tasks/deploy"
+
+        # Item templates need both values rather than rendering "None"
+        with pytest.raises(TypeError):
+            _url("release", "SRID")
+
+    def test_decode_json_uses_raw_content(self):
+        """Test JSON bodies are decoded straight from the response bytes."""
+        response = httpx.Response(200, content=b'{"assignments": [{"id": "A1"}]}')
+
+        assert _decode_json(response) == {"assignments": [{"id": "A1"}]}
+
+    def test_read_json_raises_for_error_status(self):
+        """Test error statuses raise before the body is decoded."""
+        request = httpx.Request("GET", "https://api.example.com/x")
+        response = httpx.Response(404, content=b"not json", request=request)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _read_json(response)
+
+        ok = httpx.Response(200, content=b'{"ok": true}', request=request)
+        assert _read_json(ok) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_hedged_get_uses_faster_backup_request(self):
+        """Test a slow GET is raced against a backup request."""
+        delays = [1.0, 0.0]
+        started = []
+
+        async def fake_get(endpoint):
+            delay = delays[len(started)]
+            started.append(endpoint)
+            await asyncio.sleep(delay)
+            return httpx.Response(200, json={"delay": delay})
+
+        self.mock_http_client.get.side_effect = fake_get
+        client = BMCAMIDevXClient(http_client=self.mock_http_client, hedge_after=0.01)
+
+        result = await client._make_raw_request("GET", "/slow")
+
+        assert result == {"delay": 0.0}
+        assert started == ["/slow", "/slow"]
+
+    @pytest.mark.asyncio
+    async def test_hedged_get_skips_backup_for_fast_request(self):
+        """Test a GET answered before the hedge delay is sent only once."""
+        self.mock_http_client.get.return_value = httpx.Response(200, json={"ok": 1})
+        client = BMCAMIDevXClient(http_client=self.mock_http_client, hedge_after=1.0)
+
+        assert await client._make_raw_request("GET", "/fast") == {"ok": 1}
+        self.mock_http_client.get.assert_awaited_once_with("/fast")
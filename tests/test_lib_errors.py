@@ -548,6 +548,24 @@ class TestRetryOnFailureDecorator:
             with pytest.raises(httpx.TimeoutException, match="Always fails"):
                 await test_func()
 
+    @pytest.mark.asyncio
+    async def test_retry_on_failure_dropped_connection(self):
+        """Test read errors and closed keep-alive connections are retried."""
+        errors = [httpx.ReadError("reset"), httpx.RemoteProtocolError("closed")]
+
+        @retry_on_failure(max_retries=2, base_delay=0.1)
+        async def fetch_data():
+            """Fetch data."""
+            if errors:
+                raise errors.pop(0)
+            return "success"
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            assert await fetch_data() == "success"
+
+        assert fetch_data.__name__ == "fetch_data"
+        assert fetch_data.__doc__ == "Fetch data."
+
     @pytest.mark.asyncio
     async def test_retry_on_failure_http_status_retryable(self):
         """Test retry_on_failure decorator with retryable HTTP status."""
@@ -585,3 +603,39 @@ class TestRetryOnFailureDecorator:
 
         with pytest.raises(httpx.HTTPStatusError, match="Not found"):
             await test_func()
+
+    @pytest.mark.asyncio
+    async def test_retry_on_failure_backoff_capped_with_jitter(self):
+        """Test retry delays grow exponentially, stay capped and are jittered."""
+
+        @retry_on_failure(max_retries=4, base_delay=1.0, max_delay=3.0)
+        async def test_func():
+            raise httpx.TimeoutException("Always fails")
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("lib.errors.random.random", return_value=0.5),
+        ):
+            with pytest.raises(httpx.TimeoutException):
+                await test_func()
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_retry_on_failure_bmc_api_error_status(self):
+        """Test BMC API errors retry on 5xx but not on 4xx."""
+        calls = []
+
+        @retry_on_failure(max_retries=2, base_delay=0.1)
+        async def test_func(status_code):
+            calls.append(status_code)
+            raise BMCAPIError("API error", status_code=status_code)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(BMCAPIError):
+                await test_func(400)
+            with pytest.raises(BMCAPIError):
+                await test_func(503)
+
+        assert calls == [400, 503, 503, 503]
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from lib.cache import IntelligentCache
 from lib.health import HealthChecker
 from lib.settings import Settings
 
@@ -200,6 +201,21 @@ class TestHealthChecker:
         # Should be approximately 100 seconds
         assert 95 <= uptime <= 105
 
+    @pytest.mark.asyncio
+    async def test_check_components_skips_full_cache_stats(self):
+        """Test the cache component reads the hit rate without scanning entries."""
+        cache = IntelligentCache(max_size=10)
+        await cache.set("op", "value", key="k")
+        await cache.get("op", key="k")
+        self.mock_bmc_client.cache = cache
+
+        with patch.object(cache, "get_stats") as mock_get_stats:
+            components = await self.health_checker._check_components()
+
+        mock_get_stats.assert_not_called()
+        assert components["cache"]["hit_rate_percent"] == 100.0
+        assert components["cache"]["size"] == 1
+
     @pytest.mark.asyncio
     async def test_is_ready_healthy_system(self):
         """Test readiness check with healthy system."""
@@ -12,6 +12,7 @@ import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import orjson
 import pytest
 
 from lib.auth import RateLimiter, create_auth_provider
@@ -71,6 +72,7 @@ class TestComponentIntegration:
             "assignmentId": "TEST001",
             "status": "active",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status.return_value = (
             None  # No exception for successful response
         )
@@ -104,6 +106,9 @@ class TestComponentIntegration:
         mock_response_error = Mock()
         mock_response_error.status_code = 503
         mock_response_error.json.return_value = {"error": "Service unavailable"}
+        mock_response_error.content = orjson.dumps(
+            mock_response_error.json.return_value
+        )
         mock_response_error.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Service unavailable", request=Mock(), response=mock_response_error
         )
@@ -114,6 +119,9 @@ class TestComponentIntegration:
             "assignmentId": "TEST001",
             "recovered": True,
         }
+        mock_response_success.content = orjson.dumps(
+            mock_response_success.json.return_value
+        )
         mock_response_success.raise_for_status.return_value = None
 
         self.mock_http_client.get.side_effect = [
@@ -194,6 +202,7 @@ class TestComponentIntegration:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         # Make request to populate cache with short TTL
@@ -261,6 +270,7 @@ class TestComponentIntegration:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status.return_value = None
 
         # Add a small delay to simulate network latency and ensure measurable
@@ -307,6 +317,9 @@ class TestComponentIntegration:
             "assignmentId": "TEST001",
             "cached": True,
         }
+        mock_response_success.content = orjson.dumps(
+            mock_response_success.json.return_value
+        )
         self.mock_http_client.get.return_value = mock_response_success
 
         # Make initial successful request to populate cache
@@ -423,6 +436,7 @@ class TestFallbackMechanisms:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"minimal": "response"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         client = BMCAMIDevXClient(
@@ -495,6 +509,7 @@ class TestEndToEndWorkflows:
             "status": "created",
             "stream": "DEV",
         }
+        create_response.content = orjson.dumps(create_response.json.return_value)
         self.mock_http_client.post.return_value = create_response
 
         assignment = await self.client.create_assignment(
@@ -516,6 +531,7 @@ class TestEndToEndWorkflows:
             "status": "active",
             "components": ["COMP001", "COMP002"],
         }
+        details_response.content = orjson.dumps(details_response.json.return_value)
         self.mock_http_client.get.return_value = details_response
 
         details = await self.client.get_assignment_details("SRID001", "ASSIGN001")
@@ -529,6 +545,7 @@ class TestEndToEndWorkflows:
             "taskId": "TASK001",
             "status": "generating",
         }
+        generate_response.content = orjson.dumps(generate_response.json.return_value)
         self.mock_http_client.post.return_value = generate_response
 
         generate_result = await self.client.generate_assignment(
@@ -553,7 +570,11 @@ class TestEndToEndWorkflows:
                 "Service unavailable", request=Mock(), response=Mock(status_code=503)
             ),
             # Second call succeeds
-            Mock(status_code=200, json=lambda: {"recovered": True}),
+            Mock(
+                status_code=200,
+                json=lambda: {"recovered": True},
+                content=orjson.dumps({"recovered": True}),
+            ),
             # Third call fails with different error
             httpx.HTTPStatusError(
                 "Rate limited",
@@ -561,7 +582,11 @@ class TestEndToEndWorkflows:
                 response=Mock(status_code=429, headers={}),
             ),
             # Fourth call succeeds
-            Mock(status_code=200, json=lambda: {"final": "success"}),
+            Mock(
+                status_code=200,
+                json=lambda: {"final": "success"},
+                content=orjson.dumps({"final": "success"}),
+            ),
         ]
 
         self.mock_http_client.get.side_effect = responses
@@ -10,6 +10,7 @@ import os
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
+import orjson
 import pytest
 
 from lib.auth import RateLimiter, create_auth_provider
@@ -114,6 +115,7 @@ class TestSimpleIntegration:
             "assignmentId": "TEST001",
             "status": "active",
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         # Make request
@@ -233,6 +235,7 @@ class TestSimpleIntegration:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"minimal": "response"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         self.mock_http_client.get.return_value = mock_response
 
         # Should still work
@@ -260,6 +263,7 @@ class TestFallbackMechanisms:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"no_cache": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         client = BMCAMIDevXClient(http_client=mock_http_client, cache=None)
@@ -274,6 +278,7 @@ class TestFallbackMechanisms:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"no_metrics": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         client = BMCAMIDevXClient(http_client=mock_http_client, metrics=None)
@@ -288,6 +293,7 @@ class TestFallbackMechanisms:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"no_error_handler": "test"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_http_client.get.return_value = mock_response
 
         client = BMCAMIDevXClient(http_client=mock_http_client, error_handler=None)
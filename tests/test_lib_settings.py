@@ -275,6 +275,21 @@ class TestSettings:
         assert settings.host == "0.0.0.0"  # Default value
         assert settings.port == 8080  # Default value
 
+    def test_get_settings_is_cached(self):
+        """Test get_settings builds the settings once and reuses them."""
+        from lib.settings import get_settings, settings
+
+        assert get_settings() is settings
+        assert get_settings() is get_settings()
+
+    def test_settings_load_dotenv_file(self, tmp_path, monkeypatch):
+        """Test FASTMCP_ values are read from a .env file in the working directory."""
+        (tmp_path / ".env").write_text("FASTMCP_CACHE_MAX_SIZE=42\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("FASTMCP_CACHE_MAX_SIZE", raising=False)
+
+        assert Settings().cache_max_size == 42
+
     def test_pydantic_model_config(self):
         """Test Pydantic model configuration."""
         settings = Settings()
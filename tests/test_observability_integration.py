@@ -8,6 +8,7 @@ integration features including OTEL, metrics, tracing, and Prometheus.
 
 import asyncio
 import json
+import sys
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -63,6 +64,16 @@ class TestOTELInitialization:
             with pytest.raises(Exception, match="OTEL init failed"):
                 initialize_otel()
 
+    def test_otel_config_is_slotted(self):
+        """Test OTEL configuration keeps its flags in slots."""
+        from observability.config.otel_config import OTELConfig
+
+        with patch.dict("os.environ", {"OTEL_TRACING_ENABLED": "true"}):
+            config = OTELConfig()
+
+        assert config.tracing_enabled is True
+        assert not hasattr(config, "__dict__")
+
 
 class TestHybridMetrics:
     """Test hybrid metrics system."""
@@ -80,6 +91,34 @@ class TestHybridMetrics:
             assert metrics is not None
             mock_get.assert_called_once()
 
+    def test_get_metrics_creates_one_instance_across_threads(self):
+        """Test concurrent first calls to get_metrics share one instance."""
+        import threading
+
+        from observability.metrics import hybrid_metrics
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def first_call():
+            barrier.wait()
+            results.append(hybrid_metrics.get_metrics())
+
+        with (
+            patch.object(hybrid_metrics, "_metrics_instance", None),
+            patch.object(
+                hybrid_metrics, "HybridMetrics", side_effect=lambda: object()
+            ) as factory,
+        ):
+            threads = [threading.Thread(target=first_call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert factory.call_count == 1
+        assert len({id(result) for result in results}) == 1
+
     def test_metrics_recording(self):
         """Test metrics recording functionality."""
         from observability.metrics.hybrid_metrics import HybridMetrics
@@ -106,6 +145,175 @@ class TestHybridMetrics:
             # Verify no exceptions were raised
             assert True
 
+    def test_bmc_api_call_records_single_histogram(self):
+        """Test a BMC API call is one histogram record labelled by status class."""
+        from observability.metrics.hybrid_metrics import OTELMetrics
+
+        mock_meter = Mock()
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = OTELMetrics(meter=mock_meter)
+
+        otel_metrics.record_bmc_api_call("get_assignments", False, 0.3, 503)
+
+        otel_metrics.bmc_api_duration.record.assert_called_once_with(
+            0.3,
+            {"operation": "get_assignments", "success": "false", "status_class": "5xx"},
+        )
+        assert not hasattr(otel_metrics, "bmc_api_calls")
+
+    def test_disabled_otel_metrics_use_noop_recorders(self):
+        """Test disabled OTEL metrics swap their recorders for a shared no-op."""
+        from observability.metrics import hybrid_metrics
+
+        mock_meter = Mock()
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=False,
+        ):
+            otel_metrics = hybrid_metrics.OTELMetrics(meter=mock_meter)
+
+        assert otel_metrics.enabled is False
+        assert otel_metrics.record_request is hybrid_metrics._noop
+        assert otel_metrics.record_request("GET", "/test", 200, 0.1) is None
+        otel_metrics.update_cache_size(3)
+        mock_meter.create_counter.assert_not_called()
+
+    def test_elicitation_workflow_boolean_labels(self):
+        """Test boolean workflow outcomes become lowercase label strings."""
+        from observability.metrics.hybrid_metrics import OTELMetrics
+
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = OTELMetrics(meter=Mock())
+
+        otel_metrics.record_elicitation_workflow("release", True, 3, False)
+
+        otel_metrics.elicitation_workflows.add.assert_any_call(
+            1,
+            {"workflow_name": "release", "success": "true", "user_cancelled": "false"},
+        )
+
+    def test_active_requests_share_empty_labels(self):
+        """Test active request updates pass one shared empty attribute dict."""
+        from observability.metrics import hybrid_metrics
+
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = hybrid_metrics.OTELMetrics(meter=Mock())
+
+        otel_metrics.increment_active_requests()
+        otel_metrics.decrement_active_requests()
+
+        up, down = otel_metrics.active_requests.add.call_args_list
+        assert up.args == (1, {})
+        assert down.args == (-1, {})
+        assert up.args[1] is down.args[1] is hybrid_metrics._NO_LABELS
+
+    def test_cache_size_gauge_reports_latest_size(self):
+        """Test the cache size gauge observes the last size, not a running sum."""
+        from observability.metrics.hybrid_metrics import OTELMetrics
+
+        mock_meter = Mock()
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = OTELMetrics(meter=mock_meter)
+
+        otel_metrics.update_cache_size(10)
+        otel_metrics.update_cache_size(4)
+
+        (observation,) = otel_metrics._get_cache_size(None)
+        assert observation.value == 4
+        assert not mock_meter.create_up_down_counter.return_value.add.called
+
+    def test_histogram_bucket_overrides(self):
+        """Test histogram buckets come from overrides, env, or module defaults."""
+        from observability.metrics import hybrid_metrics
+
+        with patch.dict("os.environ", {"TEST_BUCKETS": "2.5,0.5,1"}):
+            assert hybrid_metrics._parse_buckets("TEST_BUCKETS", (9.0,)) == (
+                0.5,
+                1.0,
+                2.5,
+            )
+        with patch.dict("os.environ", {"TEST_BUCKETS": "fast,slow"}):
+            assert hybrid_metrics._parse_buckets("TEST_BUCKETS", (9.0,)) == (9.0,)
+
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = hybrid_metrics.OTELMetrics(
+                meter=meter,
+                histogram_bucket_overrides={
+                    "fastmcp_tool_duration_seconds": [0.1, 1.0]
+                },
+            )
+        otel_metrics.record_tool_execution("get_metrics", True, 0.5)
+        otel_metrics.record_request("GET", "/health", 200, 0.5)
+
+        boundaries = {
+            metric.name: tuple(metric.data.data_points[0].explicit_bounds)
+            for resource_metrics in reader.get_metrics_data().resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+            if metric.name.endswith("_duration_seconds")
+        }
+        assert boundaries["fastmcp_tool_duration_seconds"] == (0.1, 1.0)
+        assert (
+            boundaries["fastmcp_request_duration_seconds"]
+            == hybrid_metrics.REQUEST_DURATION_BUCKETS
+        )
+
+    def test_request_labels_are_reused(self):
+        """Test repeated requests share one precomputed label dict."""
+        from observability.metrics.hybrid_metrics import OTELMetrics
+
+        mock_meter = Mock()
+        with patch(
+            "observability.metrics.hybrid_metrics.is_metrics_enabled",
+            return_value=True,
+        ):
+            otel_metrics = OTELMetrics(meter=mock_meter)
+
+        otel_metrics.record_request("GET", "/labels", 404, 0.1)
+        otel_metrics.record_request("GET", "/labels", 404, 0.2)
+
+        first, second = otel_metrics.request_counter.add.call_args_list
+        assert first.args[1] == {
+            "method": "GET",
+            "endpoint": "/labels",
+            "status_code": "404",
+            "status_class": "4xx",
+        }
+        assert first.args[1] is second.args[1]
+
+    def test_tool_type_classification(self):
+        """Test tool names map to their metric tool types."""
+        from observability.metrics.hybrid_metrics import OTELMetrics
+
+        otel_metrics = OTELMetrics(meter=Mock())
+
+        assert otel_metrics._get_tool_type("ispw_get_assignments") == "openapi"
+        assert otel_metrics._get_tool_type("create_release_interactive") == (
+            "elicitation"
+        )
+        assert otel_metrics._get_tool_type("clear_cache") == "management"
+        assert otel_metrics._get_tool_type("something_else") == "custom"
+
     def test_legacy_format_compatibility(self):
         """Test legacy metrics format compatibility."""
         from observability.metrics.hybrid_metrics import HybridMetrics
@@ -131,6 +339,226 @@ class TestHybridMetrics:
             assert "bmc_api" in legacy_data
             assert "cache" in legacy_data
 
+    def test_record_request_updates_legacy_counters(self):
+        """Test request recording updates legacy totals and per-endpoint counts."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+
+        metrics.record_request("GET", "/a", 200, 0.1)
+        metrics.record_request("GET", "/a", 404, 0.2)
+        metrics.record_request("POST", "/b", 500, 0.3)
+
+        assert metrics.total_requests == 3
+        assert metrics.successful_requests == 1
+        assert metrics.failed_requests == 2
+        assert metrics.legacy.endpoint_counts == {"/a": 2, "/b": 1}
+        assert metrics.endpoint_errors == {"/a": 1, "/b": 1}
+        assert type(metrics.to_dict()["endpoints"]["counts"]) is dict
+
+        metrics.reset()
+        assert metrics.to_dict()["endpoints"] == {"counts": {}, "errors": {}}
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+"
+    )
+    def test_legacy_metrics_is_slotted(self):
+        """Test the legacy counters live in slots rather than a __dict__."""
+        from observability.metrics.hybrid_metrics import LegacyMetrics
+
+        assert not hasattr(LegacyMetrics(), "__dict__")
+
+    def test_legacy_attributes_forward_to_legacy_store(self):
+        """Test legacy counters read and write through to LegacyMetrics."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+
+        metrics.cache_hits += 2
+        assert metrics.legacy.cache_hits == 2
+        assert "cache_hits" not in vars(metrics)
+
+        with pytest.raises(AttributeError):
+            metrics.not_a_metric
+
+    def test_response_time_average_tracks_rolling_window(self):
+        """Test averages follow the bounded window as old samples drop out."""
+        from collections import deque
+
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.response_times = deque(maxlen=3)
+        metrics.bmc_api_response_times = deque(maxlen=2)
+
+        for value in (1.0, 2.0, 3.0, 10.0):
+            metrics.update_response_time(value)
+            metrics.update_bmc_response_time(value)
+
+        assert list(metrics.response_times) == [2.0, 3.0, 10.0]
+        assert metrics.avg_response_time == pytest.approx(5.0)
+        assert metrics.to_dict()["bmc_api"]["avg_response_time"] == pytest.approx(6.5)
+
+        metrics.reset()
+        metrics.update_response_time(4.0)
+        assert metrics.avg_response_time == pytest.approx(4.0)
+
+    def test_response_time_average_follows_direct_window_writes(self):
+        """Test the average is derived from the window rather than a running sum."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.update_response_time(1.0)
+        metrics.update_bmc_response_time(1.0)
+        metrics.legacy.response_times.append(3.0)
+        metrics.legacy.bmc_api_response_times.append(3.0)
+        metrics.update_bmc_response_time(5.0)
+
+        data = metrics.to_dict()
+        assert metrics.avg_response_time == pytest.approx(2.0)
+        assert data["response_times"]["average"] == pytest.approx(2.0)
+        assert data["response_times"]["recent_count"] == 2
+        assert data["bmc_api"]["avg_response_time"] == pytest.approx(3.0)
+
+    def test_to_dict_reports_window_percentiles(self):
+        """Test p95/p99 are reported from the recent response-time windows."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        for value in range(1, 101):
+            metrics.update_response_time(value / 100)
+            metrics.update_bmc_response_time(float(value))
+
+        data = metrics.to_dict()
+
+        assert data["response_times"]["p95"] == 0.95
+        assert data["response_times"]["p99"] == 0.99
+        assert data["bmc_api"]["p95_response_time"] == 95.0
+        assert data["bmc_api"]["p99_response_time"] == 99.0
+
+        metrics.reset()
+        assert metrics.to_dict()["bmc_api"]["p99_response_time"] == 0
+
+    def test_reset_keeps_bounded_windows(self):
+        """Test reset clears every counter without unbounding the windows."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        windows = (metrics.legacy.response_times, metrics.legacy.bmc_api_response_times)
+        metrics.record_request("GET", "/test", 500, 0.5)
+        metrics.record_bmc_api_call("op", True, 0.2)
+        metrics.record_rate_limit_event("limited")
+
+        metrics.reset()
+
+        assert metrics.legacy.response_times is windows[0]
+        assert metrics.legacy.bmc_api_response_times is windows[1]
+        assert metrics.response_times.maxlen == 1000
+        assert len(metrics.bmc_api_response_times) == 0
+        data = metrics.to_dict()
+        assert data["requests"]["rate_limited"] == 0
+        assert data["response_times"]["recent_count"] == 0
+        assert data["bmc_api"]["avg_response_time"] == 0
+
+    def test_uptime_follows_start_time_on_monotonic_clock(self):
+        """Test uptime is measured on the monotonic clock from start_time."""
+        from datetime import datetime, timedelta
+
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.start_time = datetime.now() - timedelta(seconds=100)
+
+        with patch(
+            "observability.metrics.hybrid_metrics.time.monotonic",
+            side_effect=[1000.0, 1000.0, 1005.0],
+        ):
+            first = metrics.to_dict()["system"]
+            second = metrics.to_dict()["system"]
+
+        assert first["uptime_seconds"] == pytest.approx(100.0, abs=0.5)
+        assert second["uptime_seconds"] == pytest.approx(105.0, abs=0.5)
+        assert second["start_time"] == metrics.start_time.isoformat()
+
+    def test_to_dict_reuses_snapshot_until_metrics_change(self):
+        """Test to_dict only rebuilds its sections after a metric changes."""
+        from observability.metrics.hybrid_metrics import HybridMetrics, LegacyMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.record_request("GET", "/test", 200, 0.1)
+
+        with patch.object(
+            LegacyMetrics, "to_dict", autospec=True, side_effect=LegacyMetrics.to_dict
+        ) as build:
+            first = metrics.to_dict()
+            second = metrics.to_dict()
+            assert build.call_count == 1
+            assert second["requests"] == first["requests"]
+            assert "uptime_seconds" in second["system"]
+
+            metrics.record_cache_operation("get", True)
+            assert metrics.to_dict()["cache"]["hits"] == 1
+
+            metrics.total_requests = 10
+            assert metrics.to_dict()["requests"]["total"] == 10
+
+            metrics.record_request("GET", "/test", 500, 0.2)
+            assert metrics.to_dict()["endpoints"]["errors"] == {"/test": 1}
+            assert build.call_count == 4
+
+            # Reading the windows and counters leaves the snapshot valid
+            len(metrics.response_times)
+            assert dict(metrics.endpoint_errors) == {"/test": 1}
+            metrics.to_dict()
+            assert build.call_count == 4
+
+    def test_to_dict_results_do_not_share_the_snapshot(self):
+        """Test mutating a to_dict() result never leaks into later calls."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.record_request("GET", "/test", 500, 0.1)
+
+        data = metrics.to_dict()
+        data["requests"]["poison"] = 1
+        data["endpoints"]["errors"]["/test"] = 99
+
+        again = metrics.to_dict()
+        assert "poison" not in again["requests"]
+        assert again["endpoints"]["errors"] == {"/test": 1}
+
+    def test_legacy_containers_are_read_only_views(self):
+        """Test the window and counter attributes cannot be mutated in place."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.record_request("GET", "/test", 500, 0.1)
+
+        assert list(metrics.response_times) == [0.1]
+        assert metrics.response_times.maxlen == 1000
+        assert metrics.endpoint_errors == {"/test": 1}
+        assert "/other" not in metrics.endpoint_errors
+        with pytest.raises(AttributeError):
+            metrics.response_times.append(3.0)
+        with pytest.raises(TypeError):
+            metrics.endpoint_errors["/test"] = 3
+        with pytest.raises(KeyError):
+            metrics.endpoint_errors["/other"]
+        assert "/other" not in metrics.legacy.endpoint_errors
+
+    def test_to_json_matches_stdlib_output(self):
+        """Test to_json renders the same document as the stdlib encoder."""
+        from observability.metrics.hybrid_metrics import HybridMetrics
+
+        metrics = HybridMetrics(otel_metrics=Mock())
+        metrics.record_request("GET", "/test", 200, 0.1)
+
+        with patch.object(metrics, "to_dict", return_value=metrics.to_dict()):
+            expected = metrics.to_dict()
+            assert metrics.to_json() == json.dumps(expected, indent=2)
+            assert json.loads(metrics.to_json(indent=None)) == expected
+            assert metrics.to_json(indent=4) == json.dumps(expected, indent=4)
+
     def test_metrics_error_handling(self):
         """Test metrics error handling."""
         from observability.metrics.hybrid_metrics import HybridMetrics
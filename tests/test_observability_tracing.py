@@ -8,6 +8,7 @@ including FastMCPTracer, ElicitationTracer, and convenience functions.
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 from fastmcp.server.elicitation import (
     AcceptedElicitation,
@@ -166,6 +167,28 @@ class TestFastMCPTracer:
             assert username_logged
             assert not password_logged
 
+    @pytest.mark.asyncio
+    async def test_trace_mcp_request_truncates_long_arguments(self):
+        """Test argument values are cut to 100 characters and keys match any case."""
+        mock_tracer = Mock()
+        mock_span = Mock()
+        mock_tracer.start_span.return_value = mock_span
+
+        with patch(
+            "observability.tracing.fastmcp_tracer.is_tracing_enabled", return_value=True
+        ):
+            from observability.tracing.fastmcp_tracer import FastMCPTracer
+
+            tracer = FastMCPTracer(mock_tracer)
+            arguments = {"query": "x" * 150, "Password": "hunter2"}
+
+            async with tracer.trace_mcp_request("test", "test_tool", arguments):
+                pass
+
+        mock_span.set_attribute.assert_any_call("mcp.arg.query", "x" * 100)
+        set_keys = [call.args[0] for call in mock_span.set_attribute.call_args_list]
+        assert "mcp.arg.Password" not in set_keys
+
     @pytest.mark.asyncio
     async def test_trace_mcp_request_exception(self):
         """Test MCP request tracing with exception."""
@@ -791,16 +814,13 @@ class TestConvenienceFunctions:
 
             assert result == "tool_result"
 
-            # Check that duration was set (with floating point tolerance)
-            duration_calls = [
-                call
-                for call in mock_span.set_attribute.call_args_list
-                if call[0][0] == "mcp.execution.duration"
-            ]
-            assert len(duration_calls) == 1
-            duration_value = duration_calls[0][0][1]
+            # Result attributes are written in a single bulk call
+            mock_span.set_attributes.assert_called_once()
+            attributes = mock_span.set_attributes.call_args[0][0]
+            duration_value = attributes["mcp.execution.duration"]
             assert abs(duration_value - 0.2) < 0.001  # Allow small floating point error
-            mock_span.set_attribute.assert_any_call("mcp.execution.success", True)
+            assert attributes["mcp.execution.success"] is True
+            assert attributes["mcp.result.type"] == "str"
 
     @pytest.mark.asyncio
     async def test_trace_tool_execution_no_context(self):
@@ -859,13 +879,10 @@ class TestConvenienceFunctions:
             with pytest.raises(ValueError):
                 await trace_tool_execution("failing_tool", {}, failing_tool)
 
-            mock_span.set_attribute.assert_any_call("mcp.execution.success", False)
-            mock_span.set_attribute.assert_any_call(
-                "mcp.execution.error", "Tool failed"
-            )
-            mock_span.set_attribute.assert_any_call(
-                "mcp.execution.error_type", "ValueError"
-            )
+            attributes = mock_span.set_attributes.call_args[0][0]
+            assert attributes["mcp.execution.success"] is False
+            assert attributes["mcp.execution.error"] == "Tool failed"
+            assert attributes["mcp.execution.error_type"] == "ValueError"
 
     @pytest.mark.asyncio
     async def test_trace_bmc_operation_decorator_success(self):
@@ -893,8 +910,75 @@ class TestConvenienceFunctions:
             result = await test_bmc_call(endpoint="/assignments", method="POST")
 
             assert result.status_code == 200
-            mock_span.set_attribute.assert_any_call("bmc.operation.success", True)
-            mock_span.set_attribute.assert_any_call("http.status_code", 200)
+            mock_span.set_attributes.assert_called_once_with(
+                {"bmc.operation.success": True, "http.status_code": 200}
+            )
+
+    @pytest.mark.asyncio
+    async def test_trace_bmc_operation_decorator_response_size(self):
+        """Test BMC operation decorator records the size of a read body."""
+        mock_tracer = Mock()
+        mock_span = Mock()
+
+        mock_tracer.trace_bmc_api_call.return_value = create_mock_context_manager(
+            mock_span
+        )
+
+        with patch(
+            "observability.tracing.fastmcp_tracer.get_fastmcp_tracer",
+            return_value=mock_tracer,
+        ):
+            from observability.tracing.fastmcp_tracer import trace_bmc_operation
+
+            @trace_bmc_operation("sized_operation")
+            async def sized_bmc_call():
+                return httpx.Response(200, content=b'{"ok": true}')
+
+            await sized_bmc_call()
+
+            mock_span.set_attributes.assert_called_once_with(
+                {
+                    "bmc.operation.success": True,
+                    "http.status_code": 200,
+                    "http.response_size": 12,
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_trace_bmc_operation_decorator_streamed_response_size(self):
+        """Test BMC operation decorator sizes a streamed body from its headers."""
+        mock_tracer = Mock()
+        mock_span = Mock()
+
+        mock_tracer.trace_bmc_api_call.return_value = create_mock_context_manager(
+            mock_span
+        )
+
+        async def body():
+            yield b"{}"
+
+        with patch(
+            "observability.tracing.fastmcp_tracer.get_fastmcp_tracer",
+            return_value=mock_tracer,
+        ):
+            from observability.tracing.fastmcp_tracer import trace_bmc_operation
+
+            @trace_bmc_operation("streamed_operation")
+            async def streamed_bmc_call():
+                return httpx.Response(
+                    200, headers={"Content-Length": "2"}, content=body()
+                )
+
+            response = await streamed_bmc_call()
+
+            assert not response.is_stream_consumed
+            mock_span.set_attributes.assert_called_once_with(
+                {
+                    "bmc.operation.success": True,
+                    "http.status_code": 200,
+                    "http.response_size": 2,
+                }
+            )
 
     @pytest.mark.asyncio
     async def test_trace_bmc_operation_decorator_exception(self):
@@ -924,8 +1008,9 @@ class TestConvenienceFunctions:
             with pytest.raises(Exception):
                 await failing_bmc_call(endpoint="/error", method="POST")
 
-            mock_span.set_attribute.assert_any_call("bmc.operation.success", False)
-            mock_span.set_attribute.assert_any_call("http.status_code", 500)
+            mock_span.set_attributes.assert_called_once_with(
+                {"bmc.operation.success": False, "http.status_code": 500}
+            )
 
     @pytest.mark.asyncio
     async def test_trace_bmc_operation_decorator_no_response(self):
@@ -951,8 +1036,10 @@ class TestConvenienceFunctions:
             with pytest.raises(ConnectionError):
                 await connection_error_call()
 
-            mock_span.set_attribute.assert_any_call("bmc.operation.success", False)
             # Should not set http.status_code since there's no response
+            mock_span.set_attributes.assert_called_once_with(
+                {"bmc.operation.success": False}
+            )
 
 
 class TestTracingIntegration:
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import orjson
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -752,6 +753,18 @@ class TestOpenAPIServerCoverage:
         assert data["cleared_entries"] == 1
         assert len(openapi_server.cache.cache) == 0
 
+    def test_clear_cache_emits_single_structured_event(self):
+        """Test a tool sends one structured log event after it completes."""
+        asyncio.run(openapi_server.cache.set("test_method", "test_data", param="value"))
+        mock_ctx = Mock()
+        mock_ctx.info = AsyncMock()
+
+        asyncio.run(openapi_server.clear_cache.fn(mock_ctx))
+
+        mock_ctx.info.assert_awaited_once()
+        event = json.loads(mock_ctx.info.await_args.args[0])
+        assert event == {"event": "clear_cache.done", "cleared": 1}
+
     def test_cleanup_expired_cache(self):
         """Test cleanup_expired_cache tool."""
         # Add expired entry
@@ -765,7 +778,6 @@ class TestOpenAPIServerCoverage:
             created_at=datetime.now() - timedelta(seconds=400),
         )
         openapi_server.cache.cache[expired_key] = expired_entry
-        openapi_server.cache.access_order[expired_key] = True
 
         result = asyncio.run(openapi_server.cleanup_expired_cache.fn())
         data = json.loads(result)
@@ -783,6 +795,170 @@ class TestOpenAPIServerCoverage:
         assert "retryable_error_types" in data
         assert "non_retryable_error_types" in data
 
+    def test_get_error_recovery_status_uses_import_time_retry_policy(self):
+        """Test the retry policy is read from the environment once, at import."""
+        with (
+            patch.object(openapi_server, "MAX_RETRY_ATTEMPTS", 7),
+            patch.dict(os.environ, {"MAX_RETRY_ATTEMPTS": "1"}),
+        ):
+            result = asyncio.run(openapi_server.get_error_recovery_status.fn())
+
+        assert json.loads(result)["configuration"]["max_retries"] == 7
+
+    def test_get_assignment_details_bulk(self):
+        """Test get_assignment_details_bulk tool."""
+        with patch.object(
+            openapi_server.bmc_client,
+            "get_assignment_details_bulk",
+            AsyncMock(return_value=[{"assignmentId": "ASSIGN001"}]),
+        ) as mock_bulk:
+            result = asyncio.run(
+                openapi_server.get_assignment_details_bulk.fn(
+                    [{"srid": "TEST001", "assignment_id": "ASSIGN001"}]
+                )
+            )
+
+        data = json.loads(result)
+        assert data["count"] == 1
+        assert data["results"] == [{"assignmentId": "ASSIGN001"}]
+        mock_bulk.assert_awaited_once_with([("TEST001", "ASSIGN001")])
+
+    def test_bulk_tools_take_one_token_per_item(self):
+        """Test bulk tools pace every upstream call through the rate limiter."""
+        items = [{"srid": "TEST001", "assignment_id": f"A{i}"} for i in range(3)]
+        with (
+            patch.object(
+                openapi_server.rate_limiter,
+                "acquire",
+                AsyncMock(return_value=True),
+            ) as mock_acquire,
+            patch.object(
+                openapi_server.rate_limiter, "wait_for_token", AsyncMock()
+            ) as mock_wait,
+            patch.object(
+                openapi_server.bmc_client,
+                "get_assignment_details_bulk",
+                AsyncMock(return_value=[{}, {}, {}]),
+            ),
+        ):
+            asyncio.run(openapi_server.get_assignment_details_bulk.fn(items))
+
+        assert mock_acquire.await_count == 1
+        assert mock_wait.await_count == 2
+
+    def test_bulk_tools_refused_when_rate_limited(self):
+        """Test bulk tools make no upstream calls once the bucket is empty."""
+        with (
+            patch.object(
+                openapi_server.rate_limiter,
+                "acquire",
+                AsyncMock(return_value=False),
+            ),
+            patch.object(
+                openapi_server.bmc_client, "get_release_details_bulk", AsyncMock()
+            ) as mock_bulk,
+        ):
+            result = asyncio.run(
+                openapi_server.get_release_details_bulk.fn(
+                    [{"srid": "TEST001", "release_id": "REL001"}]
+                )
+            )
+
+        data = json.loads(result)
+        assert data["error"] is True
+        assert "Rate limit exceeded" in data["message"]
+        mock_bulk.assert_not_awaited()
+
+    def test_bulk_tools_reject_oversized_batches(self):
+        """Test bulk tools cap the batch size at the connection pool size."""
+        limit = openapi_server.settings.connection_pool_size
+        items = [{"srid": "TEST001", "release_id": "REL001"}] * (limit + 1)
+        with patch.object(
+            openapi_server.bmc_client, "get_release_details_bulk", AsyncMock()
+        ) as mock_bulk:
+            result = asyncio.run(openapi_server.get_release_details_bulk.fn(items))
+
+        data = json.loads(result)
+        assert data["error"] is True
+        assert f"maximum {limit}" in data["message"]
+        mock_bulk.assert_not_awaited()
+
+    def test_get_assignment_overview(self):
+        """Test get_assignment_overview tool."""
+        overview = {"assignment": {"assignmentId": "ASSIGN001"}, "tasks": {}}
+        with patch.object(
+            openapi_server.bmc_client,
+            "get_assignment_overview",
+            AsyncMock(return_value=overview),
+        ) as mock_overview:
+            result = asyncio.run(
+                openapi_server.get_assignment_overview.fn("TEST001", "ASSIGN001")
+            )
+
+        assert json.loads(result) == overview
+        mock_overview.assert_awaited_once_with("TEST001", "ASSIGN001")
+
+    def test_get_assignment_overview_takes_two_tokens(self):
+        """Test the overview tool pays for both of its upstream calls."""
+        with (
+            patch.object(
+                openapi_server.rate_limiter,
+                "acquire",
+                AsyncMock(return_value=True),
+            ) as mock_acquire,
+            patch.object(
+                openapi_server.rate_limiter, "wait_for_token", AsyncMock()
+            ) as mock_wait,
+            patch.object(
+                openapi_server.bmc_client,
+                "get_assignment_overview",
+                AsyncMock(return_value={}),
+            ),
+        ):
+            asyncio.run(openapi_server.get_assignment_overview.fn("TEST001", "A1"))
+
+        assert mock_acquire.await_count + mock_wait.await_count == 2
+
+    def test_api_tool_errors_returned_as_json(self):
+        """Test API tool failures come back as structured JSON errors."""
+        with patch.object(
+            openapi_server.bmc_client,
+            "get_assignment_overview",
+            AsyncMock(side_effect=RuntimeError("upstream down")),
+        ):
+            result = asyncio.run(
+                openapi_server.get_assignment_overview.fn("TEST001", "ASSIGN001")
+            )
+
+        data = json.loads(result)
+        assert data["error"] is True
+        assert data["operation"] == "get_assignment_overview"
+        assert "upstream down" in data["message"]
+
+        # Malformed bulk items are reported the same way
+        data = json.loads(
+            asyncio.run(openapi_server.get_release_details_bulk.fn([{"srid": "T"}]))
+        )
+        assert data["error"] is True
+        assert data["operation"] == "get_release_details_bulk"
+
+    def test_get_release_details_bulk(self):
+        """Test get_release_details_bulk tool."""
+        with patch.object(
+            openapi_server.bmc_client,
+            "get_release_details_bulk",
+            AsyncMock(return_value=[{"releaseId": "REL001"}]),
+        ) as mock_bulk:
+            result = asyncio.run(
+                openapi_server.get_release_details_bulk.fn(
+                    [{"srid": "TEST001", "release_id": "REL001"}]
+                )
+            )
+
+        data = json.loads(result)
+        assert data["count"] == 1
+        mock_bulk.assert_awaited_once_with([("TEST001", "REL001")])
+
     def test_create_assignment_interactive_user_declined_title(self):
         """Test create_assignment_interactive with user declining title elicitation."""
         mock_ctx = Mock()
@@ -887,9 +1063,53 @@ class TestOpenAPIServerCoverage:
                 response = asyncio.run(openapi_server.health_check_route(mock_request))
 
                 assert response.status_code == 200
+                assert response.media_type == "application/json"
                 data = json.loads(response.body)
                 assert data["status"] == "healthy"
 
+    def test_dumps_falls_back_to_str(self):
+        """Test tool responses serialize values JSON has no type for."""
+        from decimal import Decimal
+
+        assert json.loads(openapi_server._dumps({"amount": Decimal("1.50")})) == {
+            "amount": "1.50"
+        }
+
+    def test_dumps_is_compact(self):
+        """Test tool responses are not pretty-printed."""
+        assert openapi_server._dumps({"items": [1, 2], "ok": True}) == (
+            '{"items":[1,2],"ok":true}'
+        )
+
+    def test_create_http_client(self):
+        """Test the API client gets a short connect timeout and a no-retry transport."""
+        client = openapi_server._create_http_client("https://api.example.com", 30, 4)
+
+        assert client.timeout.connect == openapi_server.CONNECT_TIMEOUT_SECONDS
+        assert client.timeout.read == 30
+        assert client.headers["User-Agent"] == "BMC-AMI-DevX-MCP-Server/2.2.0"
+        pool = client._transport._pool
+        assert pool._retries == 0
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 4
+        asyncio.run(client.aclose())
+
+    def test_tools_count_computed_once(self):
+        """Test the registered tool count is looked up only on first use."""
+        with (
+            patch.object(openapi_server, "_TOOLS_COUNT", None),
+            patch.object(
+                openapi_server.mcp,
+                "get_tools",
+                new_callable=AsyncMock,
+                return_value={"a": Mock(), "b": Mock()},
+            ) as mock_get_tools,
+        ):
+            assert asyncio.run(openapi_server._get_tools_count()) == 2
+            assert asyncio.run(openapi_server._get_tools_count()) == 2
+
+        mock_get_tools.assert_awaited_once()
+
     def test_health_check_route_exception(self):
         """Test health_check_route with exception."""
         mock_request = Mock()
@@ -905,6 +1125,38 @@ class TestOpenAPIServerCoverage:
             data = json.loads(response.body)
             assert data["status"] == "unhealthy"
 
+    def test_openapi_spec_route_serves_file_bytes(self):
+        """Test /openapi.json returns the spec file as loaded, without re-encoding."""
+        response = asyncio.run(openapi_server.openapi_spec_route(Mock()))
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert response.body == openapi_server.openapi_spec_bytes
+        assert json.loads(response.body) == openapi_server.openapi_spec
+
+    def test_orjson_response_renders_non_json_types(self):
+        """Test route responses handle datetimes and non-string keys."""
+        response = openapi_server.ORJSONResponse(
+            {"at": datetime(2024, 1, 2, 3, 4, 5), 200: "ok"}, status_code=201
+        )
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"at": "2024-01-02T03:04:05", "200": "ok"}
+
+    def test_status_route_reuses_static_sections(self):
+        """Test /status builds its fixed sections once and adds the live uptime."""
+        openapi_server._static_status.cache_clear()
+
+        first = json.loads(asyncio.run(openapi_server.status_route(Mock())).body)
+        second = json.loads(asyncio.run(openapi_server.status_route(Mock())).body)
+
+        assert openapi_server._static_status.cache_info().misses == 1
+        assert first["server"]["name"] == openapi_server.mcp.name
+        assert "uptime_seconds" in second["server"]
+        assert first["configuration"] == second["configuration"]
+        assert "uptime_seconds" not in openapi_server._static_status()["server"]
+
     def test_metrics_route_success(self):
         """Test metrics_route with successful metrics retrieval."""
         mock_request = Mock()
@@ -955,6 +1207,7 @@ class TestOpenAPIServerCoverage:
         """Test get_assignment_resource with successful API call."""
         mock_response = Mock()
         mock_response.json.return_value = {"assignmentId": "TEST-001"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         mock_response.raise_for_status.return_value = None
 
         with patch.object(openapi_server.rate_limiter, "acquire", return_value=True):
@@ -970,17 +1223,16 @@ class TestOpenAPIServerCoverage:
         error_result = {"error": True, "details": {"error_type": "timeout"}}
 
         with patch.object(openapi_server.rate_limiter, "acquire", return_value=True):
-            with patch(
-                "openapi_server.with_retry_and_error_handling"
-            ) as mock_decorator:
-                # Mock the decorator to return a function that returns the error result
-                async def mock_fetch():
-                    return error_result
-
-                mock_decorator.return_value = lambda func: mock_fetch
-
+            # The retry wrapper returns a structured error once retries run out
+            with patch.object(
+                openapi_server,
+                "_fetch_assignment",
+                new_callable=AsyncMock,
+                return_value=error_result,
+            ) as mock_fetch:
                 result = asyncio.run(openapi_server.get_assignment_resource.fn("TEST"))
                 assert result["error"] is True
+                mock_fetch.assert_awaited_once_with("TEST")
 
     def test_analyze_assignment_status_prompt(self):
         """Test analyze_assignment_status prompt function."""
@@ -1049,3 +1301,97 @@ class TestOpenAPIServerCoverage:
 
         # Test that MCP server is properly configured
         assert openapi_server.mcp is not None
+
+    def test_uvloop_factory_without_uvloop(self):
+        """Test the default event loop is kept when uvloop is not installed."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert openapi_server._uvloop_factory() is None
+
+    def test_uvloop_factory_with_uvloop(self):
+        """Test uvloop's loop factory is used when available."""
+        fake_uvloop = Mock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            assert openapi_server._uvloop_factory() is fake_uvloop.new_event_loop
+
+    def test_main_runs_server_with_loop_factory(self):
+        """Test main() runs the HTTP server through anyio with the loop factory."""
+        factory = Mock()
+        listener = Mock()
+        with (
+            patch.object(openapi_server, "_configure_logging", return_value=listener),
+            patch.object(openapi_server, "_uvloop_factory", return_value=factory),
+            patch.object(openapi_server.anyio, "run") as mock_run,
+        ):
+            openapi_server.main()
+
+        mock_run.assert_called_once_with(
+            openapi_server._serve, backend_options={"loop_factory": factory}
+        )
+        listener.stop.assert_called_once()
+
+    def test_serve_closes_http_client(self):
+        """Test the API client is closed when the server stops, even on error."""
+        with (
+            patch.object(
+                openapi_server.mcp,
+                "run_async",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("stopped"),
+            ) as mock_run_async,
+            patch.object(
+                openapi_server.http_client, "aclose", new_callable=AsyncMock
+            ) as mock_aclose,
+        ):
+            with pytest.raises(RuntimeError, match="stopped"):
+                asyncio.run(openapi_server._serve())
+
+        assert mock_run_async.call_args.kwargs["transport"] == "http"
+        assert mock_run_async.call_args.kwargs["uvicorn_config"] == {
+            "access_log": openapi_server.settings.log_requests
+        }
+        mock_aclose.assert_awaited_once()
+
+    def test_serve_runs_one_cache_expiry_loop(self):
+        """Test _serve owns a single cache expiry loop and cancels it on exit."""
+        started = []
+
+        async def fake_expiry_loop(interval):
+            started.append(interval)
+            await asyncio.Event().wait()
+
+        async def fake_run_async(**kwargs):
+            await asyncio.sleep(0)
+            assert len(started) == 1
+
+        with (
+            patch.object(openapi_server.mcp, "run_async", side_effect=fake_run_async),
+            patch.object(openapi_server.http_client, "aclose", new_callable=AsyncMock),
+            patch.object(
+                openapi_server.cache,
+                "run_expiry_loop",
+                side_effect=fake_expiry_loop,
+                create=True,
+            ),
+        ):
+            asyncio.run(openapi_server._serve())
+
+        assert started == [openapi_server.settings.cache_cleanup_interval]
+
+    def test_configure_logging_routes_records_through_queue(self):
+        """Test logging is routed through a queue handler with a running listener."""
+        import logging
+        from logging.handlers import QueueHandler
+
+        root_logger = logging.getLogger()
+        original_handlers = list(root_logger.handlers)
+        original_level = root_logger.level
+        listener = openapi_server._configure_logging()
+        try:
+            added = [h for h in root_logger.handlers if h not in original_handlers]
+            assert len(added) == 1
+            assert isinstance(added[0], QueueHandler)
+            assert listener._thread is not None
+        finally:
+            listener.stop()
+            root_logger.handlers = original_handlers
+            root_logger.setLevel(original_level)
@@ -5,6 +5,8 @@ Tests for lib/security.py
 Comprehensive test coverage for security module functionality.
 """
 
+from unittest.mock import Mock
+
 import pytest
 
 
@@ -253,6 +255,36 @@ class TestInputValidator:
         assert "valid" in result
         assert "errors" in result
 
+    def test_validate_string_rejects_each_pattern_category(self, validator):
+        """Test each combined pattern category still rejects its attacks."""
+        from lib.security import ValidationError
+
+        assert validator.validate_input("plain text") == "plain text"
+        for value, message in (
+            ("1 OR 1=1", "SQL injection"),
+            ("<iframe src=x>", "XSS"),
+            ("..%2e%2e%2fetc", "path traversal"),
+        ):
+            with pytest.raises(ValidationError, match=message):
+                validator.validate_input(value, "field")
+
+    def test_validate_string_skips_scans_without_trigger_characters(self, validator):
+        """Test XSS and path traversal scans only run when they could match."""
+        validator._xss_combined = Mock()
+        validator._path_combined = Mock()
+
+        assert validator.validate_input("Release 42 notes") == "Release 42 notes"
+
+        validator._xss_combined.search.assert_not_called()
+        validator._path_combined.search.assert_not_called()
+
+    def test_compiled_pattern_lists_stay_public(self, validator):
+        """Test the per-pattern compiled lists remain available to callers."""
+        assert len(validator.sql_regex) == len(validator.sql_injection_patterns)
+        assert len(validator.xss_regex) == len(validator.xss_patterns)
+        assert len(validator.path_regex) == len(validator.path_traversal_patterns)
+        assert any(pattern.search("<iframe src=x>") for pattern in validator.xss_regex)
+
 
 class TestSecurityHeaders:
     """Test cases for SecurityHeaders."""
@@ -280,6 +312,16 @@ class TestSecurityHeaders:
         """Test security headers initialization."""
         assert security_headers.config is not None
 
+    def test_security_headers_are_prebuilt(self, security_headers):
+        """Test headers are built once and handed out as independent copies."""
+        headers = security_headers.get_security_headers()
+
+        assert headers["Access-Control-Allow-Methods"] == "GET, POST"
+        assert headers["Access-Control-Allow-Origin"] == "https://example.com"
+
+        headers["X-Frame-Options"] = "SAMEORIGIN"
+        assert security_headers.get_security_headers()["X-Frame-Options"] == "DENY"
+
     @pytest.mark.asyncio
     async def test_generate_security_headers(self, security_headers):
         """Test security headers generation."""